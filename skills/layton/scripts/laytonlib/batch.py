@@ -0,0 +1,169 @@
+"""Batched command mode: `layton batch`.
+
+Reads NDJSON requests from stdin and runs each through the regular command
+handlers in this process, so a burst of calls shares one interpreter and the
+vault, config and frontmatter caches. Each request line is either an argv
+array or an object with an optional id:
+
+    ["config", "get", "timezone"]
+    {"id": "q1", "argv": ["errands", "prompt", "bd-12"]}
+
+One NDJSON line is written per request, in input order, as soon as it
+finishes. It is the usual JSON response plus the request id (the object's
+id, or the 0-based line number) and the command's exit code:
+
+    {"id": "q1", "exit_code": 0, "success": true, "data": {...}, ...}
+
+A request that writes several records (orientation --stream) gets them all,
+in order, under "records":
+
+    {"id": 3, "exit_code": 0, "success": true, "records": [{...}, ...]}
+
+Requests never read stdin (the request stream); pass errand variables as
+the json_vars argument instead.
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import traceback
+from collections.abc import Iterable, Iterator
+from typing import Any, TextIO
+
+from laytonlib.formatters import OutputFormatter, encode_json_line
+
+# Commands that cannot run inside a batch
+UNBATCHABLE_COMMANDS = {"batch", "serve"}
+
+
+def parse_request(line: str, index: int) -> tuple[Any, list[str]]:
+    """Parse one request line.
+
+    Args:
+        line: NDJSON line
+        index: 0-based position in the stream (default id)
+
+    Returns:
+        Tuple of (request id, argv)
+
+    Raises:
+        ValueError: If the line is not an argv array or {"argv": [...]} object
+    """
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON: {e}") from e
+
+    request_id = index
+    if isinstance(request, dict):
+        request_id = request.get("id", index)
+        request = request.get("argv")
+
+    if not isinstance(request, list) or not all(isinstance(a, str) for a in request):
+        raise ValueError("Request must be an argv array of strings")
+    return request_id, request
+
+
+def _error_response(code: str, message: str) -> dict[str, Any]:
+    """Build an error response in the formatter's JSON shape."""
+    return {
+        "success": False,
+        "error": {"code": code, "message": message},
+        "next_steps": [],
+    }
+
+
+@contextlib.contextmanager
+def _isolated() -> Iterator[None]:
+    """Hide the request stream from commands and keep stray prints off stdout."""
+    saved = sys.stdin
+    with open(os.devnull) as devnull, contextlib.redirect_stdout(sys.stderr):
+        sys.stdin = devnull
+        try:
+            yield
+        finally:
+            sys.stdin = saved
+
+
+def run_request(argv: list[str], verbose: bool = False) -> tuple[int, dict]:
+    """Run one batched command and capture its response.
+
+    Args:
+        argv: Command line arguments (without program name)
+        verbose: Include debug information
+
+    Returns:
+        Tuple of (exit_code, response dict). A command that writes several
+        records returns them all as {"success": ..., "records": [...]}.
+    """
+    from laytonlib.cli import _get_parser, dispatch
+
+    responses: list[dict[str, Any]] = []
+
+    with _isolated():
+        usage = io.StringIO()
+        try:
+            with contextlib.redirect_stderr(usage):
+                args = _get_parser().parse_args(argv)
+        except SystemExit:
+            lines = usage.getvalue().strip().splitlines()
+            message = lines[-1] if lines else "Invalid arguments"
+            return 2, _error_response("INVALID_ARGS", message)
+
+        if args.command in UNBATCHABLE_COMMANDS:
+            return 2, _error_response(
+                "UNSUPPORTED_COMMAND", f"'{args.command}' cannot run inside a batch"
+            )
+
+        formatter = OutputFormatter(verbose=verbose, sink=responses.append)
+        try:
+            exit_code = dispatch(args, formatter)
+        except Exception as e:  # noqa: BLE001 - one failing command must not end the batch
+            traceback.print_exc()
+            return 2, _error_response("INTERNAL_ERROR", f"{type(e).__name__}: {e}")
+
+    if not responses:
+        return exit_code, _error_response("NO_OUTPUT", "Command produced no output")
+    if len(responses) > 1:
+        return exit_code, {"success": exit_code == 0, "records": responses}
+    return exit_code, responses[0]
+
+
+def run_batch(
+    formatter: OutputFormatter,
+    lines: Iterable[str] | None = None,
+    out: TextIO | None = None,
+) -> int:
+    """Run NDJSON requests and stream one NDJSON result per request.
+
+    Args:
+        formatter: Output formatter (only its verbose flag is used)
+        lines: Request lines (defaults to stdin, read line by line)
+        out: Output stream (defaults to stdout)
+
+    Returns:
+        Highest exit code of all requests (0 if there were none)
+    """
+    lines = iter(sys.stdin.readline, "") if lines is None else lines
+    out = out or sys.stdout
+    worst = 0
+
+    for index, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            request_id, argv = parse_request(line, index)
+        except ValueError as e:
+            request_id = index
+            exit_code, response = 2, _error_response("INVALID_REQUEST", str(e))
+        else:
+            exit_code, response = run_request(argv, verbose=formatter.verbose)
+
+        worst = max(worst, exit_code)
+        result = {"id": request_id, "exit_code": exit_code, **response}
+        out.write(encode_json_line(result))
+        out.flush()
+
+    return worst
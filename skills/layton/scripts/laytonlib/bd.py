@@ -0,0 +1,113 @@
+"""Single entry point for running the bd CLI.
+
+Every bd invocation goes through run_bd() so it is recorded as a timing
+span (argv and exit code) for --timings, and, with LAYTON_TRACE=1, appended
+to the trace log .layton/trace/bd.jsonl:
+
+    {"ts": 1760000000.0, "argv": ["bd", "list", "--json"], "ms": 41.3,
+     "bytes_out": 5120, "exit_code": 0}
+
+`layton doctor --perf` aggregates the trace into latency percentiles.
+"""
+
+import contextlib
+import json
+import os
+import subprocess
+import time
+from pathlib import Path
+
+from laytonlib.config import get_layton_dir
+from laytonlib.timing import span
+
+TRACE_ENV = "LAYTON_TRACE"
+
+# The trace is rotated to bd.jsonl.1 once it grows past this size
+MAX_TRACE_BYTES = 8 * 1024 * 1024
+
+
+def tracing_enabled() -> bool:
+    """Whether bd calls are appended to the trace log (LAYTON_TRACE=1)."""
+    return os.environ.get(TRACE_ENV, "") not in ("", "0")
+
+
+def get_trace_path() -> Path:
+    """Get the bd trace log path (.layton/trace/bd.jsonl)."""
+    return get_layton_dir() / "trace" / "bd.jsonl"
+
+
+def _trace(cmd: list[str], seconds: float, stdout, exit_code: int | None) -> None:
+    """Append one bd call to the trace log (best effort, vaults only)."""
+    layton_dir = get_layton_dir()
+    if not layton_dir.is_dir():
+        return
+
+    if isinstance(stdout, str):
+        bytes_out = len(stdout.encode())
+    else:
+        bytes_out = len(stdout) if isinstance(stdout, bytes) else 0
+    record = {
+        "ts": round(time.time(), 3),
+        "argv": cmd,
+        "ms": round(seconds * 1000, 2),
+        "bytes_out": bytes_out,
+        "exit_code": exit_code,
+    }
+
+    path = get_trace_path()
+    with contextlib.suppress(OSError):
+        if not path.parent.is_dir():
+            path.parent.mkdir()
+            # Traces are local measurements, keep them out of the vault's git
+            (path.parent / ".gitignore").write_text("*\n")
+        with contextlib.suppress(FileNotFoundError):
+            if path.stat().st_size > MAX_TRACE_BYTES:
+                os.replace(path, path.with_name(path.name + ".1"))
+        # One write per record on an O_APPEND file keeps concurrent lines whole
+        with open(path, "a") as f:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def run_bd(
+    args: list[str],
+    check: bool = True,
+    **kwargs,
+) -> subprocess.CompletedProcess:
+    """Run `bd <args>` with captured text output.
+
+    Args:
+        args: Arguments after "bd"
+        check: Raise CalledProcessError on a non-zero exit
+        **kwargs: Passed through to subprocess.run (e.g. timeout, stdin)
+
+    Returns:
+        The completed process
+
+    Raises:
+        subprocess.CalledProcessError: If check and bd exits non-zero
+        subprocess.TimeoutExpired: If a timeout was given and expired
+        OSError: If bd cannot be executed
+    """
+    cmd = ["bd", *args]
+    exit_code = None
+    stdout = None
+    started = time.perf_counter()
+    with span("bd", argv=cmd) as attrs:
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                check=check,
+                **kwargs,
+            )
+            exit_code = getattr(result, "returncode", None)
+            stdout = getattr(result, "stdout", None)
+            return result
+        except subprocess.CalledProcessError as e:
+            exit_code, stdout = e.returncode, e.stdout
+            raise
+        finally:
+            attrs["exit_code"] = exit_code
+            if tracing_enabled():
+                _trace(cmd, time.perf_counter() - started, stdout, exit_code)
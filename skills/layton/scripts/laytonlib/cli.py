@@ -1,10 +1,32 @@
 """Layton CLI - argparse structure with global options."""
 
 import argparse
+import functools
 import sys
 
 from laytonlib import __version__
-from laytonlib.formatters import OutputFormatter
+from laytonlib.formatters import (
+    FORMATS,
+    OutputFormatter,
+    msgpack_available,
+    parse_format,
+)
+
+
+def _comma_list(value: str) -> list[str]:
+    """argparse type: comma-separated list of non-empty names."""
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def _non_negative_int(value: str) -> int:
+    """argparse type: integer >= 0."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0: {value}")
+    return number
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -26,6 +48,74 @@ def create_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Include debug information",
     )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="With --verbose: report wall time spans under debug.timings",
+    )
+    parser.add_argument(
+        "--format",
+        type=parse_format,
+        choices=FORMATS,
+        default="json",
+        help="Output encoding (default: json; ndjson is an alias for compact; ignored with --human)",
+    )
+
+    # Orientation output budget for the errand queue bead lists
+    parser.add_argument(
+        "--fields",
+        type=_comma_list,
+        default=None,
+        help="Bead fields to include in orientation queues (e.g. id,title,labels)",
+    )
+    parser.add_argument(
+        "--max-items",
+        type=_non_negative_int,
+        default=None,
+        help="Maximum beads per orientation queue",
+    )
+    parser.add_argument(
+        "--max-bytes",
+        type=_non_negative_int,
+        default=None,
+        help="Maximum JSON bytes per orientation queue",
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Orientation: write each section as an NDJSON record when ready",
+    )
+
+    parser.add_argument(
+        "--budget-ms",
+        type=_non_negative_int,
+        default=None,
+        help="Orientation: serve bd results not ready in time from cache (stale)",
+    )
+
+    parser.add_argument(
+        "--since",
+        metavar="TOKEN",
+        default=None,
+        help="Orientation: only inventory changes since a previous snapshot token",
+    )
+
+    # Orientation section selection
+    parser.add_argument(
+        "--only",
+        type=_comma_list,
+        default=None,
+        # Names are validated by orientation.select_sections(), which is only
+        # imported for orientation (listing them here would import it always)
+        help="Orientation sections to include (e.g. queue,protocols)",
+    )
+    parser.add_argument(
+        "--skip",
+        type=_comma_list,
+        default=None,
+        help="Orientation sections to leave out",
+    )
 
     subparsers = parser.add_subparsers(dest="command")
 
@@ -37,6 +127,16 @@ def create_parser() -> argparse.ArgumentParser:
         action="store_true",
         help=argparse.SUPPRESS,  # Hidden from help
     )
+    doctor_parser.add_argument(
+        "--perf",
+        action="store_true",
+        help="Report bd latency percentiles from the LAYTON_TRACE=1 trace log",
+    )
+    doctor_parser.add_argument(
+        "--days",
+        type=_non_negative_int,
+        help="With --perf: only include bd calls from the last N days",
+    )
 
     # config command
     config_parser = subparsers.add_parser("config", help="Manage configuration")
@@ -112,6 +212,16 @@ def create_parser() -> argparse.ArgumentParser:
         default=None,
         help="Variables as JSON (or pipe via stdin)",
     )
+    errands_schedule.add_argument(
+        "--matrix",
+        metavar="JSON",
+        help='Schedule every combination: {"var": ["a", "b"], ...}',
+    )
+    errands_schedule.add_argument(
+        "--strict",
+        action="store_true",
+        help="Fail (INVALID_VARIABLES) if variables do not match the errand",
+    )
 
     # errands epic (get/set)
     errands_epic = errands_subparsers.add_parser("epic", help="Manage epic ID")
@@ -134,6 +244,11 @@ def create_parser() -> argparse.ArgumentParser:
         default=None,
         help="Variables as JSON",
     )
+    errands_run.add_argument(
+        "--strict",
+        action="store_true",
+        help="Fail (INVALID_VARIABLES) if variables do not match the errand",
+    )
 
     # errands prompt — subagent calls this to get execution instructions
     errands_prompt = errands_subparsers.add_parser(
@@ -141,149 +256,45 @@ def create_parser() -> argparse.ArgumentParser:
     )
     errands_prompt.add_argument("bead_id", help="Bead ID")
 
-    # errands status — queue summary for intake
-    errands_subparsers.add_parser("status", help="Show queue status summary")
-
-    return parser
-
-
-def run_orientation(formatter: OutputFormatter) -> int:
-    """Run orientation - combined doctor + rolodex + protocols + errands.
-
-    Args:
-        formatter: Output formatter
-
-    Returns:
-        Exit code (0=success, 1=fixable, 2=critical)
-    """
-    from laytonlib.errands import (
-        get_beads_in_progress,
-        get_beads_pending_review,
-        get_beads_scheduled,
-        list_errands,
-    )
-    from laytonlib.doctor import (
-        check_beads_available,
-        check_beads_initialized,
-        check_config_exists,
-        check_config_valid,
+    # errands schedule-many — NDJSON {name, variables} records from stdin
+    errands_schedule_many = errands_subparsers.add_parser(
+        "schedule-many",
+        help="Schedule errands from NDJSON {name, variables} records on stdin",
     )
-    from laytonlib.rolodex import list_cards
-    from laytonlib.protocols import (
-        list_internal_examples,
-        list_internal_protocols,
-        list_internal_references,
-        list_protocols,
+    errands_schedule_many.add_argument(
+        "--strict",
+        action="store_true",
+        help="Fail records whose variables do not match the errand",
     )
 
-    # Run doctor checks
-    checks = []
-    next_steps = []
-
-    beads_check = check_beads_available()
-    checks.append(beads_check)
-
-    if beads_check.status == "fail":
-        formatter.error(
-            "BEADS_UNAVAILABLE",
-            beads_check.message,
-            next_steps=["Install Beads CLI: https://github.com/steveyegge/beads"],
-        )
-        return 2
-
-    beads_init_check = check_beads_initialized()
-    checks.append(beads_init_check)
-    if beads_init_check.status == "warn":
-        next_steps.append("Run 'bd init' to initialize Beads")
-
-    config_exists_check = check_config_exists()
-    checks.append(config_exists_check)
-
-    needs_setup = config_exists_check.status == "fail"
-
-    if config_exists_check.status == "pass":
-        config_valid_check = check_config_valid()
-        checks.append(config_valid_check)
+    # errands lint — check placeholders against declared variables
+    errands_subparsers.add_parser("lint", help="Check every errand's ${...} variables")
 
-    if needs_setup:
-        next_steps.append("Follow references/protocols/setup.md for guided onboarding")
-        next_steps.append("Or run 'layton config init' for quick setup")
-
-    # Get rolodex cards inventory
-    cards = list_cards()
-    cards_data = [{"name": c.name, "description": c.description} for c in cards]
-
-    if not cards:
-        next_steps.append("Run 'layton rolodex --discover' to find available cards")
-
-    # Get user protocols inventory
-    user_protocols = list_protocols()
-    user_protocols_data = [
-        {"name": w.name, "description": w.description, "triggers": w.triggers}
-        for w in user_protocols
-    ]
-
-    # Get internal (built-in) protocols inventory
-    internal_protocols = list_internal_protocols()
-    internal_protocols_data = [
-        {"name": w.name, "description": w.description, "triggers": w.triggers}
-        for w in internal_protocols
-    ]
-
-    if not user_protocols:
-        next_steps.append("Run 'layton protocols add <name>' to create a protocol")
-
-    # Get errands inventory
-    errands = list_errands()
-    errands_data = [
-        {"name": e.name, "description": e.description, "variables": e.variables}
-        for e in errands
-    ]
-
-    # Get errand queue states (from bd)
-    beads_scheduled = get_beads_scheduled()
-    beads_in_progress = get_beads_in_progress()
-    beads_pending_review = get_beads_pending_review()
-
-    # Get reference docs and examples
-    references = list_internal_references()
-    references_data = [r.to_dict() for r in references]
+    # errands status — queue summary for intake
+    errands_subparsers.add_parser("status", help="Show queue status summary")
 
-    examples = list_internal_examples()
-    examples_data = [e.to_dict() for e in examples]
+    # batch command — run NDJSON argv requests from stdin in one process
+    subparsers.add_parser(
+        "batch", help="Run NDJSON requests from stdin, one result line each"
+    )
 
-    # Add protocol hints based on beads status
-    if beads_pending_review:
-        next_steps.append(
-            f"{len(beads_pending_review)} bead(s) pending review - see references/protocols/review-beads.md"
-        )
+    # serve command — persistent daemon behind a Unix socket
+    serve_parser = subparsers.add_parser(
+        "serve", help="Run a persistent daemon for fast repeated calls"
+    )
+    serve_parser.add_argument(
+        "--socket",
+        default=None,
+        help="Socket path (default: $LAYTON_SOCKET or a per-user runtime socket)",
+    )
 
-    # Build output
-    data = {
-        "needs_setup": needs_setup,
-        "checks": [c.to_dict() for c in checks],
-        "rolodex": cards_data,
-        "protocols": {
-            "user": user_protocols_data,
-            "internal": internal_protocols_data,
-        },
-        "errands": {
-            "templates": errands_data,
-            "queue": {
-                "scheduled": beads_scheduled,
-                "in_progress": beads_in_progress,
-                "pending_review": beads_pending_review,
-            },
-        },
-        "references": references_data,
-        "examples": examples_data,
-    }
+    return parser
 
-    if next_steps:
-        data["next_steps"] = next_steps
 
-    formatter.success(data, next_steps=next_steps if next_steps else None)
-    return 0
+@functools.cache
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the parser once per process (reused by the daemon)."""
+    return create_parser()
 
 
 def run_rolodex(
@@ -415,21 +426,15 @@ def run_errands_status(formatter: OutputFormatter) -> int:
     Returns:
         Exit code (0=success)
     """
-    from laytonlib.errands import (
-        get_beads_in_progress,
-        get_beads_pending_review,
-        get_beads_scheduled,
-    )
+    from laytonlib.errands import get_queue_snapshot
 
-    beads_scheduled = get_beads_scheduled()
-    beads_in_progress = get_beads_in_progress()
-    beads_pending_review = get_beads_pending_review()
+    queue = get_queue_snapshot()
 
     data = {
         "queues": {
-            "scheduled": len(beads_scheduled),
-            "in_progress": len(beads_in_progress),
-            "needs_review": len(beads_pending_review),
+            "scheduled": len(queue.scheduled),
+            "in_progress": len(queue.in_progress),
+            "needs_review": len(queue.pending_review),
         }
     }
 
@@ -437,6 +442,232 @@ def run_errands_status(formatter: OutputFormatter) -> int:
     return 0
 
 
+def _schedule_setup_error(formatter: OutputFormatter, error: RuntimeError) -> int:
+    """Report a BD_UNAVAILABLE / NO_EPIC failure of errands.schedule_many()."""
+    code, _, message = str(error).partition(": ")
+    next_steps = {
+        "BD_UNAVAILABLE": "Install Beads CLI: https://github.com/steveyegge/beads",
+        "NO_EPIC": "Run 'layton errands epic set <id>' to configure epic",
+    }
+    formatter.error(code, message, next_steps=[next_steps[code]])
+    return 1
+
+
+def _invalid_variables(formatter: OutputFormatter, message: str) -> int:
+    """Report an INVALID_VARIABLES (--strict) failure."""
+    formatter.error(
+        "INVALID_VARIABLES",
+        message,
+        next_steps=["Run 'layton errands lint' to check the errand's ${...} variables"],
+    )
+    return 1
+
+
+def run_errands_lint(formatter: OutputFormatter) -> int:
+    """Run errands lint - check every errand's variables in one pass.
+
+    Args:
+        formatter: Output formatter
+
+    Returns:
+        Exit code (0=no issues, 1=issues found)
+    """
+    from laytonlib.errands import lint_errands
+
+    results = lint_errands()
+    failing = [r for r in results if r["issues"]]
+    next_steps = []
+    if failing:
+        next_steps.append(
+            "Declare every ${name} under `variables:` in the errand frontmatter"
+        )
+    formatter.success(
+        {"errands": failing, "checked": len(results), "with_issues": len(failing)},
+        next_steps=next_steps or None,
+    )
+    return 1 if failing else 0
+
+
+def run_schedule_many(
+    formatter: OutputFormatter, lines=None, strict: bool = False
+) -> int:
+    """Run errands schedule-many - one NDJSON record per scheduled errand.
+
+    Reads {"name", "variables", "id"} records from stdin and writes one
+    record per request as its bead is created, then a summary record.
+
+    Args:
+        formatter: Output formatter (records go through formatter.record())
+        lines: Request lines (defaults to stdin)
+        strict: Fail records whose variables do not match the errand's
+            placeholders (INVALID_VARIABLES) instead of warning
+
+    Returns:
+        Exit code (0=all scheduled, 1=any request failed or no requests)
+    """
+    from laytonlib.errands import parse_schedule_request, schedule_many
+
+    lines = sys.stdin if lines is None else lines
+    requests = []
+    scheduled = failed = 0
+    read_any = False
+    for index, line in enumerate(lines):
+        if not line.strip():
+            continue
+        read_any = True
+        try:
+            requests.append(parse_schedule_request(line, index))
+        except ValueError as e:
+            failed += 1
+            formatter.record(
+                {
+                    "id": index,
+                    "success": False,
+                    "error": {"code": "INVALID_REQUEST", "message": str(e)},
+                }
+            )
+
+    if not read_any:
+        formatter.error(
+            "NO_REQUESTS",
+            "No schedule requests on stdin",
+            next_steps=['Pipe one {"name": ..., "variables": {...}} record per line'],
+        )
+        return 1
+
+    try:
+        for result in schedule_many(requests, strict=strict):
+            request, bead = result.request, result.bead
+            if result.error:
+                failed += 1
+                code, _, message = result.error.partition(": ")
+                formatter.record(
+                    {
+                        "id": request.id,
+                        "success": False,
+                        "error": {"code": code, "message": message},
+                    }
+                )
+            else:
+                data = {
+                    "bead_id": bead.get("id") or bead.get("number"),
+                    "title": bead.get("title", ""),
+                    "name": request.name,
+                }
+                if result.warnings:
+                    data["warnings"] = result.warnings
+                scheduled += 1
+                formatter.record({"id": request.id, "success": True, "data": data})
+    except RuntimeError as e:
+        return _schedule_setup_error(formatter, e)
+
+    formatter.record(
+        {
+            "success": failed == 0,
+            "summary": {"scheduled": scheduled, "failed": failed},
+        }
+    )
+    return 1 if failed else 0
+
+
+def run_schedule_matrix(
+    formatter: OutputFormatter,
+    name: str,
+    variables: dict,
+    matrix_json: str,
+    strict: bool = False,
+) -> int:
+    """Run errands schedule --matrix - one bead per variable combination.
+
+    Args:
+        formatter: Output formatter
+        name: Errand name
+        variables: Variables shared by every combination
+        matrix_json: JSON object of variable name -> list of values
+        strict: Refuse to schedule if the variables do not match the
+            errand's placeholders
+
+    Returns:
+        Exit code (0=all scheduled, 1=error or any combination failed)
+    """
+    import json
+
+    from laytonlib.errands import (
+        ScheduleRequest,
+        check_variables,
+        compile_errand,
+        expand_matrix,
+        schedule_many,
+    )
+
+    try:
+        combinations = expand_matrix(json.loads(matrix_json), variables)
+    except json.JSONDecodeError:
+        formatter.error("INVALID_JSON", "Invalid JSON matrix")
+        return 1
+    except ValueError as e:
+        code, _, message = str(e).partition(": ")
+        formatter.error(code, message)
+        return 1
+
+    errand = compile_errand(name)
+    if errand is None:
+        formatter.error(
+            "ERRAND_NOT_FOUND",
+            f"Errand '{name}' not found",
+            next_steps=["Run 'layton errands' to list available errands"],
+        )
+        return 1
+
+    # Every combination has the same variable names: check them once
+    warnings = check_variables(errand, combinations[0])
+    if strict and warnings:
+        return _invalid_variables(formatter, "; ".join(warnings))
+
+    requests = [
+        ScheduleRequest(id=index, name=name, variables=combination)
+        for index, combination in enumerate(combinations)
+    ]
+    results = {}
+    try:
+        for result in schedule_many(requests, compiled={name: errand}):
+            results[result.request.id] = result
+    except RuntimeError as e:
+        return _schedule_setup_error(formatter, e)
+
+    scheduled, errors = [], []
+    for request in requests:
+        bead, error = results[request.id].bead, results[request.id].error
+        if error:
+            code, _, message = error.partition(": ")
+            errors.append(
+                {"variables": request.variables, "code": code, "message": message}
+            )
+        else:
+            scheduled.append(
+                {
+                    "bead_id": bead.get("id") or bead.get("number"),
+                    "title": bead.get("title", ""),
+                    "variables": request.variables,
+                }
+            )
+
+    data = {
+        "matrix": {
+            "combinations": len(requests),
+            "scheduled": len(scheduled),
+            "failed": len(errors),
+        },
+        "scheduled": scheduled,
+    }
+    if errors:
+        data["errors"] = errors
+    if warnings:
+        data["warnings"] = warnings
+    formatter.success(data)
+    return 1 if errors else 0
+
+
 def _parse_json_vars(json_vars_arg: str | None) -> dict | None:
     """Parse JSON variables from argument or stdin.
 
@@ -477,6 +708,8 @@ def run_errands(
     epic_action: str | None,
     epic_id: str | None,
     bead_id: str | None = None,
+    matrix: str | None = None,
+    strict: bool = False,
 ) -> int:
     """Run errands command.
 
@@ -488,6 +721,8 @@ def run_errands(
         epic_action: Epic action (set, or None for show)
         epic_id: Epic ID for set action
         bead_id: Bead ID for prompt command
+        matrix: JSON variable matrix for schedule (one bead per combination)
+        strict: Reject variables that do not match the errand (schedule/run)
 
     Returns:
         Exit code (0=success, 1=error)
@@ -532,10 +767,21 @@ def run_errands(
             formatter.error("INVALID_JSON", "Invalid JSON variables")
             return 1
 
+        if matrix is not None:
+            return run_schedule_matrix(formatter, name, variables, matrix, strict)
+
         try:
-            result = schedule_errand(name, variables)
-            formatter.success({"scheduled": result})
+            result, warnings = schedule_errand(name, variables, strict=strict)
+            data = {"scheduled": result}
+            if warnings:
+                data["warnings"] = warnings
+            formatter.success(data)
             return 0
+        except ValueError as e:
+            code, _, message = str(e).partition(": ")
+            if code != "INVALID_VARIABLES":
+                raise
+            return _invalid_variables(formatter, message)
         except FileNotFoundError:
             formatter.error(
                 "ERRAND_NOT_FOUND",
@@ -615,7 +861,7 @@ def run_errands(
             return 1
 
         try:
-            result = schedule_errand(name, variables)
+            result, warnings = schedule_errand(name, variables, strict=strict)
             # Return only bead_id and title — NO prompt (subagent fetches that)
             bead_id_val = result.get("id") or result.get("number")
             title = result.get("title", "")
@@ -625,8 +871,16 @@ def run_errands(
                     "Failed to schedule errand: missing bead ID in response",
                 )
                 return 1
-            formatter.success({"bead_id": bead_id_val, "title": title})
+            data = {"bead_id": bead_id_val, "title": title}
+            if warnings:
+                data["warnings"] = warnings
+            formatter.success(data)
             return 0
+        except ValueError as e:
+            code, _, message = str(e).partition(": ")
+            if code != "INVALID_VARIABLES":
+                raise
+            return _invalid_variables(formatter, message)
         except FileNotFoundError:
             formatter.error(
                 "ERRAND_NOT_FOUND",
@@ -655,6 +909,12 @@ def run_errands(
         formatter.success({"bead_id": bead_id, "prompt": prompt})
         return 0
 
+    elif command == "schedule-many":
+        return run_schedule_many(formatter, strict=strict)
+
+    elif command == "lint":
+        return run_errands_lint(formatter)
+
     elif command == "status":
         return run_errands_status(formatter)
 
@@ -684,25 +944,79 @@ def main(argv: list[str] | None = None) -> int:
     Returns:
         Exit code (0=success, 1=fixable, 2=critical)
     """
-    parser = create_parser()
+    parser = _get_parser()
     args = parser.parse_args(argv)
 
-    # Create formatter based on --human flag
-    formatter = OutputFormatter(human=args.human, verbose=args.verbose)
+    from laytonlib import timing
+
+    if args.timings:
+        timing.start()
+    else:
+        timing.stop()
+
+    # Create formatter based on --human / --format flags
+    formatter = OutputFormatter(
+        human=args.human, verbose=args.verbose, format=args.format
+    )
+    if args.format == "msgpack" and not args.human and not msgpack_available():
+        formatter.format = "json"
+        formatter.error(
+            "MSGPACK_UNAVAILABLE",
+            "--format msgpack requires the msgpack package",
+            next_steps=["pip install msgpack", "Or use --format compact"],
+        )
+        return 1
+
+    # serve never touches the config itself; each forwarded call batches its own
+    if args.command == "serve":
+        return dispatch(args, formatter)
+
+    from laytonlib.config import config_batch, get_vault
 
-    # Check for vault (except for 'config init' which creates one)
+    # Resolve the vault once per invocation; dispatch() and everything
+    # downstream reuse it (batched requests share it too)
+    get_vault(refresh=True)
+
+    # The config is read once per command; writes go out immediately so
+    # each command reports its own WRITE_FAILED before any output
+    with config_batch():
+        return dispatch(args, formatter)
+
+
+def dispatch(args: argparse.Namespace, formatter: OutputFormatter) -> int:
+    """Run one parsed command.
+
+    Args:
+        args: Parsed arguments
+        formatter: Output formatter
+
+    Returns:
+        Exit code (0=success, 1=fixable, 2=critical)
+    """
+    # Check for vault (except for 'config init' which creates one, and 'serve'
+    # and 'batch' which are vault-independent — each forwarded or batched
+    # call checks its own)
     is_config_init = (
         args.command == "config" and getattr(args, "config_command", None) == "init"
     )
-    if not is_config_init:
-        from laytonlib.config import detect_skill_directory, find_vault_root
+    if not is_config_init and args.command not in ("serve", "batch"):
+        from laytonlib.config import VAULT_ENV, detect_skill_directory, get_vault
 
-        vault_root = find_vault_root()
-        if vault_root is None:
+        vault = get_vault()
+        if vault.root is None:
+            import os
             from pathlib import Path
 
             cwd = str(Path.cwd())
-            if detect_skill_directory():
+            if os.environ.get(VAULT_ENV):
+                formatter.error(
+                    "NO_VAULT",
+                    f"{VAULT_ENV} is set to {vault.base}, which has no .layton/ directory",
+                    next_steps=[
+                        f"Unset {VAULT_ENV} or point it at a directory containing .layton/",
+                    ],
+                )
+            elif detect_skill_directory():
                 formatter.error(
                     "WRONG_DIRECTORY",
                     f"Running from the Layton skill directory, not a project vault (cwd: {cwd})",
@@ -724,10 +1038,38 @@ def main(argv: list[str] | None = None) -> int:
 
     # No-arg default: run orientation (doctor + rolodex + protocols)
     if args.command is None:
-        return run_orientation(formatter)
+        from laytonlib.errands import QueueBudget
+        from laytonlib.orientation import run_orientation, select_sections
+
+        try:
+            sections = select_sections(args.only, args.skip)
+        except ValueError as e:
+            code, _, message = str(e).partition(": ")
+            formatter.error(code, message)
+            return 2
+
+        budget = QueueBudget(
+            fields=args.fields, max_items=args.max_items, max_bytes=args.max_bytes
+        )
+        return run_orientation(
+            formatter,
+            budget,
+            sections,
+            stream=args.stream,
+            deadline_ms=args.budget_ms,
+            since=args.since,
+        )
 
     # Route to command handlers
     if args.command == "doctor":
+        if args.days is not None and not args.perf:
+            formatter.error("INVALID_OPTIONS", "--days requires --perf")
+            return 2
+        if args.perf:
+            from laytonlib.doctor import run_perf
+
+            return run_perf(formatter, days=args.days)
+
         from laytonlib.doctor import run_doctor
 
         return run_doctor(formatter, fix=getattr(args, "fix", False))
@@ -774,8 +1116,20 @@ def main(argv: list[str] | None = None) -> int:
             epic_action=getattr(args, "action", None),
             epic_id=getattr(args, "epic_id", None),
             bead_id=getattr(args, "bead_id", None),
+            matrix=getattr(args, "matrix", None),
+            strict=getattr(args, "strict", False),
         )
 
+    elif args.command == "batch":
+        from laytonlib.batch import run_batch
+
+        return run_batch(formatter)
+
+    elif args.command == "serve":
+        from laytonlib.daemon import run_serve
+
+        return run_serve(formatter, socket_path=getattr(args, "socket", None))
+
     else:
         # Unknown command - shouldn't happen with argparse
         formatter.error("UNKNOWN_COMMAND", f"Unknown command: {args.command}")
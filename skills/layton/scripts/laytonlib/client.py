@@ -0,0 +1,270 @@
+"""Thin client for the `layton serve` daemon.
+
+The `scripts/layton` wrapper calls forward() before importing the rest of
+laytonlib. If a daemon is listening on the socket, argv/stdin/cwd are sent to
+it and its output is replayed locally. Otherwise forward() returns None and the
+wrapper falls back to in-process execution.
+
+Wire format (one connection per invocation):
+
+    client: {"version": ...}\n          daemon: {"ready": true}\n
+    client: {"argv", "cwd", "stdin", "env"}\n, then EOF
+    daemon: {"exit_code", "stdout_len"}\n + stdout bytes + stderr bytes
+
+The version handshake happens before stdin is read, so a daemon from another
+release (e.g. right after an upgrade) is skipped with stdin still intact.
+Once the request has been sent the daemon may have run it, so failures from
+then on are reported instead of re-running the command in-process.
+
+The client only talks to a socket owned by the current user: the path must
+be a socket we own (lstat), and where the platform reports it, the listening
+process must run as us (SO_PEERCRED). Anything else runs in-process, since
+the request carries cwd, stdin and the bd environment.
+
+This module must stay stdlib-only and cheap to import.
+"""
+
+import json
+import os
+import select
+import socket
+import stat
+import struct
+import sys
+import tempfile
+
+from laytonlib import __version__
+
+# Commands that must never be forwarded to the daemon (batch and
+# schedule-many stream stdin, which the client only forwards in one piece
+# and only if it is already readable), as (command, subcommand) prefixes
+LOCAL_COMMANDS = {("batch",), ("serve",), ("errands", "schedule-many")}
+
+# Top-level options that take a value (kept in sync with cli.create_parser)
+VALUE_OPTIONS = (
+    "--format",
+    "--fields",
+    "--max-items",
+    "--max-bytes",
+    "--budget-ms",
+    "--since",
+    "--only",
+    "--skip",
+)
+
+# Environment variables forwarded to the daemon: layton's own settings plus
+# what bd runs under (which bd binary, where its database lives, local time)
+ENV_PREFIXES = ("LAYTON_", "BEADS_", "BD_")
+ENV_NAMES = frozenset({"PATH", "HOME", "TZ"})
+
+CONNECT_TIMEOUT = 0.5
+
+
+def get_socket_path() -> str:
+    """Get the daemon socket path.
+
+    Uses $LAYTON_SOCKET if set, otherwise a per-user socket in
+    $XDG_RUNTIME_DIR (or the temp directory).
+    """
+    explicit = os.environ.get("LAYTON_SOCKET")
+    if explicit:
+        return explicit
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR", "/tmp")
+    return os.path.join(runtime_dir, f"layton-{os.getuid()}.sock")
+
+
+def _owned_socket(path: str) -> bool:
+    """Check that path is a socket owned by the current user (not a symlink)."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+
+def _peer_uid(sock: socket.socket) -> int | None:
+    """Get the uid of the process at the other end (None if unsupported)."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    creds = sock.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+    )
+    _, uid, _ = struct.unpack("3i", creds)
+    return uid
+
+
+def command_path(argv: list[str]) -> tuple[str, ...]:
+    """Get the command and subcommand of an invocation.
+
+    Skips the top-level options (and their values) in front of the command,
+    so option values and command arguments never count as the command.
+    Abbreviated options are matched like argparse does.
+    """
+    words: list[str] = []
+    args = iter(argv)
+    for arg in args:
+        if arg.startswith("-"):
+            if (
+                "=" not in arg
+                and len(arg) > 2
+                and any(option.startswith(arg) for option in VALUE_OPTIONS)
+            ):
+                next(args, None)
+            continue
+        words.append(arg)
+        if len(words) == 2:
+            break
+    return tuple(words)
+
+
+def is_local_command(argv: list[str]) -> bool:
+    """Check whether an invocation must run in-process."""
+    path = command_path(argv)
+    return any(path[: len(local)] == local for local in LOCAL_COMMANDS)
+
+
+def is_forwarded_env(key: str) -> bool:
+    """Check whether an environment variable is sent with each request."""
+    return key in ENV_NAMES or key.startswith(ENV_PREFIXES)
+
+
+def _read_stdin() -> str | None:
+    """Read piped stdin without blocking (mirrors _parse_json_vars)."""
+    stdin = sys.stdin
+    if stdin is None or stdin.isatty():
+        return None
+    try:
+        if select.select([stdin], [], [], 0.0)[0]:
+            return stdin.read()
+    except (OSError, ValueError):
+        return None
+    return None
+
+
+def _recv_all(sock: socket.socket) -> bytes:
+    """Read from a socket until EOF."""
+    chunks = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _recv_line(sock: socket.socket) -> bytes:
+    """Read one newline-terminated line (the daemon sends nothing after it)."""
+    line = b""
+    while not line.endswith(b"\n"):
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        line += chunk
+    return line
+
+
+def _replay_stdin(data: str | None) -> None:
+    """Put already-read stdin back for the in-process fallback.
+
+    A real file (not StringIO) is used so select()/fileno() keep working.
+    """
+    if data is None:
+        return
+    replacement = tempfile.TemporaryFile("w+")  # noqa: SIM115
+    replacement.write(data)
+    replacement.seek(0)
+    sys.stdin = replacement
+
+
+def _forward_failed(message: str) -> int:
+    """Report a daemon failure after the request was sent.
+
+    The daemon may already have run the command, so running it again
+    in-process could repeat side effects (e.g. a second bd create).
+    """
+    error = {
+        "success": False,
+        "error": {"code": "DAEMON_ERROR", "message": message},
+        "next_steps": ["Check the `layton serve` daemon, or set LAYTON_NO_DAEMON=1"],
+    }
+    sys.stdout.write(json.dumps(error, indent=2) + "\n")
+    sys.stdout.flush()
+    return 2
+
+
+def forward(argv: list[str]) -> int | None:
+    """Forward a CLI invocation to a running daemon.
+
+    Args:
+        argv: Command line arguments (without program name)
+
+    Returns:
+        Exit code from the daemon, or None if no daemon is available
+        (caller should run in-process; any stdin read is put back)
+    """
+    # Profiling measures this process, so never hand the work to the daemon
+    if os.environ.get("LAYTON_NO_DAEMON") or os.environ.get("LAYTON_PROFILE"):
+        return None
+    if is_local_command(argv):
+        return None
+
+    path = get_socket_path()
+    if not _owned_socket(path):
+        return None
+
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    except OSError:
+        return None
+
+    with sock:
+        try:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(path)
+            uid = _peer_uid(sock)
+            if uid is not None and uid != os.getuid():
+                return None
+            sock.settimeout(None)
+            sock.sendall(json.dumps({"version": __version__}).encode() + b"\n")
+            reply = json.loads(_recv_line(sock))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(reply, dict) or reply.get("ready") is not True:
+            # Version mismatch: stdin is untouched, run in-process
+            return None
+
+        stdin = _read_stdin()
+        request = {
+            "argv": argv,
+            "cwd": os.getcwd(),
+            "stdin": stdin,
+            "env": {k: v for k, v in os.environ.items() if is_forwarded_env(k)},
+        }
+        try:
+            sock.sendall(json.dumps(request).encode() + b"\n")
+        except OSError:
+            # The daemon only runs a request it read up to EOF
+            _replay_stdin(stdin)
+            return None
+        try:
+            sock.shutdown(socket.SHUT_WR)
+            raw = _recv_all(sock)
+        except OSError as e:
+            return _forward_failed(f"Lost connection to the daemon: {e}")
+
+    # Response: JSON header line, then raw stdout bytes, then raw stderr bytes
+    header_end = raw.find(b"\n")
+    try:
+        header = json.loads(raw[:header_end]) if header_end != -1 else None
+    except ValueError:
+        header = None
+    if not isinstance(header, dict) or "exit_code" not in header:
+        return _forward_failed("Invalid response from the daemon")
+
+    body = raw[header_end + 1 :]
+    stdout_len = header.get("stdout_len", 0)
+    sys.stdout.buffer.write(body[:stdout_len])
+    sys.stdout.flush()
+    sys.stderr.buffer.write(body[stdout_len:])
+    sys.stderr.flush()
+    return header["exit_code"]
@@ -1,23 +1,66 @@
 """Configuration loading and management.
 
-Config is stored at .layton/config.json, discovered by walking up from cwd.
+Config is stored at .layton/config.json, discovered by walking up from cwd
+(or taken from $LAYTON_VAULT, which skips the walk).
 Implements a simple key-value store with dot-notation access.
+
+The parsed config is kept in memory and revalidated against the file's
+mtime/size/inode, so repeated load_config() calls don't re-read it. Inside
+config_batch() (which cli.main wraps every command in) the cached copy is
+trusted for the whole command. save_config() always writes through
+(atomically), so the command that saves can report a failed write itself.
 """
 
+import contextlib
+import copy
 import json
+import os
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from laytonlib.formatters import OutputFormatter
+from laytonlib.timing import span
 
+VAULT_ENV = "LAYTON_VAULT"
 
-def find_vault_root() -> Path | None:
-    """Find the nearest directory containing a .layton/ directory.
 
-    Walks upward from cwd. Returns the directory (not .layton/ itself),
-    or None if no vault is found.
+@dataclass(frozen=True)
+class VaultContext:
+    """Resolved vault location and the paths derived from it.
+
+    Attributes:
+        root: Directory containing .layton/, or None if no vault was found
+        base: root, or the directory a new vault would be created in
+            (the $LAYTON_VAULT override, else cwd)
     """
-    current = Path.cwd().resolve()
+
+    root: Path | None
+    base: Path
+
+    @property
+    def layton_dir(self) -> Path:
+        return self.base / ".layton"
+
+    @property
+    def beads_dir(self) -> Path:
+        return self.base / ".beads"
+
+    @property
+    def skills_dir(self) -> Path:
+        return self.base / "skills"
+
+
+# (cwd, $LAYTON_VAULT) -> resolved vault. Only found vaults are cached, so a
+# vault created later in the process (config init, doctor --fix) is picked up.
+_vault_cache: dict[tuple[str, str | None], VaultContext] = {}
+
+
+def _walk_to_vault(start: Path) -> Path | None:
+    """Walk upward from start to the nearest directory containing .layton/."""
+    current = start
     while True:
         if (current / ".layton").is_dir():
             return current
@@ -28,6 +71,52 @@ def find_vault_root() -> Path | None:
     return None
 
 
+def get_vault(refresh: bool = False) -> VaultContext:
+    """Get the vault for the current directory, resolving it at most once.
+
+    $LAYTON_VAULT names the vault root directly and skips the upward walk.
+    A cached vault is re-checked with a single stat of its .layton/.
+
+    Args:
+        refresh: Ignore the cache and resolve again
+
+    Returns:
+        VaultContext (root is None if no vault was found)
+    """
+    override = os.environ.get(VAULT_ENV) or None
+    key = (os.getcwd(), override)
+
+    if not refresh:
+        cached = _vault_cache.get(key)
+        if cached is not None and cached.layton_dir.is_dir():
+            return cached
+
+    with span("vault"):
+        if override:
+            base = Path(override).expanduser().resolve()
+            root = base if (base / ".layton").is_dir() else None
+        else:
+            cwd = Path.cwd().resolve()
+            root = _walk_to_vault(cwd)
+            base = root or cwd
+
+    vault = VaultContext(root=root, base=base)
+    if root is not None:
+        _vault_cache[key] = vault
+    else:
+        _vault_cache.pop(key, None)
+    return vault
+
+
+def find_vault_root() -> Path | None:
+    """Find the nearest directory containing a .layton/ directory.
+
+    Walks upward from cwd (unless $LAYTON_VAULT is set). Returns the
+    directory (not .layton/ itself), or None if no vault is found.
+    """
+    return get_vault().root
+
+
 def detect_skill_directory() -> bool:
     """Detect if cwd is the Layton skill directory itself.
 
@@ -40,11 +129,9 @@ def detect_skill_directory() -> bool:
 def get_layton_dir() -> Path:
     """Get the .layton directory path.
 
-    Uses find_vault_root() for discovery. Falls back to cwd (for 'config init').
+    Uses get_vault() for discovery. Falls back to cwd (for 'config init').
     """
-    vault_root = find_vault_root()
-    base = vault_root if vault_root else Path.cwd()
-    return base / ".layton"
+    return get_vault().layton_dir
 
 
 def get_config_path() -> Path:
@@ -52,6 +139,28 @@ def get_config_path() -> Path:
     return get_layton_dir() / "config.json"
 
 
+def get_cache_dir(create: bool = False) -> Path:
+    """Get the .layton/cache/ directory for derived, disposable data.
+
+    Args:
+        create: Create the directory (with a .gitignore that ignores
+            everything in it) if it does not exist. Nothing is created
+            when there is no .layton/ directory.
+
+    Returns:
+        Path to the cache directory (may not exist)
+    """
+    layton_dir = get_layton_dir()
+    cache_dir = layton_dir / "cache"
+    if create and layton_dir.is_dir() and not cache_dir.is_dir():
+        try:
+            cache_dir.mkdir(exist_ok=True)
+            (cache_dir / ".gitignore").write_text("*\n")
+        except OSError:
+            pass
+    return cache_dir
+
+
 def get_default_config() -> dict:
     """Get default configuration values."""
     # Try to detect system timezone
@@ -74,30 +183,104 @@ def get_default_config() -> dict:
     }
 
 
+# Files modified this recently may change again within the same mtime tick
+# without the size changing, so their cached copy is not trusted
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class ConfigStore:
+    """In-process cache of config.json with atomic write-through saves."""
+
+    def __init__(self) -> None:
+        self._path: Path | None = None
+        self._stamp: tuple[int, int, int] | None = None
+        self._data: dict | None = None
+        self._trusted = False
+        self._batch_depth = 0
+
+    def load(self) -> dict | None:
+        """Get a copy of the config, or None if missing or invalid."""
+        path = get_config_path()
+        try:
+            st = path.stat()
+        except OSError:
+            self._path = None
+            return None
+        stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+        # Within a batch the snapshot is trusted for the whole command
+        fresh = self._trusted or self._batch_depth
+        if fresh and path == self._path and stamp == self._stamp:
+            return copy.deepcopy(self._data)
+
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            self._path = None
+            return None
+
+        self._path = path
+        self._stamp = stamp
+        self._data = data
+        self._trusted = st.st_mtime_ns < time.time_ns() - RACY_WINDOW_NS
+        return copy.deepcopy(data)
+
+    def save(self, config: dict) -> bool:
+        """Write the config. Returns True on success."""
+        return self._write(get_config_path(), config)
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """Trust the cached copy until the outermost batch exits."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+
+    def _write(self, path: Path, config: dict) -> bool:
+        """Write config atomically and remember it as the cached copy."""
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(config, f, indent=2)
+            os.replace(tmp_path, path)
+            st = path.stat()
+        except OSError:
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+            self._path = None
+            return False
+
+        self._path = path
+        self._stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+        self._data = copy.deepcopy(config)
+        self._trusted = True
+        return True
+
+
+_store = ConfigStore()
+
+
+def config_batch() -> contextlib.AbstractContextManager[None]:
+    """Reuse one config snapshot for the whole block (one command).
+
+    Changes by other processes during the block are not picked up; the
+    process's own save_config() calls still update the snapshot.
+    """
+    return _store.batch()
+
+
 def load_config() -> dict | None:
     """Load config from file. Returns None if not found."""
-    config_path = get_config_path()
-    if not config_path.exists():
-        return None
-    try:
-        with open(config_path) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        return None
+    return _store.load()
 
 
 def save_config(config: dict) -> bool:
-    """Save config to file. Returns True on success."""
-    config_path = get_config_path()
-    layton_dir = get_layton_dir()
-
-    try:
-        layton_dir.mkdir(parents=True, exist_ok=True)
-        with open(config_path, "w") as f:
-            json.dump(config, f, indent=2)
-        return True
-    except OSError:
-        return False
+    """Save config to file (atomically). Returns True on success."""
+    return _store.save(config)
 
 
 def get_nested(data: dict, key: str) -> Any:
@@ -0,0 +1,246 @@
+"""Persistent `layton serve` daemon.
+
+Keeps laytonlib loaded behind a Unix domain socket so repeated CLI calls skip
+interpreter startup, imports and template reads. Each connection carries one
+invocation (argv, cwd, stdin, and the environment bd depends on) and gets
+back the exit code plus captured stdout/stderr. See laytonlib.client for the
+wire format.
+
+Requests are handled one at a time: cwd, environment and sys.std* are
+process-global, so invocations must not overlap.
+"""
+
+import contextlib
+import importlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+import time
+import traceback
+from collections.abc import Iterator
+
+from laytonlib import __version__
+from laytonlib.client import get_socket_path, is_forwarded_env
+from laytonlib.formatters import OutputFormatter
+
+# Modules imported at startup so warm calls never pay for them
+PRELOAD_MODULES = (
+    "laytonlib.cli",
+    "laytonlib.config",
+    "laytonlib.context",
+    "laytonlib.doctor",
+    "laytonlib.errands",
+    "laytonlib.orientation",
+    "laytonlib.protocols",
+    "laytonlib.rolodex",
+    "laytonlib.snapshots",
+)
+
+
+def _preload() -> None:
+    """Import command modules up front (also reads the bundled templates)."""
+    for module in PRELOAD_MODULES:
+        importlib.import_module(module)
+
+
+@contextlib.contextmanager
+def _stdin_from(data: str | None) -> Iterator[None]:
+    """Temporarily replace sys.stdin with the forwarded stdin data.
+
+    A real file (not StringIO) is used so select()/fileno() keep working.
+    """
+    if data is None:
+        replacement = open(os.devnull)  # noqa: SIM115
+    else:
+        replacement = tempfile.TemporaryFile("w+")  # noqa: SIM115
+        replacement.write(data)
+        replacement.seek(0)
+
+    saved = sys.stdin
+    sys.stdin = replacement
+    try:
+        yield
+    finally:
+        sys.stdin = saved
+        replacement.close()
+
+
+@contextlib.contextmanager
+def _environment(env: dict[str, str]) -> Iterator[None]:
+    """Temporarily replace the forwarded environment variables with the client's.
+
+    Covers PATH, HOME, TZ and the LAYTON_/BEADS_/BD_ variables, so bd runs
+    with the caller's binary and database rather than the daemon's.
+    """
+    saved = {k: v for k, v in os.environ.items() if is_forwarded_env(k)}
+    for key in saved:
+        del os.environ[key]
+    os.environ.update({k: v for k, v in env.items() if is_forwarded_env(k)})
+    time.tzset()
+    try:
+        yield
+    finally:
+        for key in [k for k in os.environ if is_forwarded_env(k)]:
+            del os.environ[key]
+        os.environ.update(saved)
+        time.tzset()
+
+
+def execute(request: dict) -> tuple[int, bytes, bytes]:
+    """Run one forwarded invocation in this process.
+
+    Args:
+        request: Decoded client request (argv, cwd, stdin, env)
+
+    Returns:
+        Tuple of (exit_code, stdout_bytes, stderr_bytes)
+    """
+    from laytonlib.cli import main
+
+    out_buf = io.BytesIO()
+    err_buf = io.BytesIO()
+    stdout = io.TextIOWrapper(out_buf, encoding="utf-8", write_through=True)
+    stderr = io.TextIOWrapper(err_buf, encoding="utf-8", write_through=True)
+
+    saved_cwd = os.getcwd()
+    try:
+        os.chdir(request["cwd"])
+        with (
+            _environment(request.get("env") or {}),
+            _stdin_from(request.get("stdin")),
+            contextlib.redirect_stdout(stdout),
+            contextlib.redirect_stderr(stderr),
+        ):
+            try:
+                exit_code = main(list(request.get("argv") or []))
+            except SystemExit as e:
+                if e.code is None:
+                    exit_code = 0
+                elif isinstance(e.code, int):
+                    exit_code = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    exit_code = 1
+            except Exception:  # noqa: BLE001 - a crashing command must not stop the daemon
+                traceback.print_exc()
+                exit_code = 2
+    except OSError as e:
+        err_buf.write(f"layton daemon: {e}\n".encode())
+        exit_code = 2
+    finally:
+        os.chdir(saved_cwd)
+
+    return exit_code, out_buf.getvalue(), err_buf.getvalue()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handle one forwarded CLI invocation per connection."""
+
+    def handle(self) -> None:
+        try:
+            hello = json.loads(self.rfile.readline())
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            self.wfile.write(b'{"error": "INVALID_REQUEST"}\n')
+            return
+
+        if not isinstance(hello, dict) or hello.get("version") != __version__:
+            # Client falls back to in-process execution (stdin not yet read)
+            self.wfile.write(b'{"error": "VERSION_MISMATCH"}\n')
+            return
+        self.wfile.write(b'{"ready": true}\n')
+
+        try:
+            request = json.loads(self.rfile.read())
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            self.wfile.write(b'{"error": "INVALID_REQUEST"}\n')
+            return
+
+        exit_code, out, err = execute(request)
+        header = {"exit_code": exit_code, "stdout_len": len(out)}
+        self.wfile.write(json.dumps(header).encode() + b"\n" + out + err)
+        self.server.requests_served += 1
+
+
+class LaytonServer(socketserver.UnixStreamServer):
+    """Single-threaded Unix socket server for forwarded invocations."""
+
+    requests_served = 0
+
+    def __init__(self, socket_path: str):
+        # Create the socket owner-only from the start: a chmod after bind() would
+        # leave a window in which other users can connect
+        old_umask = os.umask(0o077)
+        try:
+            super().__init__(socket_path, _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+
+def _daemon_alive(socket_path: str) -> bool:
+    """Check whether something is already accepting on the socket."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.5)
+            sock.connect(socket_path)
+        return True
+    except OSError:
+        return False
+
+
+def run_serve(formatter: OutputFormatter, socket_path: str | None = None) -> int:
+    """Run the daemon in the foreground until interrupted.
+
+    Args:
+        formatter: Output formatter
+        socket_path: Socket path (defaults to get_socket_path())
+
+    Returns:
+        Exit code (0=clean shutdown, 1=error)
+    """
+    path = socket_path or get_socket_path()
+
+    if os.path.exists(path):
+        if _daemon_alive(path):
+            formatter.error(
+                "DAEMON_RUNNING",
+                f"A layton daemon is already listening on {path}",
+                next_steps=["Stop the running daemon or pass --socket <path>"],
+            )
+            return 1
+        # Stale socket from a previous daemon
+        os.unlink(path)
+
+    _preload()
+
+    try:
+        server = LaytonServer(path)
+    except OSError as e:
+        formatter.error("SOCKET_ERROR", f"Cannot listen on {path}: {e}")
+        return 1
+
+    def _stop(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, _stop)
+
+    formatter.success(
+        {"socket": path, "pid": os.getpid(), "version": __version__},
+        next_steps=["Stop with Ctrl-C or SIGTERM"],
+    )
+    sys.stdout.flush()
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+
+    return 0
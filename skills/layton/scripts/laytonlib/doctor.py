@@ -4,13 +4,17 @@ Validates system setup and dependencies.
 """
 
 import json
+import math
 import shutil
 import subprocess
+import time
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from typing import Literal
 
-from laytonlib.config import find_vault_root, get_layton_dir
+from laytonlib.bd import TRACE_ENV, get_trace_path, run_bd
+from laytonlib.config import get_layton_dir, get_vault
 from laytonlib.formatters import OutputFormatter
 
 
@@ -48,12 +52,7 @@ def check_beads_available() -> CheckResult:
 
     # Check if bd version works (fast, no db access)
     try:
-        result = subprocess.run(
-            ["bd", "version"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
+        result = run_bd(["version"], check=False, timeout=5)
         if result.returncode == 0:
             version = result.stdout.strip()
             return CheckResult(
@@ -85,9 +84,7 @@ def check_beads_available() -> CheckResult:
 
 def check_beads_initialized() -> CheckResult:
     """Check if .beads/ directory exists."""
-    vault_root = find_vault_root()
-    base = vault_root if vault_root else Path.cwd()
-    beads_dir = base / ".beads"
+    beads_dir = get_vault().beads_dir
 
     if beads_dir.exists():
         return CheckResult(
@@ -304,3 +301,99 @@ def run_doctor(formatter: OutputFormatter, fix: bool = False) -> int:
             data["message"] = "All systems go!"
         formatter.success(data, next_steps=next_steps)
         return 0
+
+
+# Latency percentiles reported by `doctor --perf`
+PERF_PERCENTILES = (50, 95, 99)
+
+
+def load_trace(path: Path | None = None) -> list[dict]:
+    """Read bd trace records (rotated log first), skipping malformed lines."""
+    path = path or get_trace_path()
+    records = []
+    for log in (path.with_name(path.name + ".1"), path):
+        try:
+            with open(log) as f:
+                lines = f.readlines()
+        except OSError:
+            continue
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and isinstance(record.get("ms"), int | float):
+                records.append(record)
+    return records
+
+
+def _subcommand(argv: list) -> str:
+    """First non-flag bd argument (e.g. "list" for bd list --json)."""
+    for arg in argv[1:]:
+        if isinstance(arg, str) and not arg.startswith("-"):
+            return arg
+    return "(none)"
+
+
+def _percentile(values: list[float], pct: int) -> float:
+    """Nearest-rank percentile of sorted values."""
+    rank = max(math.ceil(pct / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+def summarize_trace(records: list[dict]) -> dict[str, dict]:
+    """Aggregate trace records into latency stats per bd subcommand."""
+    groups: dict[str, list[dict]] = {}
+    for record in records:
+        groups.setdefault(_subcommand(record.get("argv") or []), []).append(record)
+
+    summary = {}
+    for name in sorted(groups):
+        group = groups[name]
+        times = sorted(r["ms"] for r in group)
+        stats = {
+            "calls": len(group),
+            "errors": sum(1 for r in group if r.get("exit_code") != 0),
+        }
+        for pct in PERF_PERCENTILES:
+            stats[f"p{pct}_ms"] = _percentile(times, pct)
+        stats["max_ms"] = times[-1]
+        stats["avg_bytes_out"] = round(
+            sum(r.get("bytes_out") or 0 for r in group) / len(group)
+        )
+        summary[name] = stats
+    return summary
+
+
+def run_perf(formatter: OutputFormatter, days: int | None = None) -> int:
+    """Report bd latency percentiles from the trace log.
+
+    Args:
+        formatter: Output formatter
+        days: Only include calls from the last N days
+
+    Returns:
+        Exit code (always 0)
+    """
+    path = get_trace_path()
+    records = load_trace(path)
+    if days is not None:
+        cutoff = time.time() - days * 86400
+        records = [r for r in records if (r.get("ts") or 0) >= cutoff]
+
+    data: dict = {"trace": str(path), "calls": len(records)}
+    if not records:
+        data["subcommands"] = {}
+        formatter.success(
+            data,
+            next_steps=[f"Set {TRACE_ENV}=1 to record bd calls to {path}"],
+        )
+        return 0
+
+    timestamps = [r["ts"] for r in records if isinstance(r.get("ts"), int | float)]
+    if timestamps:
+        data["from"] = datetime.fromtimestamp(min(timestamps)).astimezone().isoformat()
+        data["to"] = datetime.fromtimestamp(max(timestamps)).astimezone().isoformat()
+    data["subcommands"] = summarize_trace(records)
+    formatter.success(data)
+    return 0
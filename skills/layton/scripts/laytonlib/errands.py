@@ -3,30 +3,55 @@
 Errands are stored in .layton/errands/<name>.md with YAML frontmatter.
 Errands use `${variable}` syntax for runtime substitution via string.Template.
 The CLI can list errands, add new ones, and schedule errands from definitions.
+
+Read-only bead queries can bypass the bd CLI by streaming .beads/*.jsonl
+directly (opt-in with LAYTON_BEADS_JSONL=1); unrecognized or stale stores
+fall back to bd.
 """
 
+import contextlib
+import functools
+import hashlib
+import itertools
 import json
-import re
+import math
+import os
 import shutil
 import subprocess
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from string import Template
+from typing import Any
 
+from laytonlib import __version__
+from laytonlib.bd import run_bd
 from laytonlib.config import (
+    get_cache_dir,
     get_layton_dir,
     get_nested,
+    get_vault,
     load_config,
     save_config,
     set_nested,
 )
-
+from laytonlib.executor import iter_completed, run_concurrently
+from laytonlib.frontmatter import (  # noqa: F401 - re-exported for callers
+    parse_frontmatter,
+    read_frontmatter,
+    split_frontmatter,
+)
+from laytonlib.index import scan_frontmatter
+from laytonlib.timing import timed
 
 # Fixed labels for bead state management
 LABEL_SCHEDULED = "scheduled"
 LABEL_IN_PROGRESS = "in-progress"
 LABEL_NEEDS_REVIEW = "needs-review"
 
+# Upper bound on the variable sets one `errands schedule --matrix` may expand to
+MAX_MATRIX_COMBINATIONS = 1000
+
 
 @dataclass
 class ErrandInfo:
@@ -36,6 +61,8 @@ class ErrandInfo:
     description: str
     variables: dict[str, str] = field(default_factory=dict)
     path: Path | None = None
+    # ${...} names used in the body (only known once the body is loaded)
+    placeholders: frozenset[str] = frozenset()
 
     def to_dict(self) -> dict:
         result = {
@@ -69,78 +96,16 @@ def get_errands_dir() -> Path:
     return get_layton_dir() / "errands"
 
 
-def parse_frontmatter(content: str) -> dict | None:
-    """Parse YAML frontmatter from markdown content with variables section.
-
-    Args:
-        content: Markdown file content
-
-    Returns:
-        Dict of frontmatter fields, or None if no valid frontmatter.
-        The 'variables' key contains a dict of {variable_name: description}.
-    """
-    # Match frontmatter between --- markers
-    match = re.match(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
-    if not match:
-        return None
-
-    frontmatter_text = match.group(1)
-    result = {}
-    in_variables = False
-    variables = {}
-
-    for line in frontmatter_text.split("\n"):
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-
-        # Check if this is the variables section start
-        if stripped == "variables:":
-            in_variables = True
-            continue
-
-        # Check for indented variable definition (in variables section)
-        if in_variables and line.startswith("  ") and ":" in stripped:
-            # Parse variable_name: description
-            var_name, _, var_desc = stripped.partition(":")
-            variables[var_name.strip()] = var_desc.strip()
-            continue
-
-        # Non-indented line ends variables section
-        if in_variables and not line.startswith("  ") and ":" in stripped:
-            in_variables = False
-
-        # Regular key: value
-        if ":" in stripped:
-            key, _, value = stripped.partition(":")
-            result[key.strip()] = value.strip()
-
-    # Add variables to result if any were found
-    if variables:
-        result["variables"] = variables
-
-    return result if result else None
-
-
 def list_errands() -> list[ErrandInfo]:
     """List all errands from .layton/errands/.
 
     Returns:
         List of ErrandInfo objects, sorted by name
     """
-    errands_dir = get_errands_dir()
-    if not errands_dir.exists():
-        return []
-
     errands = []
-    for path in errands_dir.glob("*.md"):
-        if path.name == ".gitkeep":
-            continue
-
+    for path, frontmatter in scan_frontmatter(get_errands_dir()):
         try:
-            content = path.read_text()
-            frontmatter = parse_frontmatter(content)
-            if frontmatter and "name" in frontmatter:
+            if "name" in frontmatter:
                 errands.append(
                     ErrandInfo(
                         name=frontmatter.get("name", path.stem),
@@ -150,7 +115,7 @@ def list_errands() -> list[ErrandInfo]:
                     )
                 )
         except Exception:
-            # Skip files that can't be read
+            # Skip errands whose frontmatter can't be used
             continue
 
     return sorted(errands, key=lambda e: e.name)
@@ -199,25 +164,170 @@ def load_errand(name: str) -> tuple[ErrandInfo, str] | None:
     if not errand_path.exists():
         return None
 
-    content = errand_path.read_text()
-    frontmatter = parse_frontmatter(content)
-    if not frontmatter:
-        return None
+    return _parse_errand(name, errand_path, errand_path.read_bytes())
 
-    # Extract body (everything after second ---)
-    match = re.match(r"^---\s*\n.*?\n---\s*\n(.*)$", content, re.DOTALL)
-    body = match.group(1) if match else ""
 
+def _parse_errand(
+    name: str, path: Path, content: bytes
+) -> tuple[ErrandInfo, str] | None:
+    """Parse an errand file's content (see load_errand)."""
+    split = split_frontmatter(content.decode("utf-8"))
+    if not split:
+        return None
+
+    frontmatter, body = split
     info = ErrandInfo(
         name=frontmatter.get("name", name),
         description=frontmatter.get("description", ""),
         variables=frontmatter.get("variables", {}),
-        path=errand_path,
+        path=path,
+        placeholders=frozenset(Template(body).get_identifiers()),
     )
 
     return info, body
 
 
+@dataclass
+class CompiledErrand:
+    """An errand loaded and parsed once, ready to render many times."""
+
+    name: str
+    info: ErrandInfo
+    body: str
+    template: Template = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.template = Template(self.body)
+
+    @property
+    def placeholders(self) -> frozenset[str]:
+        return self.info.placeholders
+
+    @property
+    def title(self) -> str:
+        """Bead title: the errand name plus its description."""
+        if self.info.description:
+            return f"[{self.name}] {self.info.description}"
+        return f"[{self.name}]"
+
+    def render(self, variables: dict[str, str]) -> str:
+        """Render the body (safe_substitute leaves missing vars as-is)."""
+        return self.template.safe_substitute(variables)
+
+
+# Compiled errands by path: (content hash, compiled errand). Lives as long as
+# the process, so daemon and batch mode reuse it across requests.
+_compiled: dict[Path, tuple[str, CompiledErrand]] = {}
+
+ERRAND_CACHE_FORMAT = 1
+
+
+def _errand_cache_path(name: str) -> Path:
+    return get_cache_dir() / "errands" / f"{name}.json"
+
+
+def _load_cached_errand(name: str, path: Path, digest: str) -> CompiledErrand | None:
+    """Read a compiled errand from .layton/cache/errands/ if it matches."""
+    try:
+        with open(_errand_cache_path(name)) as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not (
+        isinstance(data, dict)
+        and data.get("format") == ERRAND_CACHE_FORMAT
+        and data.get("version") == __version__
+        and data.get("path") == str(path)
+        and data.get("hash") == digest
+    ):
+        return None
+
+    # A truncated or hand-edited entry is a miss: the errand is parsed again
+    try:
+        info = data["info"]
+        return CompiledErrand(
+            name=name,
+            info=ErrandInfo(
+                name=info["name"],
+                description=info["description"],
+                variables=info["variables"],
+                path=path,
+                placeholders=frozenset(data["placeholders"]),
+            ),
+            body=data["body"],
+        )
+    except (KeyError, TypeError):
+        return None
+
+
+def _save_cached_errand(errand: CompiledErrand, path: Path, digest: str) -> None:
+    """Write a compiled errand to .layton/cache/errands/ (best-effort)."""
+    if not get_cache_dir(create=True).is_dir():
+        return
+    cache_path = _errand_cache_path(errand.name)
+    tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    data = {
+        "format": ERRAND_CACHE_FORMAT,
+        "version": __version__,
+        "path": str(path),
+        "hash": digest,
+        "info": {
+            "name": errand.info.name,
+            "description": errand.info.description,
+            "variables": errand.info.variables,
+        },
+        "body": errand.body,
+        "placeholders": sorted(errand.placeholders),
+    }
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+
+
+@timed()
+def compile_errand(name: str) -> CompiledErrand | None:
+    """Load an errand and prepare its template for scheduling.
+
+    Compiled errands are cached in memory and in .layton/cache/errands/,
+    keyed by path and content hash, so an unchanged errand is only read
+    and hashed, never parsed again.
+
+    Args:
+        name: Errand name
+
+    Returns:
+        CompiledErrand, or None if not found
+    """
+    path = get_errands_dir() / f"{name}.md"
+    try:
+        content = path.read_bytes()
+    except OSError:
+        return None
+    digest = hashlib.sha256(content).hexdigest()
+
+    cached = _compiled.get(path)
+    if cached and cached[0] == digest:
+        return cached[1]
+
+    errand = _load_cached_errand(name, path, digest)
+    if errand is None:
+        # Parse the bytes that were hashed, not a second read of the file
+        result = _parse_errand(name, path, content)
+        if not result:
+            return None
+        info, body = result
+        errand = CompiledErrand(name=name, info=info, body=body)
+        _save_cached_errand(errand, path, digest)
+
+    _compiled[path] = (digest, errand)
+    return errand
+
+
 def get_epic() -> str | None:
     """Get the configured epic ID from config.
 
@@ -266,15 +376,8 @@ def create_epic(name: str = "Background Tasks") -> str:
     if not shutil.which("bd"):
         raise RuntimeError("BD_UNAVAILABLE: bd CLI not found")
 
-    cmd = ["bd", "create", "--title", name, "--type", "epic", "--json"]
-
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        result = run_bd(["create", "--title", name, "--type", "epic", "--json"])
         data = json.loads(result.stdout)
         # bd may return "id" or "number" depending on version
         epic_id = data.get("id") or data.get("number")
@@ -311,39 +414,205 @@ def ensure_epic() -> str:
     return epic_id
 
 
-def get_beads_by_label(label: str, status: str | None = None) -> list[dict]:
-    """Query bd for beads with a specific label.
+# Read-only fast path over the bd JSONL store (opt-in via LAYTON_BEADS_JSONL=1)
+BEADS_JSONL_ENV = "LAYTON_BEADS_JSONL"
+# metadata.json "backend" values whose JSONL export is the authoritative store
+SUPPORTED_BEADS_BACKENDS = {None, "sqlite"}
+_BEAD_REQUIRED_KEYS = {"id", "title", "status"}
+_HIDDEN_STATUSES = {"tombstone", "deleted"}
+
+
+def _get_beads_jsonl_path() -> Path | None:
+    """Locate a JSONL bead store the direct reader understands.
+
+    Returns:
+        Path to the JSONL file, or None if the reader is disabled, the
+        on-disk format is not recognized, or the export is older than the
+        database (caller should fall back to the bd CLI)
+    """
+    if os.environ.get(BEADS_JSONL_ENV) != "1":
+        return None
+
+    beads_dir = get_vault().beads_dir
+    metadata = {}
+    metadata_path = beads_dir / "metadata.json"
+    if metadata_path.exists():
+        try:
+            metadata = json.loads(metadata_path.read_text())
+        except (json.JSONDecodeError, OSError):
+            return None
+        if not isinstance(metadata, dict):
+            return None
+    if metadata.get("backend") not in SUPPORTED_BEADS_BACKENDS:
+        return None
+
+    jsonl_path = beads_dir / metadata.get("jsonl_export", "issues.jsonl")
+    try:
+        jsonl_mtime = jsonl_path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    # bd flushes the export after writes; a newer database means it is stale.
+    # Recent writes may still sit in the SQLite write-ahead log.
+    db_path = beads_dir / metadata.get("database", "beads.db")
+    for path in (db_path, db_path.with_name(db_path.name + "-wal")):
+        try:
+            if path.stat().st_mtime_ns > jsonl_mtime:
+                return None
+        except OSError:
+            pass
+
+    # Recognize the record format from the first record
+    try:
+        with open(jsonl_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if (
+                    not isinstance(record, dict)
+                    or not _BEAD_REQUIRED_KEYS <= record.keys()
+                ):
+                    return None
+                break
+    except (OSError, ValueError):
+        # Unreadable, not UTF-8 or not JSON
+        return None
+
+    return jsonl_path
+
+
+def _raw_needle(value: str) -> str | None:
+    """The JSON string for value as it appears verbatim in the JSONL.
+
+    Encoders differ on non-ASCII, control and HTML characters (raw UTF-8
+    or \\uXXXX escapes), so values containing them get no raw-text
+    prefilter (None) and are only matched on the parsed record.
+    """
+    quoted = json.dumps(value)
+    if "\\" in quoted or any(c in value for c in "<>&"):
+        return None
+    return quoted
+
+
+def iter_beads_jsonl(
+    path: Path,
+    labels: list[str] | None = None,
+    status: str | None = None,
+    include_closed: bool = False,
+    needle: str | None = None,
+) -> Iterator[dict]:
+    """Stream bead records from a JSONL store, filtering as they are read.
+
+    Lines that cannot contain a match (required label or needle missing from
+    the raw text) are skipped without being parsed.
 
     Args:
-        label: Label to filter by (e.g., "scheduled", "needs-review")
-        status: Optional status filter ("open", "closed", etc.)
+        path: JSONL file from _get_beads_jsonl_path()
+        labels: Labels that must all be present
+        status: Exact status to match (like `bd list -s`)
+        include_closed: Include closed beads when no status is given
+            (like `bd list --all`)
+        needle: Value (e.g. a bead ID) every candidate line must contain
+
+    Yields:
+        Bead dicts in the same shape as `bd list --json`
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If a line is not UTF-8 or not JSON (a bead could be
+            missed, so callers fall back to bd)
+    """
+    labels = labels or []
+    candidates = [*labels, needle] if needle is not None else labels
+    quoted = [q for q in map(_raw_needle, candidates) if q is not None]
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not all(q in line for q in quoted):
+                continue
+            bead = json.loads(line)
+
+            bead_status = bead.get("status")
+            if bead_status in _HIDDEN_STATUSES:
+                continue
+            if status is not None:
+                if bead_status != status:
+                    continue
+            elif bead_status == "closed" and not include_closed:
+                continue
+
+            bead_labels = bead.setdefault("labels", [])
+            if not all(label in bead_labels for label in labels):
+                continue
+            yield bead
+
+
+def _read_beads_jsonl(
+    labels: list[str],
+    status: str | None = None,
+    include_closed: bool = False,
+) -> list[dict] | None:
+    """List beads via the JSONL fast path, or None to fall back to bd."""
+    path = _get_beads_jsonl_path()
+    if path is None:
+        return None
+    try:
+        return list(iter_beads_jsonl(path, labels, status, include_closed))
+    except (OSError, ValueError):
+        return None
+
+
+def _bd_list(args: list[str]) -> list[dict]:
+    """Run `bd list <args> --json --limit 0` and parse the bead array.
+
+    Args:
+        args: Filter arguments (e.g. ["-l", "layton", "-s", "open"])
 
     Returns:
         List of bead dicts from bd list, or empty list if bd unavailable/fails
     """
-    if not shutil.which("bd"):
-        return []
+    beads = _try_bd_list(args)
+    return [] if beads is None else beads
 
-    cmd = ["bd", "list", "-l", label, "--json", "--limit", "0"]
-    if status:
-        cmd.extend(["-s", status])
+
+def _try_bd_list(args: list[str]) -> list[dict] | None:
+    """Like _bd_list(), but None if bd is unavailable or fails."""
+    if not shutil.which("bd"):
+        return None
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        result = run_bd(["list", *args, "--json", "--limit", "0"])
         # Parse JSON output (may have warning lines before JSON)
         output = result.stdout
         # Find where JSON array starts
         arr_start = output.find("[")
         if arr_start == -1:
-            return []
-        return json.loads(output[arr_start:])
-    except (subprocess.CalledProcessError, json.JSONDecodeError):
-        return []
+            return None
+        beads = json.loads(output[arr_start:])
+    except (subprocess.CalledProcessError, OSError, json.JSONDecodeError):
+        return None
+    return beads if isinstance(beads, list) else None
+
+
+def get_beads_by_label(label: str, status: str | None = None) -> list[dict]:
+    """Query bd for beads with a specific label.
+
+    Args:
+        label: Label to filter by (e.g., "scheduled", "needs-review")
+        status: Optional status filter ("open", "closed", etc.)
+
+    Returns:
+        List of bead dicts from bd list, or empty list if bd unavailable/fails
+    """
+    beads = _read_beads_jsonl(label.split(","), status=status)
+    if beads is not None:
+        return beads
+
+    args = ["-l", label]
+    if status:
+        args.extend(["-s", status])
+    return _bd_list(args)
 
 
 def get_beads_pending_review() -> list[dict]:
@@ -373,18 +642,158 @@ def get_beads_in_progress() -> list[dict]:
     return get_beads_by_label(f"layton,{LABEL_IN_PROGRESS}", status="open")
 
 
-def schedule_errand(name: str, variables: dict[str, str] | None = None) -> dict:
+@dataclass
+class QueueSnapshot:
+    """Errand queue states from a single bd round-trip."""
+
+    scheduled: list[dict] = field(default_factory=list)
+    in_progress: list[dict] = field(default_factory=list)
+    pending_review: list[dict] = field(default_factory=list)
+    # bd was unavailable or failed: the empty queues are not real
+    failed: bool = False
+
+    def to_dict(self, budget: "QueueBudget | None" = None) -> dict:
+        """Serialize the queues, slimmed to the budget if one is given.
+
+        With an active budget, a "truncated" entry maps each queue name to
+        the number of beads left out.
+        """
+        if budget is None or not budget.active:
+            return {
+                "scheduled": self.scheduled,
+                "in_progress": self.in_progress,
+                "pending_review": self.pending_review,
+            }
+
+        result = {}
+        truncated = {}
+        for name in QUEUE_NAMES:
+            result[name], truncated[name] = apply_budget(getattr(self, name), budget)
+        result["truncated"] = truncated
+        return result
+
+
+QUEUE_NAMES = ("scheduled", "in_progress", "pending_review")
+
+
+@dataclass
+class QueueBudget:
+    """Size budget for the bead lists in queue output.
+
+    Attributes:
+        fields: Bead keys to keep (None keeps every key)
+        max_items: Maximum beads per queue (None for no limit)
+        max_bytes: Maximum compact-JSON size of each queue list
+    """
+
+    fields: list[str] | None = None
+    max_items: int | None = None
+    max_bytes: int | None = None
+
+    @property
+    def active(self) -> bool:
+        return (
+            self.fields is not None
+            or self.max_items is not None
+            or self.max_bytes is not None
+        )
+
+
+def project_bead(bead: dict, fields: list[str]) -> dict:
+    """Keep only the given keys of a bead (in the order of fields)."""
+    return {key: bead[key] for key in fields if key in bead}
+
+
+def apply_budget(beads: list[dict], budget: QueueBudget) -> tuple[list[dict], int]:
+    """Project and truncate a bead list to a budget.
+
+    Beads are kept in order until max_items or max_bytes would be exceeded.
+
+    Args:
+        beads: Bead dicts
+        budget: Output budget
+
+    Returns:
+        Tuple of (kept beads, number of beads left out)
+    """
+    kept: list[dict] = []
+    size = len("[]")
+    for bead in beads:
+        if budget.max_items is not None and len(kept) >= budget.max_items:
+            break
+        if budget.fields is not None:
+            bead = project_bead(bead, budget.fields)
+        if budget.max_bytes is not None:
+            size += len(json.dumps(bead, separators=(",", ":")).encode())
+            size += 1 if kept else 0  # comma
+            if size > budget.max_bytes:
+                break
+        kept.append(bead)
+    return kept, len(beads) - len(kept)
+
+
+def partition_queue(beads: list[dict]) -> QueueSnapshot:
+    """Partition Layton beads into queue states client-side.
+
+    Mirrors the filters of get_beads_scheduled(), get_beads_in_progress()
+    and get_beads_pending_review(), preserving bd's ordering within each list.
+
+    Args:
+        beads: Bead dicts (e.g. from `bd list -l layton --all`)
+
+    Returns:
+        QueueSnapshot with the three queue lists
+    """
+    snapshot = QueueSnapshot()
+    for bead in beads:
+        labels = bead.get("labels") or []
+        if "layton" not in labels:
+            continue
+        status = bead.get("status")
+        if status == "open":
+            if LABEL_SCHEDULED in labels:
+                snapshot.scheduled.append(bead)
+            if LABEL_IN_PROGRESS in labels:
+                snapshot.in_progress.append(bead)
+        elif status == "closed" and LABEL_NEEDS_REVIEW in labels:
+            snapshot.pending_review.append(bead)
+    return snapshot
+
+
+def get_queue_snapshot() -> QueueSnapshot:
+    """Fetch all three errand queues with one `bd list` call.
+
+    Returns:
+        QueueSnapshot (empty lists and failed=True if bd unavailable/fails)
+    """
+    beads = _read_beads_jsonl(["layton"], include_closed=True)
+    if beads is None:
+        beads = _try_bd_list(["-l", "layton", "--all"])
+    if beads is None:
+        return QueueSnapshot(failed=True)
+    return partition_queue(beads)
+
+
+def schedule_errand(
+    name: str,
+    variables: dict[str, str] | None = None,
+    strict: bool = False,
+) -> tuple[dict, list[str]]:
     """Schedule an errand for execution.
 
     Args:
         name: Errand name
         variables: Variables to substitute (using string.Template)
+        strict: Reject variables that do not match the errand's placeholders
+            (see check_variables) instead of scheduling anyway
 
     Returns:
-        Dict with scheduled bead info or error
+        Tuple of (scheduled bead dict, variable warnings from
+        check_variables; always empty when strict)
 
     Raises:
         FileNotFoundError: If errand not found (code: ERRAND_NOT_FOUND)
+        ValueError: If strict and variables mismatch (code: INVALID_VARIABLES)
         RuntimeError: If bd CLI unavailable (code: BD_UNAVAILABLE)
         RuntimeError: If no epic configured (code: NO_EPIC)
         RuntimeError: If bd create fails (code: BD_ERROR)
@@ -398,30 +807,245 @@ def schedule_errand(name: str, variables: dict[str, str] | None = None) -> dict:
     if not epic:
         raise RuntimeError("NO_EPIC: Epic not configured")
 
-    # Load errand
-    result = load_errand(name)
-    if not result:
+    errand = compile_errand(name)
+    if not errand:
         raise FileNotFoundError(f"ERRAND_NOT_FOUND: {name}")
 
-    info, body = result
     variables = variables or {}
+    problems = check_variables(errand, variables)
+    if strict and problems:
+        raise ValueError(f"INVALID_VARIABLES: {'; '.join(problems)}")
+
+    return schedule_compiled(errand, epic, variables), problems
+
+
+def check_variables(errand: CompiledErrand, variables: dict) -> list[str]:
+    """Compare variables with an errand's placeholders.
+
+    Uses the placeholder set computed when the errand was compiled, so the
+    cost is O(placeholders + variables) and nothing is rendered.
+
+    Returns:
+        One message per placeholder without a value (it would stay in the
+        bead as ${name}) and per variable without a placeholder
+    """
+    missing = sorted(errand.placeholders.difference(variables))
+    extra = sorted(set(variables).difference(errand.placeholders))
+    return [
+        *(
+            f"Missing variable '{name}' (${{{name}}} stays unfilled)"
+            for name in missing
+        ),
+        *(f"Unused variable '{name}' (no ${{{name}}} in the errand)" for name in extra),
+    ]
+
+
+def lint_errands() -> list[dict]:
+    """Check every errand in .layton/errands/ in one pass.
 
-    # Substitute variables using string.Template (safe_substitute leaves missing vars as-is)
-    template = Template(body)
-    rendered_body = template.safe_substitute(variables)
+    Each errand's placeholders are compared with the variables declared in
+    its frontmatter, and the body is checked for malformed `$` placeholders.
+
+    Returns:
+        One {"name", "path", "issues"} dict per errand file, sorted by name
+    """
+    errands_dir = get_errands_dir()
+    if not errands_dir.is_dir():
+        return []
 
-    # Build title from errand name
-    title = f"[{name}] {info.description}" if info.description else f"[{name}]"
+    results = []
+    for path in sorted(errands_dir.glob("*.md")):
+        errand = compile_errand(path.stem)
+        issues = []
+        if errand is None:
+            issues.append("Missing YAML frontmatter")
+        else:
+            if not errand.template.is_valid():
+                issues.append("Malformed placeholder (use ${name}; write $$ for a $)")
+            declared = errand.info.variables
+            declared = set(declared) if isinstance(declared, dict) else set()
+            issues.extend(
+                f"Variable '{name}' is used but not declared"
+                for name in sorted(errand.placeholders - declared)
+            )
+            issues.extend(
+                f"Variable '{name}' is declared but never used"
+                for name in sorted(declared - errand.placeholders)
+            )
+        results.append({"name": path.stem, "path": str(path), "issues": issues})
+    return results
+
+
+def schedule_compiled(
+    errand: CompiledErrand, epic: str, variables: dict[str, str]
+) -> dict:
+    """Create the scheduled bead for a compiled errand.
 
-    # Create bead via bd
+    Raises:
+        RuntimeError: If bd create fails (code: BD_ERROR)
+    """
     return bd_create(
-        title=title,
+        title=errand.title,
         parent=epic,
-        labels=["layton", LABEL_SCHEDULED, f"type:{name}"],
-        description=rendered_body,
+        labels=["layton", LABEL_SCHEDULED, f"type:{errand.name}"],
+        description=errand.render(variables),
     )
 
 
+@dataclass
+class ScheduleRequest:
+    """One record of `errands schedule-many` input."""
+
+    id: Any
+    name: str
+    variables: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class ScheduleResult:
+    """Outcome of one schedule_many() request."""
+
+    request: ScheduleRequest
+    bead: dict | None = None
+    # "CODE: message" (ERRAND_NOT_FOUND, INVALID_VARIABLES, BD_ERROR)
+    error: str | None = None
+    warnings: list[str] = field(default_factory=list)
+
+
+def parse_schedule_request(line: str, index: int) -> ScheduleRequest:
+    """Parse one `{"name": ..., "variables": {...}, "id": ...}` NDJSON line.
+
+    Args:
+        line: NDJSON line
+        index: 0-based position in the stream (default id)
+
+    Raises:
+        ValueError: If the line is not a valid request
+    """
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON: {e}") from e
+    # Every malformed record is a ValueError (reported as INVALID_REQUEST)
+    if not isinstance(record, dict):
+        raise ValueError("Request must be an object")  # noqa: TRY004
+
+    name = record.get("name")
+    variables = record.get("variables", {})
+    if not isinstance(name, str) or not name:
+        raise ValueError("Request needs an errand name")
+    if not isinstance(variables, dict):
+        raise ValueError("variables must be an object")  # noqa: TRY004
+    return ScheduleRequest(id=record.get("id", index), name=name, variables=variables)
+
+
+def expand_matrix(
+    matrix: dict, base: dict[str, str] | None = None
+) -> list[dict[str, str]]:
+    """Expand a variable matrix into the cartesian product of variable sets.
+
+    Args:
+        matrix: Variable name -> list of values (a scalar is one value)
+        base: Variables shared by every combination (matrix values win)
+
+    Returns:
+        One variables dict per combination, in matrix key order
+        (the last key varies fastest)
+
+    Raises:
+        ValueError: If the matrix is malformed or too large (code: INVALID_MATRIX)
+    """
+    if not isinstance(matrix, dict) or not matrix:
+        raise ValueError("INVALID_MATRIX: Matrix must be a non-empty JSON object")
+
+    axes = []
+    for key, values in matrix.items():
+        values = values if isinstance(values, list) else [values]
+        if not values:
+            raise ValueError(f"INVALID_MATRIX: No values for '{key}'")
+        axes.append(values)
+
+    count = math.prod(len(values) for values in axes)
+    if count > MAX_MATRIX_COMBINATIONS:
+        raise ValueError(
+            f"INVALID_MATRIX: Matrix expands to {count} combinations "
+            f"(max {MAX_MATRIX_COMBINATIONS})"
+        )
+
+    base = base or {}
+    return [
+        {**base, **dict(zip(matrix, combination, strict=True))}
+        for combination in itertools.product(*axes)
+    ]
+
+
+def schedule_many(
+    requests: list[ScheduleRequest],
+    max_workers: int | None = None,
+    compiled: dict[str, CompiledErrand | None] | None = None,
+    strict: bool = False,
+) -> Iterator[ScheduleResult]:
+    """Schedule many errands: each errand compiled once, beads created concurrently.
+
+    Variables are checked against each errand's placeholders before its
+    bead is created: mismatches are warnings, or with strict, errors.
+
+    Args:
+        requests: Errands to schedule
+        max_workers: bd concurrency cap (defaults to LAYTON_BD_CONCURRENCY)
+        compiled: Errands the caller already compiled, by name (filled in
+            with the ones compiled here)
+        strict: Reject requests whose variables mismatch (INVALID_VARIABLES)
+
+    Returns:
+        Iterator of ScheduleResult in completion order
+
+    Raises:
+        RuntimeError: If bd CLI unavailable (code: BD_UNAVAILABLE)
+        RuntimeError: If no epic configured (code: NO_EPIC)
+    """
+    if not shutil.which("bd"):
+        raise RuntimeError("BD_UNAVAILABLE: bd CLI not found")
+    epic = get_epic()
+    if not epic:
+        raise RuntimeError("NO_EPIC: Epic not configured")
+
+    compiled = {} if compiled is None else compiled
+    tasks = {}
+    for index, request in enumerate(requests):
+        if request.name not in compiled:
+            compiled[request.name] = compile_errand(request.name)
+        tasks[str(index)] = functools.partial(
+            _schedule_one, compiled[request.name], epic, request, strict
+        )
+
+    for _, result in iter_completed(tasks, max_workers=max_workers):
+        yield result
+
+
+def _schedule_one(
+    errand: CompiledErrand | None,
+    epic: str,
+    request: ScheduleRequest,
+    strict: bool,
+) -> ScheduleResult:
+    if errand is None:
+        return ScheduleResult(
+            request, error=f"ERRAND_NOT_FOUND: Errand '{request.name}' not found"
+        )
+
+    problems = check_variables(errand, request.variables)
+    if strict and problems:
+        return ScheduleResult(
+            request, error=f"INVALID_VARIABLES: {'; '.join(problems)}"
+        )
+    try:
+        bead = schedule_compiled(errand, epic, request.variables)
+    except RuntimeError as e:
+        return ScheduleResult(request, error=str(e))
+    return ScheduleResult(request, bead=bead, warnings=problems)
+
+
 def get_bead(bead_id: str) -> dict | None:
     """Fetch a single bead by ID via bd show.
 
@@ -431,16 +1055,22 @@ def get_bead(bead_id: str) -> dict | None:
     Returns:
         Bead dict or None if not found / bd unavailable
     """
+    path = _get_beads_jsonl_path()
+    if path is not None:
+        try:
+            for bead in iter_beads_jsonl(path, include_closed=True, needle=bead_id):
+                if bead.get("id") == bead_id:
+                    return bead
+        except (OSError, ValueError):
+            pass
+        else:
+            return None
+
     if not shutil.which("bd"):
         return None
 
     try:
-        result = subprocess.run(
-            ["bd", "show", bead_id, "--json"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        result = run_bd(["show", bead_id, "--json"])
         output = result.stdout
         # bd show --json returns an array with one element
         arr_start = output.find("[")
@@ -472,12 +1102,7 @@ def get_bead_comments(bead_id: str) -> str:
         return ""
 
     try:
-        result = subprocess.run(
-            ["bd", "comments", bead_id],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        result = run_bd(["comments", bead_id])
         text = result.stdout.strip()
         # Filter out bd warning/note lines and check for "no comments" sentinel
         lines = [
@@ -508,18 +1133,8 @@ def _transition_to_in_progress(bead_id: str) -> bool:
         return False
 
     try:
-        subprocess.run(
-            ["bd", "label", "remove", bead_id, LABEL_SCHEDULED],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        subprocess.run(
-            ["bd", "label", "add", bead_id, LABEL_IN_PROGRESS],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        run_bd(["label", "remove", bead_id, LABEL_SCHEDULED])
+        run_bd(["label", "add", bead_id, LABEL_IN_PROGRESS])
         return True
     except subprocess.CalledProcessError:
         return False
@@ -532,13 +1147,22 @@ def build_prompt(bead_id: str) -> str | None:
     prompt that a subagent can follow to execute the errand.
     Transitions the bead from scheduled to in-progress (best-effort).
 
+    The two reads (bead and comments) run concurrently. The transition is
+    a write, so it only runs once both reads are done and the bead exists.
+
     Args:
         bead_id: The bead ID
 
     Returns:
         Execution prompt string, or None if bead not found
     """
-    bead = get_bead(bead_id)
+    results = run_concurrently(
+        {
+            "bead": lambda: get_bead(bead_id),
+            "comments": lambda: get_bead_comments(bead_id),
+        }
+    )
+    bead = results["bead"]
     if not bead:
         return None
 
@@ -546,7 +1170,7 @@ def build_prompt(bead_id: str) -> str | None:
 
     title = bead.get("title", "Untitled")
     description = bead.get("description", "")
-    comments = get_bead_comments(bead_id)
+    comments = results["comments"]
 
     parts = [f"# Errand: {bead_id} — {title}", "", description]
 
@@ -605,21 +1229,15 @@ def bd_create(
     Raises:
         RuntimeError: If bd create fails (code: BD_ERROR)
     """
-    cmd = ["bd", "create", "--title", title, "--parent", parent, "--json"]
+    args = ["create", "--title", title, "--parent", parent, "--json"]
 
     if labels:
-        cmd.extend(["--labels", ",".join(labels)])
+        args.extend(["--labels", ",".join(labels)])
 
-    cmd.extend(["--description", description])
+    args.extend(["--description", description])
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-            stdin=subprocess.DEVNULL,
-        )
+        result = run_bd(args, stdin=subprocess.DEVNULL)
         # Parse bd output - typically returns JSON with bead ID
         try:
             return json.loads(result.stdout)
@@ -0,0 +1,123 @@
+"""Concurrent execution of independent bd invocations.
+
+Each bd call is a separate process that mostly waits on I/O, so independent
+calls (e.g. `bd version` and `bd list` during orientation) can overlap in a
+small thread pool. The caller then waits only for the slowest call instead of
+the sum of all of them.
+
+Set LAYTON_BD_CONCURRENCY to cap the number of bd processes in flight
+(1 disables concurrency entirely).
+
+iter_completed() is the deadline-bounded variant: tasks run in daemon
+threads, so a hung bd call never keeps the process alive after the caller
+has stopped waiting for it.
+"""
+
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+DEFAULT_MAX_WORKERS = 4
+
+
+def get_max_workers() -> int:
+    """Get the concurrency cap from LAYTON_BD_CONCURRENCY (default 4)."""
+    value = os.environ.get("LAYTON_BD_CONCURRENCY")
+    if not value:
+        return DEFAULT_MAX_WORKERS
+    try:
+        return max(1, int(value))
+    except ValueError:
+        return DEFAULT_MAX_WORKERS
+
+
+def run_concurrently(
+    tasks: dict[str, Callable[[], Any]],
+    max_workers: int | None = None,
+) -> dict[str, Any]:
+    """Run independent zero-argument callables concurrently.
+
+    Args:
+        tasks: Mapping of result key to callable
+        max_workers: Concurrency cap (defaults to get_max_workers())
+
+    Returns:
+        Mapping of result key to return value, in the order of `tasks`
+
+    Raises:
+        Exception: The first exception raised by a task (in `tasks` order),
+            after all tasks have finished
+    """
+    workers = min(max_workers or get_max_workers(), len(tasks))
+    if workers <= 1:
+        return {key: task() for key, task in tasks.items()}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {key: pool.submit(task) for key, task in tasks.items()}
+    return {key: future.result() for key, future in futures.items()}
+
+
+def iter_completed(
+    tasks: dict[str, Callable[[], Any]],
+    timeout: float | None = None,
+    max_workers: int | None = None,
+) -> Iterator[tuple[str, Any]]:
+    """Start tasks in daemon threads and yield results as they complete.
+
+    Threads start immediately (before the first next()), so the caller can
+    do other work while the tasks run.
+
+    Args:
+        tasks: Mapping of result key to callable
+        timeout: Seconds from now after which iteration stops, even if some
+            tasks are still running (None waits for all)
+        max_workers: Concurrency cap (defaults to get_max_workers())
+
+    Returns:
+        Iterator of (key, result) in completion order. Tasks that have not
+        finished by the deadline are simply not yielded.
+
+    Raises:
+        Exception: A task's exception, when its result would be yielded
+    """
+    pending: queue.SimpleQueue = queue.SimpleQueue()
+    results: queue.SimpleQueue = queue.SimpleQueue()
+    for item in tasks.items():
+        pending.put(item)
+
+    def worker() -> None:
+        while True:
+            try:
+                key, task = pending.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                results.put((key, task(), None))
+            except Exception as e:  # noqa: BLE001 - re-raised by the caller
+                results.put((key, None, e))
+
+    workers = max(1, min(max_workers or get_max_workers(), len(tasks)))
+    for _ in range(workers if tasks else 0):
+        threading.Thread(target=worker, daemon=True).start()
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    return _drain(results, len(tasks), deadline)
+
+
+def _drain(
+    results: queue.SimpleQueue, count: int, deadline: float | None
+) -> Iterator[tuple[str, Any]]:
+    """Yield up to count results from the queue until the deadline."""
+    for _ in range(count):
+        wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            key, value, error = results.get(timeout=wait)
+        except queue.Empty:
+            return
+        if error is not None:
+            raise error
+        yield key, value
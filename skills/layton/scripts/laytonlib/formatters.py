@@ -2,13 +2,109 @@
 
 JSON is the default output format (agent-first design).
 Use --human flag for human-readable output.
+
+--format selects the machine encoding:
+- json: indented JSON (default)
+- compact: JSON without whitespace, one document per line (uses orjson when
+  installed); `ndjson` is accepted as an alias
+- msgpack: MessagePack bytes (requires the msgpack package)
+
+Each response is written with a single write call.
 """
 
 import json
 import sys
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
+from laytonlib import timing
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+FORMATS = ("json", "compact", "msgpack")
+
+# Alternative --format names
+FORMAT_ALIASES = {"ndjson": "compact"}
+
+
+def parse_format(value: str) -> str:
+    """argparse type: resolve a --format alias to its canonical name."""
+    return FORMAT_ALIASES.get(value, value)
+
+
+def msgpack_available() -> bool:
+    """Check whether the msgpack package can be imported."""
+    try:
+        import msgpack  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def encode_json_line(response: dict[str, Any]) -> str:
+    """Encode a response as a single line of compact JSON (with newline)."""
+    if orjson is not None:
+        return orjson.dumps(response, option=orjson.OPT_APPEND_NEWLINE).decode()
+    return json.dumps(response, separators=(",", ":"), ensure_ascii=False) + "\n"
+
+
+def encode_response(response: dict[str, Any], fmt: str = "json") -> str | bytes:
+    """Encode a response in one of FORMATS.
+
+    Args:
+        response: Response dict
+        fmt: Output format
+
+    Returns:
+        Text for the JSON formats, bytes for msgpack
+
+    Raises:
+        ImportError: If fmt is msgpack and msgpack is not installed
+    """
+    if fmt == "msgpack":
+        import msgpack
+
+        return msgpack.packb(response, default=str)
+    if fmt == "compact":
+        return encode_json_line(response)
+    return json.dumps(response, indent=2) + "\n"
+
+
+def append_field(
+    encoded: str | bytes, key: str, value: Any, fmt: str = "json"
+) -> str | bytes:
+    """Add a last top-level field to an encoded response without re-encoding it.
+
+    The result is what encode_response() gives for the response with the
+    field added.
+
+    Args:
+        encoded: Output of encode_response() (an object with a few fields)
+        key: Field name
+        value: Field value
+        fmt: Format the response was encoded in
+    """
+    if fmt == "msgpack":
+        import msgpack
+
+        # Responses are small maps: fixmap header byte 0x80 | field count
+        size = encoded[0] & 0x0F
+        return (
+            bytes([0x80 | (size + 1)])
+            + encoded[1:]
+            + msgpack.packb(key)
+            + msgpack.packb(value, default=str)
+        )
+    if fmt == "compact":
+        # '{...}\n' + '{"key":value}\n' -> '{...,"key":value}\n'
+        return encoded[:-2] + "," + encode_json_line({key: value})[1:]
+    # '{\n...\n}\n' + '{\n  "key": value\n}' -> '{\n...,\n  "key": value\n}\n'
+    return encoded[:-3] + ",\n" + json.dumps({key: value}, indent=2)[2:] + "\n"
+
 
 @dataclass
 class OutputFormatter:
@@ -17,10 +113,15 @@ class OutputFormatter:
     Both formats apply the same compact logic:
     - All checks pass → show summary only
     - Any check fails or --verbose → show full details
+
+    If `sink` is set, JSON responses are passed to it as dicts instead of
+    being printed (used by `layton batch`).
     """
 
     human: bool = False
     verbose: bool = False
+    format: str = "json"
+    sink: Callable[[dict[str, Any]], None] | None = None
     _debug_info: dict[str, Any] = field(default_factory=dict)
 
     def add_debug(self, key: str, value: Any) -> None:
@@ -81,9 +182,50 @@ class OutputFormatter:
             "data": data,
             "next_steps": next_steps or [],
         }
-        if self.verbose and self._debug_info:
-            response["debug"] = self._debug_info
-        print(json.dumps(response, indent=2))
+        self._emit(response)
+
+    def _emit(self, response: dict[str, Any]) -> None:
+        """Print a JSON response (with debug info if verbose), or hand it to the sink."""
+        if self.verbose and timing.enabled() and self.sink is None:
+            # Time the real encode, then append the report to its output
+            with timing.span("serialize", format=self.format):
+                encoded = encode_response(response, self.format)
+            self._debug_info["timings"] = timing.report()
+            self._write(append_field(encoded, "debug", self._debug_info, self.format))
+            return
+
+        if self.verbose:
+            if timing.enabled():
+                self._debug_info["timings"] = timing.report()
+            if self._debug_info:
+                response["debug"] = self._debug_info
+        if self.sink is not None:
+            self.sink(response)
+            return
+        self._write(encode_response(response, self.format))
+
+    def _write(self, encoded: str | bytes) -> None:
+        """Write an encoded response with a single write call."""
+        if isinstance(encoded, bytes):
+            sys.stdout.flush()
+            sys.stdout.buffer.write(encoded)
+            sys.stdout.buffer.flush()
+        else:
+            sys.stdout.write(encoded)
+
+    def record(self, record: dict[str, Any]) -> None:
+        """Write one NDJSON record immediately (used by --stream).
+
+        Compact logic is applied to the record's data. Records always use
+        the NDJSON encoding, regardless of --human / --format.
+        """
+        if "data" in record:
+            record = {**record, "data": self._compact_data(record["data"])}
+        if self.sink is not None:
+            self.sink(record)
+            return
+        sys.stdout.write(encode_json_line(record))
+        sys.stdout.flush()
 
     def _render_human_success(
         self,
@@ -91,53 +233,57 @@ class OutputFormatter:
         next_steps: list[str] | None,
     ) -> None:
         """Render success as human-readable text."""
+        lines: list[str] = []
         for key, value in data.items():
-            self._print_data_item(key, value)
+            self._format_data_item(lines, key, value)
 
         if next_steps:
-            print()
-            print("Next steps:")
+            lines.append("")
+            lines.append("Next steps:")
             for step in next_steps:
-                print(f"  - {step}")
+                lines.append(f"  - {step}")
 
-    def _print_data_item(self, key: str, value: Any) -> None:
-        """Print a single data item in human-readable format."""
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+
+    def _format_data_item(self, lines: list[str], key: str, value: Any) -> None:
+        """Append a single data item in human-readable format to lines."""
         # Special handling for compact checks summary
         if key == "checks" and isinstance(value, dict) and "summary" in value:
-            print(f"✓ {value['summary']}")
-            print()
+            lines.append(f"✓ {value['summary']}")
+            lines.append("")
             return
 
         # Special handling for expanded checks list
         if key == "checks" and isinstance(value, list):
-            print("checks:")
+            lines.append("checks:")
             for check in value:
                 status = check.get("status", "unknown")
                 name = check.get("name", "unknown")
                 message = check.get("message", "")
                 icon = "✓" if status == "pass" else ("⚠" if status == "warn" else "✗")
-                print(f"  {icon} {name}: {message}")
-            print()
+                lines.append(f"  {icon} {name}: {message}")
+            lines.append("")
             return
 
         # Generic handling
         if isinstance(value, dict):
-            print(f"{key}:")
+            lines.append(f"{key}:")
             for k, v in value.items():
-                print(f"  {k}: {v}")
+                lines.append(f"  {k}: {v}")
         elif isinstance(value, list):
             if not value:
                 return  # Skip empty lists
-            print(f"{key}:")
+            lines.append(f"{key}:")
             for item in value:
                 if isinstance(item, dict):
                     for k, v in item.items():
-                        print(f"  {k}: {v}")
-                    print()
+                        lines.append(f"  {k}: {v}")
+                    lines.append("")
                 else:
-                    print(f"  - {item}")
+                    lines.append(f"  - {item}")
         else:
-            print(f"{key}: {value}")
+            lines.append(f"{key}: {value}")
 
     def error(
         self,
@@ -166,9 +312,7 @@ class OutputFormatter:
             },
             "next_steps": next_steps or [],
         }
-        if self.verbose and self._debug_info:
-            response["debug"] = self._debug_info
-        print(json.dumps(response, indent=2))
+        self._emit(response)
 
     def _render_human_error(
         self,
@@ -177,10 +321,8 @@ class OutputFormatter:
         next_steps: list[str] | None,
     ) -> None:
         """Render error as human-readable text."""
-        print(f"Error [{code}]: {message}", file=sys.stderr)
+        sys.stderr.write(f"Error [{code}]: {message}\n")
 
         if next_steps:
-            print()
-            print("To fix:")
-            for step in next_steps:
-                print(f"  - {step}")
+            lines = ["", "To fix:", *(f"  - {step}" for step in next_steps)]
+            sys.stdout.write("\n".join(lines) + "\n")
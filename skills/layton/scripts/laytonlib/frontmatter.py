@@ -0,0 +1,177 @@
+"""Shared frontmatter reader for rolodex cards, protocols and errands.
+
+Frontmatter is a small YAML subset between `---` lines at the top of a
+markdown file:
+
+    ---
+    name: code-review
+    description: Review a file
+    triggers:
+      - review code
+    variables:
+      file_path: The file to review
+    ---
+
+Supported forms are `key: value` strings, `key:` followed by `- item` lines
+(list), and `key:` followed by indented `sub: value` lines (mapping).
+Blank lines and `#` comments are ignored.
+
+read_frontmatter() streams a file and stops at the closing `---`, so the
+cost of listing files is proportional to their headers, not their bodies.
+The body is read lazily from the recorded byte offset.
+"""
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+FENCE = "---"
+
+# Leading whitespace-only lines between the closing fence and the body
+_LEADING_BLANK_LINES = re.compile(r"^\s*\n")
+
+
+@dataclass
+class Frontmatter:
+    """Parsed frontmatter plus a lazy handle to the body."""
+
+    data: dict
+    path: Path
+    body_offset: int
+
+    def read_body(self) -> str:
+        """Read the markdown body (everything after the closing fence).
+
+        Line endings are normalized (CRLF to LF) and leading blank lines are
+        dropped.
+        """
+        with open(self.path, "rb") as f:
+            f.seek(self.body_offset)
+            body = f.read().decode("utf-8")
+        return _clean_body(body)
+
+
+def _clean_body(body: str) -> str:
+    # Universal newlines, as Path.read_text() gives (Windows-saved files)
+    body = body.replace("\r\n", "\n").replace("\r", "\n")
+    return _LEADING_BLANK_LINES.sub("", body, count=1)
+
+
+def parse_frontmatter_lines(lines: Iterable[str]) -> dict | None:
+    """Parse frontmatter lines (without the fences).
+
+    Args:
+        lines: Lines between the opening and closing `---`
+
+    Returns:
+        Dict of frontmatter fields, or None if empty. List blocks become
+        lists, indented `sub: value` blocks become dicts.
+    """
+    result = {}
+    block_key = None
+
+    for line in lines:
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+
+        indented = line[:1] in (" ", "\t")
+
+        # List item under the current block key
+        if stripped.startswith("- ") and block_key:
+            block = result.setdefault(block_key, [])
+            if isinstance(block, list):
+                block.append(stripped[2:].strip())
+            continue
+
+        if ":" not in stripped:
+            continue
+
+        key, _, value = stripped.partition(":")
+        key = key.strip()
+        value = value.strip()
+
+        # Nested mapping entry under the current block key
+        if indented and block_key:
+            block = result.setdefault(block_key, {})
+            if isinstance(block, dict):
+                block[key] = value
+            continue
+
+        # Top-level key: value, or the start of a block
+        if value:
+            result[key] = value
+            block_key = None
+        else:
+            block_key = key
+
+    return result if result else None
+
+
+def parse_frontmatter(content: str) -> dict | None:
+    """Parse frontmatter from markdown content.
+
+    Args:
+        content: Markdown file content
+
+    Returns:
+        Dict of frontmatter fields, or None if no valid frontmatter
+    """
+    split = split_frontmatter(content)
+    return split[0] if split else None
+
+
+def split_frontmatter(content: str) -> tuple[dict, str] | None:
+    """Split markdown content into frontmatter and body.
+
+    Args:
+        content: Markdown file content
+
+    Returns:
+        Tuple of (frontmatter fields, body), or None if no valid, non-empty
+        frontmatter. The body is the same as Frontmatter.read_body() gives.
+    """
+    lines = content.split("\n")
+    if not lines or lines[0].rstrip() != FENCE:
+        return None
+
+    for end, line in enumerate(lines[1:], start=1):
+        if line.rstrip() == FENCE:
+            data = parse_frontmatter_lines(lines[1:end])
+            if data is None:
+                return None
+            return data, _clean_body("\n".join(lines[end + 1 :]))
+    return None
+
+
+def read_frontmatter(path: Path) -> Frontmatter | None:
+    """Read only the frontmatter of a markdown file.
+
+    Args:
+        path: Markdown file
+
+    Returns:
+        Frontmatter (data + body offset), or None if the file has no
+        valid, non-empty frontmatter
+
+    Raises:
+        OSError: If the file cannot be read
+        UnicodeDecodeError: If the header is not valid UTF-8
+    """
+    with open(path, "rb") as f:
+        if f.readline().decode("utf-8").rstrip() != FENCE:
+            return None
+
+        lines = []
+        for raw in iter(f.readline, b""):
+            line = raw.decode("utf-8")
+            if line.rstrip() == FENCE:
+                data = parse_frontmatter_lines(lines)
+                if data is None:
+                    return None
+                return Frontmatter(data=data, path=path, body_offset=f.tell())
+            lines.append(line.rstrip("\r\n"))
+
+    # No closing fence
+    return None
@@ -0,0 +1,136 @@
+"""Persistent frontmatter index for markdown directories.
+
+Listing rolodex cards, protocols and errands only needs each file's
+frontmatter. The parsed frontmatter is stored in .layton/cache/index.json,
+keyed by directory, file name, mtime and size, so a listing only re-reads
+the headers of files that changed since the last run.
+
+Files modified within the last couple of seconds are never cached: a second
+write in the same mtime tick with the same size would otherwise go unnoticed.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+from laytonlib import __version__
+from laytonlib.config import RACY_WINDOW_NS, get_cache_dir
+from laytonlib.frontmatter import read_frontmatter
+from laytonlib.timing import span
+
+INDEX_FILENAME = "index.json"
+INDEX_FORMAT = 2
+
+# In-memory copy of the on-disk index, keyed by index path
+_loaded: dict[Path, dict] = {}
+
+
+def _empty_index() -> dict:
+    return {"format": INDEX_FORMAT, "version": __version__, "dirs": {}}
+
+
+def _load_index(index_path: Path) -> dict:
+    """Load the index (once per process), discarding incompatible files."""
+    if index_path in _loaded:
+        return _loaded[index_path]
+
+    index = _empty_index()
+    try:
+        with open(index_path) as f:
+            data = json.load(f)
+        if (
+            isinstance(data, dict)
+            and data.get("format") == INDEX_FORMAT
+            and data.get("version") == __version__
+            and isinstance(data.get("dirs"), dict)
+        ):
+            index = data
+    except (OSError, json.JSONDecodeError):
+        pass
+
+    _loaded[index_path] = index
+    return index
+
+
+def _save_index(index_path: Path, index: dict) -> None:
+    """Write the index atomically (best-effort)."""
+    cache_dir = get_cache_dir(create=True)
+    if not cache_dir.is_dir():
+        return
+    tmp_path = index_path.with_name(f".{index_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(index, f, separators=(",", ":"))
+        os.replace(tmp_path, index_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def scan_frontmatter(directory: Path) -> list[tuple[Path, dict]]:
+    """Read frontmatter of every *.md file in a directory, via the index.
+
+    Args:
+        directory: Directory to scan
+
+    Returns:
+        List of (path, frontmatter) for files with frontmatter, in glob order.
+        Unreadable files are skipped.
+    """
+    if not directory.exists():
+        return []
+
+    with span("scan", dir=str(directory)):
+        return _scan(directory)
+
+
+def _scan(directory: Path) -> list[tuple[Path, dict]]:
+    index_path = get_cache_dir() / INDEX_FILENAME
+    index = _load_index(index_path)
+    dir_key = str(directory.resolve())
+    cached = index["dirs"].get(dir_key, {})
+
+    entries = {}
+    results = []
+    dirty = False
+    racy_after = time.time_ns() - RACY_WINDOW_NS
+
+    for path in directory.glob("*.md"):
+        if path.name == ".gitkeep":
+            continue
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+
+        entry = cached.get(path.name)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            frontmatter = entry[2]
+        else:
+            try:
+                header = read_frontmatter(path)
+            except (OSError, UnicodeDecodeError):
+                # Skip files that can't be read
+                continue
+            frontmatter = header.data if header else None
+            entry = [st.st_mtime_ns, st.st_size, frontmatter]
+            if st.st_mtime_ns < racy_after:
+                dirty = True
+            else:
+                entry = None
+
+        if entry is not None:
+            entries[path.name] = entry
+        if frontmatter:
+            results.append((path, frontmatter))
+
+    if entries.keys() != cached.keys():
+        dirty = True
+    if dirty:
+        index["dirs"][dir_key] = entries
+        _save_index(index_path, index)
+
+    return results
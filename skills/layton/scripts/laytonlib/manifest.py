@@ -0,0 +1,137 @@
+"""Build-time manifest of the skill's built-in protocols, references and examples.
+
+The files under references/ only change with a release, so their parsed
+frontmatter is shipped in internal_manifest.json next to this module. The
+list_internal_* functions load it with a single read and only fall back to
+scanning the directories when it is missing or stale.
+
+Staleness is judged by file names and sizes only (no file is read), so an
+edit that keeps a file's size is not detected at runtime. The test suite
+runs the exact check (`--check`), which catches those edits before release.
+
+Regenerate after editing anything under references/:
+
+    cd skills/layton/scripts && python -m laytonlib.manifest
+
+`python -m laytonlib.manifest --check` exits 1 if the manifest is out of date.
+"""
+
+import functools
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from laytonlib import __version__
+from laytonlib.frontmatter import read_frontmatter
+
+MANIFEST_PATH = Path(__file__).parent / "internal_manifest.json"
+
+# Manifest section -> directory relative to the skill root
+INTERNAL_SECTIONS = {
+    "protocols": "references/protocols",
+    "references": "references",
+    "examples": "references/examples",
+}
+
+
+def get_skill_dir() -> Path:
+    """Get the skill root directory (skills/layton/)."""
+    return Path(__file__).parent.parent.parent
+
+
+def _section_files(skill_dir: Path) -> dict[str, list[Path]]:
+    """List the markdown files of each section, sorted by name."""
+    return {
+        section: sorted(
+            p for p in (skill_dir / rel).glob("*.md") if p.name != ".gitkeep"
+        )
+        for section, rel in INTERNAL_SECTIONS.items()
+    }
+
+
+def compute_fingerprint(skill_dir: Path) -> str:
+    """Cheap staleness fingerprint: file names and sizes (stat only)."""
+    digest = hashlib.sha256()
+    for section, files in _section_files(skill_dir).items():
+        for path in files:
+            digest.update(f"{section}/{path.name}:{path.stat().st_size}\n".encode())
+    return digest.hexdigest()
+
+
+def build_manifest(skill_dir: Path | None = None) -> dict:
+    """Scan the internal directories and build the manifest dict."""
+    skill_dir = skill_dir or get_skill_dir()
+    sections = {}
+    for section, files in _section_files(skill_dir).items():
+        entries = []
+        for path in files:
+            header = read_frontmatter(path)
+            if header and "name" in header.data:
+                entries.append(
+                    {
+                        "path": path.relative_to(skill_dir).as_posix(),
+                        "frontmatter": header.data,
+                    }
+                )
+        sections[section] = entries
+
+    return {
+        "version": __version__,
+        "fingerprint": compute_fingerprint(skill_dir),
+        "sections": sections,
+    }
+
+
+@functools.cache
+def load_manifest() -> dict | None:
+    """Load the shipped manifest if it matches this release and tree.
+
+    Returns:
+        Manifest dict, or None if missing, unreadable or stale
+        (caller should scan the directories instead)
+    """
+    try:
+        with open(MANIFEST_PATH) as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if not isinstance(manifest, dict) or manifest.get("version") != __version__:
+        return None
+    try:
+        if manifest.get("fingerprint") != compute_fingerprint(get_skill_dir()):
+            return None
+    except OSError:
+        return None
+    return manifest
+
+
+def write_manifest(path: Path = MANIFEST_PATH) -> dict:
+    """Build and write the manifest file."""
+    manifest = build_manifest()
+    path.write_text(json.dumps(manifest, indent=2) + "\n")
+    load_manifest.cache_clear()
+    return manifest
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Regenerate (or with --check, verify) the shipped manifest."""
+    argv = sys.argv[1:] if argv is None else argv
+    if "--check" in argv:
+        try:
+            shipped = json.loads(MANIFEST_PATH.read_text())
+        except (OSError, json.JSONDecodeError):
+            shipped = None
+        if shipped != build_manifest():
+            print(f"{MANIFEST_PATH} is out of date", file=sys.stderr)
+            return 1
+        return 0
+
+    write_manifest()
+    print(f"Wrote {MANIFEST_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
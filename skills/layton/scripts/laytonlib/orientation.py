@@ -0,0 +1,575 @@
+"""Orientation: the no-arg `layton` overview, built from independent sections.
+
+Each section is computed by its own builder, and only selected sections are
+built (--only / --skip), so a skipped section does no file I/O and spawns
+no bd process. Builders import their modules lazily for the same reason.
+
+The bd-backed inputs of the selected sections (`bd version` for checks,
+`bd list` for queue) are fetched concurrently before the builders run.
+
+With --stream, each section is written as its own NDJSON record as soon as
+it is ready: the bd fetches start in worker threads, the local sections are
+built (and written) meanwhile, and the bd-backed sections follow as their
+fetches complete. A final summary record carries next_steps and per-section
+timings. Builders always run on the main thread; only bd calls are
+threaded.
+
+The last result of each bd input is kept in .layton/cache/orientation/.
+With --budget-ms, bd inputs that are not ready by the deadline are served
+from there instead (marked stale, with the snapshot's age), so a slow or
+hung bd never blocks orientation past the budget.
+"""
+
+import contextlib
+import json
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from laytonlib.config import get_cache_dir
+from laytonlib.formatters import OutputFormatter
+
+if TYPE_CHECKING:
+    from laytonlib.errands import QueueBudget
+
+# In output order (next_steps hints are added in this order too)
+SECTIONS = (
+    "checks",
+    "rolodex",
+    "protocols",
+    "errands",
+    "queue",
+    "references",
+    "examples",
+)
+
+
+@dataclass
+class SectionContext:
+    """Shared inputs and outputs of the section builders."""
+
+    budget: "QueueBudget | None" = None
+    prefetched: dict[str, Any] = field(default_factory=dict)
+    next_steps: list[str] = field(default_factory=list)
+
+
+def select_sections(
+    only: Iterable[str] | None = None,
+    skip: Iterable[str] | None = None,
+) -> list[str]:
+    """Resolve --only / --skip into the ordered list of sections to build.
+
+    Raises:
+        ValueError: If a name is not in SECTIONS (code: INVALID_SECTION)
+    """
+    only = list(only) if only is not None else None
+    skip = list(skip or [])
+    unknown = [name for name in (only or []) + skip if name not in SECTIONS]
+    if unknown:
+        raise ValueError(
+            f"INVALID_SECTION: Unknown section(s): {', '.join(unknown)} "
+            f"(choose from {', '.join(SECTIONS)})"
+        )
+    return [
+        name for name in SECTIONS if (only is None or name in only) and name not in skip
+    ]
+
+
+@dataclass
+class BdSource:
+    """A section's bd-backed input and how to snapshot it."""
+
+    key: str
+    fetch: Callable[[], Any]
+    decode: Callable[[dict], Any]
+    placeholder: Callable[[int], Any]
+    # Whether a fetched value is a real result (failures are never cached)
+    ok: Callable[[Any], bool]
+
+
+def _bd_source(section: str) -> BdSource | None:
+    """The bd-backed input a section needs, if any."""
+    if section == "checks":
+        from laytonlib.doctor import CheckResult, check_beads_available
+
+        return BdSource(
+            key="beads_available",
+            fetch=check_beads_available,
+            decode=lambda d: CheckResult(**d),
+            placeholder=lambda ms: CheckResult(
+                name="beads_available",
+                status="warn",
+                message=f"bd did not respond within {ms} ms (no cached result)",
+            ),
+            ok=lambda result: result.status != "fail",
+        )
+    if section == "queue":
+        from laytonlib.errands import QueueSnapshot, get_queue_snapshot
+
+        return BdSource(
+            key="queue",
+            fetch=get_queue_snapshot,
+            decode=lambda d: QueueSnapshot(**d),
+            placeholder=lambda ms: QueueSnapshot(),
+            ok=lambda queue: not queue.failed,
+        )
+    return None
+
+
+def _cached_source_path(key: str) -> Path:
+    return get_cache_dir() / "orientation" / f"{key}.json"
+
+
+def _save_cached_source(key: str, value: Any) -> None:
+    """Persist the latest result of a bd input (best-effort, atomic)."""
+    if not get_cache_dir(create=True).is_dir():
+        return
+    path = _cached_source_path(key)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {"saved_at": time.time(), "value": value.to_dict()},
+                f,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_path, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+
+
+def _load_cached_source(source: BdSource) -> tuple[Any, float] | None:
+    """Load the last persisted result of a bd input.
+
+    Returns:
+        Tuple of (value, age in seconds), or None if there is none
+    """
+    try:
+        with open(_cached_source_path(source.key)) as f:
+            snapshot = json.load(f)
+        value = source.decode(snapshot["value"])
+        age = max(0.0, time.time() - snapshot["saved_at"])
+    except (OSError, json.JSONDecodeError, KeyError, TypeError):
+        return None
+    return value, round(age, 1)
+
+
+@dataclass
+class BdResult:
+    """A bd input, fresh or served from its snapshot."""
+
+    section: str
+    value: Any
+    elapsed_ms: float
+    stale: dict | None = None  # {"stale": True, "age_s": ...} if not fresh
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+def _timed_fetch(fetch: Callable[[], Any]) -> tuple[Any, float]:
+    """Run a bd fetch and measure it (runs in a worker thread)."""
+    start = time.perf_counter()
+    return fetch(), _elapsed_ms(start)
+
+
+def _fetch_bd_inputs(
+    sources: dict[str, BdSource],
+    deadline_ms: int | None = None,
+) -> Iterator[BdResult]:
+    """Start the bd fetches now; iterate their results in completion order.
+
+    Fetches still running at the deadline are replaced by their snapshot
+    (or a placeholder if there is none), yielded after the fresh ones.
+    """
+    from laytonlib.executor import iter_completed
+
+    start = time.perf_counter()
+    completed = iter_completed(
+        {
+            name: (lambda fetch=source.fetch: _timed_fetch(fetch))
+            for name, source in sources.items()
+        },
+        timeout=None if deadline_ms is None else deadline_ms / 1000,
+    )
+    return _resolve_bd_inputs(sources, completed, deadline_ms, start)
+
+
+def _resolve_bd_inputs(
+    sources: dict[str, BdSource],
+    completed: Iterator[tuple[str, Any]],
+    deadline_ms: int | None,
+    start: float,
+) -> Iterator[BdResult]:
+    done = set()
+    for name, (value, fetch_ms) in completed:
+        done.add(name)
+        source = sources[name]
+        if source.ok(value):
+            _save_cached_source(source.key, value)
+        yield BdResult(name, value, fetch_ms)
+
+    for name, source in sources.items():
+        if name in done:
+            continue
+        cached = _load_cached_source(source)
+        value, age = cached if cached else (source.placeholder(deadline_ms), None)
+        yield BdResult(
+            name, value, _elapsed_ms(start), stale={"stale": True, "age_s": age}
+        )
+
+
+def _build_checks(ctx: SectionContext) -> dict:
+    from laytonlib.doctor import (
+        check_beads_initialized,
+        check_config_exists,
+        check_config_valid,
+    )
+
+    beads_check = ctx.prefetched["beads_available"]
+    if beads_check.status == "fail":
+        raise RuntimeError(f"BEADS_UNAVAILABLE: {beads_check.message}")
+
+    checks = [beads_check]
+
+    beads_init_check = check_beads_initialized()
+    checks.append(beads_init_check)
+    if beads_init_check.status == "warn":
+        ctx.next_steps.append("Run 'bd init' to initialize Beads")
+
+    config_exists_check = check_config_exists()
+    checks.append(config_exists_check)
+
+    needs_setup = config_exists_check.status == "fail"
+
+    if config_exists_check.status == "pass":
+        checks.append(check_config_valid())
+
+    if needs_setup:
+        ctx.next_steps.append(
+            "Follow references/protocols/setup.md for guided onboarding"
+        )
+        ctx.next_steps.append("Or run 'layton config init' for quick setup")
+
+    return {"needs_setup": needs_setup, "checks": [c.to_dict() for c in checks]}
+
+
+def _build_rolodex(ctx: SectionContext) -> dict:
+    from laytonlib.rolodex import list_cards
+
+    cards = list_cards()
+    if not cards:
+        ctx.next_steps.append("Run 'layton rolodex --discover' to find available cards")
+    return {"rolodex": [{"name": c.name, "description": c.description} for c in cards]}
+
+
+def _build_protocols(ctx: SectionContext) -> dict:
+    from laytonlib.protocols import list_internal_protocols, list_protocols
+
+    user_protocols = list_protocols()
+    internal_protocols = list_internal_protocols()
+
+    if not user_protocols:
+        ctx.next_steps.append("Run 'layton protocols add <name>' to create a protocol")
+
+    return {
+        "protocols": {
+            "user": [
+                {"name": w.name, "description": w.description, "triggers": w.triggers}
+                for w in user_protocols
+            ],
+            "internal": [
+                {"name": w.name, "description": w.description, "triggers": w.triggers}
+                for w in internal_protocols
+            ],
+        }
+    }
+
+
+def _build_errands(ctx: SectionContext) -> dict:
+    from laytonlib.errands import list_errands
+
+    templates = [
+        {"name": e.name, "description": e.description, "variables": e.variables}
+        for e in list_errands()
+    ]
+    return {"errands": {"templates": templates}}
+
+
+def _build_queue(ctx: SectionContext) -> dict:
+    # Errand queue states (one bd round-trip for all three queues)
+    queue = ctx.prefetched["queue"]
+    if queue.pending_review:
+        ctx.next_steps.append(
+            f"{len(queue.pending_review)} bead(s) pending review - see references/protocols/review-beads.md"
+        )
+    return {"errands": {"queue": queue.to_dict(ctx.budget)}}
+
+
+def _build_references(ctx: SectionContext) -> dict:
+    from laytonlib.protocols import list_internal_references
+
+    return {"references": [r.to_dict() for r in list_internal_references()]}
+
+
+def _build_examples(ctx: SectionContext) -> dict:
+    from laytonlib.protocols import list_internal_examples
+
+    return {"examples": [e.to_dict() for e in list_internal_examples()]}
+
+
+SECTION_BUILDERS: dict[str, Callable[[SectionContext], dict]] = {
+    "checks": _build_checks,
+    "rolodex": _build_rolodex,
+    "protocols": _build_protocols,
+    "errands": _build_errands,
+    "queue": _build_queue,
+    "references": _build_references,
+    "examples": _build_examples,
+}
+
+
+def _merge(data: dict, fragment: dict) -> None:
+    """Merge a section's output into data (one level deep for shared keys)."""
+    for key, value in fragment.items():
+        if isinstance(value, dict) and isinstance(data.get(key), dict):
+            data[key].update(value)
+        else:
+            data[key] = value
+
+
+def build_orientation(
+    sections: list[str] | None = None,
+    budget: "QueueBudget | None" = None,
+    deadline_ms: int | None = None,
+) -> tuple[dict, list[str]]:
+    """Build the orientation data for the selected sections.
+
+    Args:
+        sections: Sections to build (defaults to all of SECTIONS)
+        budget: Field projection and size budget for the queue bead lists
+        deadline_ms: Serve bd inputs not ready after this many ms from
+            their snapshot (None waits for bd)
+
+    Returns:
+        Tuple of (data, next_steps). Sections served from a snapshot are
+        listed under data["stale_sections"].
+
+    Raises:
+        RuntimeError: If bd is unavailable (code: BEADS_UNAVAILABLE,
+            only when checks is selected)
+    """
+    sections = list(SECTIONS) if sections is None else sections
+    ctx = SectionContext(budget=budget)
+    stale = {}
+
+    # bd calls are independent: overlap `bd version` with the queue fetch
+    sources = {name: src for name in sections if (src := _bd_source(name))}
+    for result in _fetch_bd_inputs(sources, deadline_ms):
+        ctx.prefetched[sources[result.section].key] = result.value
+        if result.stale:
+            stale[result.section] = result.stale
+
+    data: dict = {}
+    for name in sections:
+        _merge(data, SECTION_BUILDERS[name](ctx))
+
+    if stale:
+        data["stale_sections"] = stale
+        ctx.next_steps.append(_stale_hint(stale, deadline_ms))
+    return data, ctx.next_steps
+
+
+def _stale_hint(stale: dict, deadline_ms: int | None) -> str:
+    names = ", ".join(stale)
+    return (
+        f"bd did not respond within {deadline_ms} ms; {names} from cache "
+        "(run without --budget-ms for fresh data)"
+    )
+
+
+def stream_orientation(
+    formatter: OutputFormatter,
+    sections: list[str] | None = None,
+    budget: "QueueBudget | None" = None,
+    deadline_ms: int | None = None,
+) -> int:
+    """Write each orientation section as an NDJSON record as soon as it is ready.
+
+    Records:
+        {"section": name, "success": true, "data": {...}}
+        {"section": name, "success": true, "data": {...}, "stale": true,
+         "age_s": ...}
+        {"section": name, "success": false, "error": {...}}
+        {"section": "summary", "success": ..., "data": {"timings_ms": {...}},
+         "next_steps": [...]}
+
+    Args:
+        formatter: Output formatter (records go through formatter.record())
+        sections: Sections to include (defaults to all)
+        budget: Field projection and size budget for the queue bead lists
+        deadline_ms: Serve bd inputs not ready after this many ms from
+            their snapshot (None waits for bd)
+
+    Returns:
+        Exit code (0=success, 2=bd unavailable)
+    """
+    sections = list(SECTIONS) if sections is None else sections
+    sources = {name: src for name in sections if (src := _bd_source(name))}
+
+    section_steps: dict[str, list[str]] = {}
+    timings: dict[str, float] = {}
+    stale: dict[str, dict] = {}
+    exit_code = 0
+
+    def emit(name: str, ctx: SectionContext, started: float, offset: float) -> None:
+        nonlocal exit_code
+        try:
+            fragment = SECTION_BUILDERS[name](ctx)
+        except RuntimeError as e:
+            code, _, message = str(e).partition(": ")
+            if code != "BEADS_UNAVAILABLE":
+                raise
+            exit_code = 2
+            ctx.next_steps.append(
+                "Install Beads CLI: https://github.com/steveyegge/beads"
+            )
+            formatter.record(
+                {
+                    "section": name,
+                    "success": False,
+                    "error": {"code": code, "message": message},
+                }
+            )
+        else:
+            record = {"section": name, "success": True, "data": fragment}
+            formatter.record({**record, **stale.get(name, {})})
+        timings[name] = round(offset + _elapsed_ms(started), 1)
+        section_steps[name] = ctx.next_steps
+
+    # bd fetches start now and run while the local sections are built
+    bd_results = _fetch_bd_inputs(sources, deadline_ms)
+
+    # Cheap local sections first
+    for name in sections:
+        if name not in sources:
+            emit(name, SectionContext(budget=budget), time.perf_counter(), 0.0)
+
+    for result in bd_results:
+        if result.stale:
+            stale[result.section] = result.stale
+        key = sources[result.section].key
+        ctx = SectionContext(budget=budget, prefetched={key: result.value})
+        emit(result.section, ctx, time.perf_counter(), result.elapsed_ms)
+
+    next_steps = [step for name in sections for step in section_steps.get(name, [])]
+    if stale:
+        next_steps.append(_stale_hint(stale, deadline_ms))
+    formatter.record(
+        {
+            "section": "summary",
+            "success": exit_code == 0,
+            "data": {"sections": sections, "timings_ms": timings},
+            "next_steps": next_steps,
+        }
+    )
+    return exit_code
+
+
+def _apply_output_budget(data: dict, budget: "QueueBudget") -> None:
+    """Slim the queue bead lists of built (or diffed) orientation data.
+
+    Applied after the snapshot is taken, so tokens and --since diffs always
+    cover the full queues. In a diff, the added and changed beads of each
+    queue are budgeted and "truncated" counts what was left out of each.
+    """
+    from laytonlib.errands import QUEUE_NAMES, QueueSnapshot, apply_budget
+
+    queue = data.get("errands", {}).get("queue")
+    if queue is not None:
+        data["errands"]["queue"] = QueueSnapshot(**queue).to_dict(budget)
+
+    for name in QUEUE_NAMES:
+        entry = data.get("changes", {}).get(f"errands.queue.{name}")
+        if entry is None:
+            continue
+        truncated = {}
+        for kind in ("added", "changed"):
+            entry[kind], truncated[kind] = apply_budget(entry[kind], budget)
+        entry["truncated"] = truncated
+
+
+def run_orientation(
+    formatter: OutputFormatter,
+    budget: "QueueBudget | None" = None,
+    sections: list[str] | None = None,
+    stream: bool = False,
+    deadline_ms: int | None = None,
+    since: str | None = None,
+) -> int:
+    """Run orientation - combined doctor + rolodex + protocols + errands.
+
+    Args:
+        formatter: Output formatter
+        budget: Field projection and size budget for the queue bead lists
+        sections: Sections to include (defaults to all)
+        stream: Write sections as NDJSON records as they complete
+        deadline_ms: Latency budget for bd inputs (--budget-ms)
+        since: Snapshot token; return only inventory changes since then
+
+    Returns:
+        Exit code (0=success, 1=fixable, 2=critical)
+    """
+    if stream:
+        if since:
+            formatter.error(
+                "INVALID_OPTIONS", "--since cannot be combined with --stream"
+            )
+            return 2
+        return stream_orientation(formatter, sections, budget, deadline_ms)
+
+    try:
+        # Snapshots hash the full queue; the budget only slims the output
+        data, next_steps = build_orientation(sections, None, deadline_ms)
+    except RuntimeError as e:
+        code, _, message = str(e).partition(": ")
+        if code != "BEADS_UNAVAILABLE":
+            raise
+        formatter.error(
+            code,
+            message,
+            next_steps=["Install Beads CLI: https://github.com/steveyegge/beads"],
+        )
+        return 2
+
+    from laytonlib.snapshots import (
+        collect_hashes,
+        diff_orientation,
+        load_snapshot,
+        save_snapshot,
+    )
+
+    token = save_snapshot(collect_hashes(data))
+    if since:
+        previous = load_snapshot(since)
+        if previous is None:
+            next_steps.append(f"Snapshot {since} not found; showing full orientation")
+        else:
+            diff_orientation(data, previous)
+            data["since"] = since
+    if budget is not None and budget.active:
+        _apply_output_budget(data, budget)
+    if token:
+        data["snapshot"] = token
+
+    if next_steps:
+        data["next_steps"] = next_steps
+
+    formatter.success(data, next_steps=next_steps if next_steps else None)
+    return 0
@@ -0,0 +1,161 @@
+"""Opt-in profiling of a single CLI invocation.
+
+    LAYTON_PROFILE=cpu layton errands prompt bd-12
+    LAYTON_PROFILE=mem layton
+
+The scripts/layton wrapper runs main() under cProfile (cpu) or tracemalloc
+(mem) and writes the result to .layton/profiles/<command>-<timestamp>-<pid>:
+
+- cpu: a .pstats file (`python -m pstats <file>`, snakeviz, ...)
+- mem: a .txt report of the top allocation sites and the peak usage
+
+Profiled invocations always run in-process, never in the daemon. Outside a
+vault the profile goes to the temp directory. The path is printed on stderr;
+if the profile cannot be written, a warning is printed instead and the
+command's own result is unaffected.
+"""
+
+import contextlib
+import cProfile
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from laytonlib.config import get_layton_dir
+
+PROFILE_ENV = "LAYTON_PROFILE"
+PROFILE_MODES = ("cpu", "mem")
+
+# Allocation sites listed in a mem report
+TOP_ALLOCATIONS = 30
+
+# Frames kept per allocation (only the innermost is reported)
+TRACEMALLOC_FRAMES = 1
+
+
+def get_profiles_dir() -> Path:
+    """Get the profile output directory (created on first use).
+
+    Raises:
+        OSError: If the directory cannot be created
+    """
+    layton_dir = get_layton_dir()
+    if not layton_dir.is_dir():
+        return Path(tempfile.gettempdir())
+
+    profiles_dir = layton_dir / "profiles"
+    if not profiles_dir.is_dir():
+        profiles_dir.mkdir(exist_ok=True)
+        # Profiles are local measurements, keep them out of the vault's git
+        (profiles_dir / ".gitignore").write_text("*\n")
+    return profiles_dir
+
+
+def profile_label(argv: list[str]) -> str:
+    """Name a profile after the command (e.g. "errands-prompt")."""
+    from laytonlib.cli import _get_parser
+
+    try:
+        with contextlib.redirect_stderr(io.StringIO()):
+            args, _ = _get_parser().parse_known_args(argv)
+    except SystemExit:
+        return "layton"
+
+    command = args.command or "orientation"
+    subcommand = getattr(args, f"{command}_command", None)
+    return f"{command}-{subcommand}" if subcommand else command
+
+
+def _profile_path(argv: list[str], suffix: str) -> Path:
+    # The pid keeps runs started within the same second apart
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    name = f"{profile_label(argv)}-{stamp}-{os.getpid()}{suffix}"
+    return get_profiles_dir() / name
+
+
+def _save_profile(
+    mode: str, argv: list[str], suffix: str, write: Callable[[Path], None]
+) -> None:
+    """Write a profile, warning on stderr (never raising) if that fails."""
+    try:
+        path = _profile_path(argv, suffix)
+        write(path)
+    except OSError as e:
+        print(f"layton: could not write {mode} profile: {e}", file=sys.stderr)
+        return
+    print(f"layton: wrote {mode} profile to {path}", file=sys.stderr)
+
+
+def _write_mem_report(path: Path, snapshot: tracemalloc.Snapshot, peak: int) -> None:
+    snapshot = snapshot.filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        )
+    )
+    stats = snapshot.statistics("lineno")
+    total = sum(stat.size for stat in stats)
+
+    lines = [
+        f"Peak traced memory: {peak / 1024:.1f} KiB",
+        f"Live at exit: {total / 1024:.1f} KiB in {len(stats)} sites",
+        "",
+        f"Top {TOP_ALLOCATIONS} allocation sites (live at exit):",
+    ]
+    for index, stat in enumerate(stats[:TOP_ALLOCATIONS], 1):
+        frame = stat.traceback[0]
+        lines.append(
+            f"{index:3}. {frame.filename}:{frame.lineno}: "
+            f"{stat.size / 1024:.1f} KiB in {stat.count} blocks"
+        )
+    path.write_text("\n".join(lines) + "\n")
+
+
+def run_profiled(
+    main: Callable[[list[str] | None], int],
+    argv: list[str] | None = None,
+) -> int:
+    """Run main(argv) under the profiler selected by LAYTON_PROFILE.
+
+    Args:
+        main: CLI entrypoint
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        main()'s exit code
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    mode = os.environ.get(PROFILE_ENV, "")
+    if mode not in PROFILE_MODES:
+        print(
+            f"layton: ignoring {PROFILE_ENV}={mode!r} (expected cpu or mem)",
+            file=sys.stderr,
+        )
+        return main(argv)
+
+    if mode == "cpu":
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(main, argv)
+        finally:
+            _save_profile(mode, argv, ".pstats", profiler.dump_stats)
+
+    tracemalloc.start(TRACEMALLOC_FRAMES)
+    try:
+        return main(argv)
+    finally:
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        _save_profile(
+            mode,
+            argv,
+            ".txt",
+            lambda path: _write_mem_report(path, snapshot, peak),
+        )
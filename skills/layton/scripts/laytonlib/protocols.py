@@ -4,12 +4,16 @@ Protocol files are stored in .layton/protocols/<name>.md with YAML frontmatter.
 The CLI can list protocols and bootstrap new protocol files from templates.
 """
 
-import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Protocol, TypeVar
 
 from laytonlib.config import get_layton_dir
+from laytonlib.frontmatter import (  # noqa: F401 - re-exported for callers
+    parse_frontmatter,
+)
+from laytonlib.index import scan_frontmatter
+from laytonlib.manifest import INTERNAL_SECTIONS, load_manifest
 
 
 class _Named(Protocol):
@@ -91,59 +95,6 @@ def get_internal_protocols_dir() -> Path:
     return _get_skill_dir() / "references" / "protocols"
 
 
-def parse_frontmatter(content: str) -> dict | None:
-    """Parse YAML frontmatter from markdown content.
-
-    Args:
-        content: Markdown file content
-
-    Returns:
-        Dict of frontmatter fields, or None if no valid frontmatter
-    """
-    # Match frontmatter between --- markers
-    match = re.match(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
-    if not match:
-        return None
-
-    frontmatter_text = match.group(1)
-    result = {}
-    current_key = None
-    current_list = None
-
-    # Simple YAML parsing for key: value pairs and lists
-    for line in frontmatter_text.split("\n"):
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-
-        # Check for list item (- value)
-        if stripped.startswith("- ") and current_key:
-            if current_list is None:
-                current_list = []
-            current_list.append(stripped[2:].strip())
-            result[current_key] = current_list
-            continue
-
-        # Check for key: value
-        if ":" in stripped:
-            # Save previous list if any
-            if current_list is not None and current_key:
-                result[current_key] = current_list
-
-            key, _, value = stripped.partition(":")
-            current_key = key.strip()
-            value = value.strip()
-
-            if value:
-                result[current_key] = value
-                current_list = None
-            else:
-                # Might be start of a list
-                current_list = []
-
-    return result if result else None
-
-
 def _scan_markdown_dir(directory: Path, builder: Callable[[dict, Path], T]) -> list[T]:
     """Scan a directory for markdown files with YAML frontmatter.
 
@@ -154,17 +105,10 @@ def _scan_markdown_dir(directory: Path, builder: Callable[[dict, Path], T]) -> l
     Returns:
         List of built objects, sorted by name attribute.
     """
-    if not directory.exists():
-        return []
-
     items = []
-    for path in directory.glob("*.md"):
-        if path.name == ".gitkeep":
-            continue
+    for path, frontmatter in scan_frontmatter(directory):
         try:
-            content = path.read_text()
-            frontmatter = parse_frontmatter(content)
-            if frontmatter and "name" in frontmatter:
+            if "name" in frontmatter:
                 items.append(builder(frontmatter, path))
         except Exception:
             continue
@@ -203,6 +147,28 @@ def list_protocols() -> list[ProtocolInfo]:
     return _scan_markdown_dir(get_protocols_dir(), _build_protocol)
 
 
+def _list_internal(section: str, builder: Callable[[dict, Path], T]) -> list[T]:
+    """List a built-in section from the shipped manifest, or by scanning.
+
+    Args:
+        section: Manifest section (protocols, references, examples)
+        builder: Function that takes (frontmatter_dict, path) and returns a dataclass instance
+
+    Returns:
+        List of built objects, sorted by name attribute.
+    """
+    skill_dir = _get_skill_dir()
+    manifest = load_manifest()
+    if manifest is None:
+        return _scan_markdown_dir(skill_dir / INTERNAL_SECTIONS[section], builder)
+
+    items = [
+        builder(entry["frontmatter"], skill_dir / entry["path"])
+        for entry in manifest["sections"].get(section, [])
+    ]
+    return sorted(items, key=lambda item: item.name)
+
+
 def list_internal_protocols() -> list[ProtocolInfo]:
     """List built-in protocols from references/protocols/.
 
@@ -210,7 +176,7 @@ def list_internal_protocols() -> list[ProtocolInfo]:
         List of ProtocolInfo objects from the skill's internal protocols,
         sorted by name.
     """
-    return _scan_markdown_dir(get_internal_protocols_dir(), _build_protocol)
+    return _list_internal("protocols", _build_protocol)
 
 
 def list_internal_references() -> list[ReferenceInfo]:
@@ -219,7 +185,7 @@ def list_internal_references() -> list[ReferenceInfo]:
     Returns:
         List of ReferenceInfo objects, sorted by name.
     """
-    return _scan_markdown_dir(_get_skill_dir() / "references", _build_reference)
+    return _list_internal("references", _build_reference)
 
 
 def list_internal_examples() -> list[ReferenceInfo]:
@@ -228,9 +194,7 @@ def list_internal_examples() -> list[ReferenceInfo]:
     Returns:
         List of ReferenceInfo objects, sorted by name.
     """
-    return _scan_markdown_dir(
-        _get_skill_dir() / "references" / "examples", _build_reference
-    )
+    return _list_internal("examples", _build_reference)
 
 
 def add_protocol(name: str) -> Path:
@@ -4,11 +4,15 @@ Rolodex cards are stored in .layton/rolodex/<name>.md with YAML frontmatter.
 The CLI can list known cards, discover new cards, and bootstrap card files.
 """
 
-import re
 from dataclasses import dataclass
 from pathlib import Path
 
-from laytonlib.config import find_vault_root, get_layton_dir
+from laytonlib.config import get_layton_dir, get_vault
+from laytonlib.frontmatter import (  # noqa: F401 - re-exported for callers
+    parse_frontmatter,
+    read_frontmatter,
+)
+from laytonlib.index import scan_frontmatter
 
 
 @dataclass
@@ -67,54 +71,16 @@ def get_rolodex_dir() -> Path:
     return get_layton_dir() / "rolodex"
 
 
-def parse_frontmatter(content: str) -> dict | None:
-    """Parse YAML frontmatter from markdown content.
-
-    Args:
-        content: Markdown file content
-
-    Returns:
-        Dict of frontmatter fields, or None if no valid frontmatter
-    """
-    # Match frontmatter between --- markers
-    match = re.match(r"^---\s*\n(.*?)\n---", content, re.DOTALL)
-    if not match:
-        return None
-
-    frontmatter_text = match.group(1)
-    result = {}
-
-    # Simple YAML parsing for key: value pairs
-    for line in frontmatter_text.split("\n"):
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if ":" in line:
-            key, _, value = line.partition(":")
-            result[key.strip()] = value.strip()
-
-    return result if result else None
-
-
 def list_cards() -> list[RolodexCard]:
     """List all known cards from .layton/rolodex/.
 
     Returns:
         List of RolodexCard objects, sorted by name
     """
-    cards_dir = get_rolodex_dir()
-    if not cards_dir.exists():
-        return []
-
     cards = []
-    for path in cards_dir.glob("*.md"):
-        if path.name == ".gitkeep":
-            continue
-
+    for path, frontmatter in scan_frontmatter(get_rolodex_dir()):
         try:
-            content = path.read_text()
-            frontmatter = parse_frontmatter(content)
-            if frontmatter and "name" in frontmatter:
+            if "name" in frontmatter:
                 cards.append(
                     RolodexCard(
                         name=frontmatter.get("name", path.stem),
@@ -124,7 +90,7 @@ def list_cards() -> list[RolodexCard]:
                     )
                 )
         except Exception:
-            # Skip files that can't be read
+            # Skip cards whose frontmatter can't be used
             continue
 
     return sorted(cards, key=lambda c: c.name)
@@ -138,9 +104,7 @@ def discover_cards() -> tuple[list[RolodexCard], list[DiscoveredCard]]:
         - known: Cards with files in .layton/rolodex/
         - unknown: Cards without files (need to be added)
     """
-    vault_root = find_vault_root()
-    base = vault_root if vault_root else Path.cwd()
-    skills_root = base / "skills"
+    skills_root = get_vault().skills_dir
 
     if not skills_root.exists():
         return [], []
@@ -159,11 +123,10 @@ def discover_cards() -> tuple[list[RolodexCard], list[DiscoveredCard]]:
         if skill_name == "layton":
             continue
 
-        # Parse frontmatter from SKILL.md
+        # Parse frontmatter from SKILL.md (header only)
         try:
-            content = skill_md.read_text()
-            frontmatter = parse_frontmatter(content)
-            description = frontmatter.get("description", "") if frontmatter else ""
+            frontmatter = read_frontmatter(skill_md)
+            description = frontmatter.data.get("description", "") if frontmatter else ""
         except Exception:
             description = ""
 
@@ -0,0 +1,194 @@
+"""Orientation snapshot tokens for incremental output (`layton --since`).
+
+Every orientation returns an opaque `snapshot` token: the content hash of
+the per-item hashes of its inventories (rolodex cards, protocols, errand
+templates, queued beads, references and examples). The hashes are stored in
+.layton/cache/snapshots/<token>.json.
+
+`layton --since <token>` compares the current inventories against that
+snapshot and returns only what was added, removed or changed, under
+"changes", keyed by the inventory's dotted path:
+
+    "changes": {
+        "errands.queue.scheduled": {
+            "added": [{...bead...}],
+            "removed": ["bd-12"],
+            "changed": [{...bead...}]
+        }
+    }
+
+Inventories without changes are left out. Snapshots always hash the full
+queues; --fields/--max-items/--max-bytes only slim the output.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any
+
+from laytonlib.config import get_cache_dir
+
+# Inventories that are diffed, as paths into the orientation data
+COLLECTIONS = (
+    ("rolodex",),
+    ("protocols", "user"),
+    ("protocols", "internal"),
+    ("errands", "templates"),
+    ("errands", "queue", "scheduled"),
+    ("errands", "queue", "in_progress"),
+    ("errands", "queue", "pending_review"),
+    ("references",),
+    ("examples",),
+)
+
+# Item identity, first key present wins
+ITEM_KEYS = ("id", "name", "path")
+
+# Number of snapshot files kept
+MAX_SNAPSHOTS = 32
+
+_TOKEN_RE = re.compile(r"^[0-9a-f]{16}$")
+
+
+def _item_key(item: Any) -> str:
+    if isinstance(item, dict):
+        for key in ITEM_KEYS:
+            if key in item:
+                return str(item[key])
+    return _hash(item)
+
+
+def _hash(value: Any) -> str:
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+
+def _get_path(data: dict, path: tuple[str, ...]) -> Any:
+    current: Any = data
+    for part in path:
+        if not isinstance(current, dict) or part not in current:
+            return None
+        current = current[part]
+    return current
+
+
+def _pop_path(data: dict, path: tuple[str, ...]) -> None:
+    """Remove a path from data, dropping parents left empty."""
+    parent = _get_path(data, path[:-1]) if len(path) > 1 else data
+    if isinstance(parent, dict):
+        parent.pop(path[-1], None)
+    if len(path) > 1 and parent == {}:
+        _pop_path(data, path[:-1])
+
+
+def collect_hashes(data: dict) -> dict[str, dict[str, str]]:
+    """Hash every item of the inventories present in orientation data.
+
+    Returns:
+        Mapping of dotted inventory path to {item key: content hash}
+    """
+    hashes = {}
+    for path in COLLECTIONS:
+        items = _get_path(data, path)
+        if isinstance(items, list):
+            hashes[".".join(path)] = {_item_key(i): _hash(i) for i in items}
+    return hashes
+
+
+def _snapshots_dir() -> Path:
+    return get_cache_dir() / "snapshots"
+
+
+def save_snapshot(hashes: dict[str, dict[str, str]]) -> str | None:
+    """Store item hashes and return their token (None if not writable)."""
+    token = _hash(hashes)
+    if not get_cache_dir(create=True).is_dir():
+        return None
+
+    snapshots_dir = _snapshots_dir()
+    path = snapshots_dir / f"{token}.json"
+    if path.exists():
+        # Same content as an earlier snapshot: just mark it recent
+        with contextlib.suppress(OSError):
+            path.touch()
+        return token
+
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        snapshots_dir.mkdir(exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump(hashes, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        return None
+
+    _prune(snapshots_dir)
+    return token
+
+
+def _prune(snapshots_dir: Path) -> None:
+    """Keep only the MAX_SNAPSHOTS most recently used snapshots."""
+    try:
+        files = sorted(
+            snapshots_dir.glob("*.json"),
+            key=lambda p: p.stat().st_mtime_ns,
+            reverse=True,
+        )
+    except OSError:
+        return
+    for stale in files[MAX_SNAPSHOTS:]:
+        with contextlib.suppress(OSError):
+            stale.unlink()
+
+
+def load_snapshot(token: str) -> dict[str, dict[str, str]] | None:
+    """Load the item hashes of a token, or None if unknown."""
+    if not _TOKEN_RE.match(token):
+        return None
+    try:
+        with open(_snapshots_dir() / f"{token}.json") as f:
+            hashes = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    return hashes if isinstance(hashes, dict) else None
+
+
+def diff_orientation(data: dict, previous: dict[str, dict[str, str]]) -> dict:
+    """Replace the inventories in orientation data with changes since a snapshot.
+
+    Args:
+        data: Orientation data (modified in place)
+        previous: Item hashes from load_snapshot()
+
+    Returns:
+        data, with each inventory removed and a "changes" entry holding the
+        added/removed/changed items of the inventories that differ
+    """
+    changes = {}
+    for path in COLLECTIONS:
+        items = _get_path(data, path)
+        if not isinstance(items, list):
+            continue
+        name = ".".join(path)
+        old = previous.get(name, {})
+
+        current = {_item_key(i): i for i in items}
+        added = [item for key, item in current.items() if key not in old]
+        changed = [
+            item
+            for key, item in current.items()
+            if key in old and old[key] != _hash(item)
+        ]
+        removed = [key for key in old if key not in current]
+        if added or changed or removed:
+            changes[name] = {"added": added, "removed": removed, "changed": changed}
+
+        _pop_path(data, path)
+
+    data["changes"] = changes
+    return data
@@ -0,0 +1 @@
+"""Test and benchmark support code (not used by the CLI itself)."""
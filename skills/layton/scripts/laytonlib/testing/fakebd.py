@@ -0,0 +1,449 @@
+"""Fake `bd` CLI for tests and benchmarks.
+
+Implements the bd subcommands Layton (and its e2e tests) use on a JSONL
+bead store in the shape of bd's own .beads/issues.jsonl export, so large
+bead stores can be exercised without a real bd (and without its database
+or daemon): init, create, list (-l/-s/--all/--limit), show, close,
+comments [add], label add/remove/list and version.
+
+    python -m laytonlib.testing.fakebd list -l layton --json
+
+install() writes a `bd` executable that runs this module, for putting on
+PATH in front of (or instead of) the real one. The e2e suite uses it when
+LAYTON_FAKE_BD=1.
+
+The store is $LAYTON_FAKE_BD_STORE, or .beads/issues.jsonl in the nearest
+directory (upwards from cwd) that has a .beads/ directory.
+
+Record/replay ("cassettes", one JSONL interaction per line):
+
+- LAYTON_FAKE_BD_RECORD=<file>: run the real bd ($LAYTON_FAKE_BD_REAL, or
+  the next `bd` on PATH) and append argv, stdout, stderr and exit code
+- LAYTON_FAKE_BD_REPLAY=<file>: answer from the cassette (the last
+  recording of the same argv) without any store or real bd; unrecorded
+  argv exit 1
+"""
+
+import argparse
+import contextlib
+import fcntl
+import json
+import os
+import shutil
+import subprocess
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+
+STORE_ENV = "LAYTON_FAKE_BD_STORE"
+RECORD_ENV = "LAYTON_FAKE_BD_RECORD"
+REPLAY_ENV = "LAYTON_FAKE_BD_REPLAY"
+REAL_BD_ENV = "LAYTON_FAKE_BD_REAL"
+
+# Test-suite switch: run the e2e bd tests against this fake
+FAKE_BD_ENV = "LAYTON_FAKE_BD"
+
+FAKE_VERSION = "0.0.0-fake"
+
+ID_PREFIX = "bd"
+
+# `bd list` default page size
+DEFAULT_LIMIT = 50
+
+_HIDDEN_STATUSES = {"tombstone", "deleted"}
+
+# Commands that modify the store hold an exclusive lock, so concurrent bd
+# processes (e.g. from errands schedule-many) neither lose nor reuse beads
+WRITE_COMMANDS = {"create", "close", "comments", "label"}
+
+
+class BdError(Exception):
+    """A bd failure: message on stderr, exit code 1."""
+
+
+def get_store_path() -> Path:
+    """Locate the JSONL bead store."""
+    explicit = os.environ.get(STORE_ENV)
+    if explicit:
+        return Path(explicit)
+
+    cwd = Path.cwd().resolve()
+    for directory in (cwd, *cwd.parents):
+        if (directory / ".beads").is_dir():
+            return directory / ".beads" / "issues.jsonl"
+    raise BdError("no beads database found (run 'bd init')")
+
+
+def load_store(path: Path) -> list[dict]:
+    """Read all beads from a store (missing store = empty)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def save_store(path: Path, beads: list[dict]) -> None:
+    """Rewrite a store atomically."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(bead, separators=(",", ":")) + "\n" for bead in beads)
+    os.replace(tmp_path, path)
+
+
+@contextlib.contextmanager
+def _store_lock(path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(f".{path.name}.lock"), "w") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        yield
+
+
+def _count_beads(path: Path) -> int:
+    try:
+        with open(path, "rb") as f:
+            return sum(
+                chunk.count(b"\n") for chunk in iter(lambda: f.read(1 << 20), b"")
+            )
+    except FileNotFoundError:
+        return 0
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+def make_bead(
+    bead_id: str,
+    title: str,
+    labels: list[str] | None = None,
+    status: str = "open",
+    description: str = "",
+    parent: str | None = None,
+    issue_type: str = "task",
+) -> dict:
+    """Build a bead record as bd exports it."""
+    now = _now()
+    bead = {
+        "id": bead_id,
+        "title": title,
+        "description": description,
+        "status": status,
+        "priority": 2,
+        "issue_type": issue_type,
+        "labels": labels or [],
+        "created_at": now,
+        "updated_at": now,
+    }
+    if parent:
+        bead["parent"] = parent
+    return bead
+
+
+def _find(beads: list[dict], bead_id: str) -> dict:
+    for bead in beads:
+        if bead.get("id") == bead_id:
+            return bead
+    raise BdError(f"issue not found: {bead_id}")
+
+
+def _split_labels(values: list[str] | None) -> list[str]:
+    return [label for value in values or [] for label in value.split(",") if label]
+
+
+def cmd_version(args: argparse.Namespace) -> str:
+    return f"bd version {FAKE_VERSION}"
+
+
+def cmd_list(args: argparse.Namespace) -> str:
+    labels = _split_labels(args.label)
+    matches = []
+    for bead in load_store(get_store_path()):
+        status = bead.get("status")
+        if status in _HIDDEN_STATUSES:
+            continue
+        if args.status is not None:
+            if status != args.status:
+                continue
+        elif status == "closed" and not args.all:
+            continue
+        if not all(label in bead.get("labels", []) for label in labels):
+            continue
+        matches.append(bead)
+
+    if args.limit:
+        matches = matches[: args.limit]
+    if args.json:
+        return json.dumps(matches)
+    return "\n".join(
+        f"{b['id']} [{b.get('status')}] {b.get('title', '')}" for b in matches
+    )
+
+
+def cmd_show(args: argparse.Namespace) -> str:
+    bead = _find(load_store(get_store_path()), args.id)
+    if args.json:
+        return json.dumps([bead])
+    return f"{bead['id']}: {bead.get('title', '')}\nStatus: {bead.get('status')}"
+
+
+def cmd_init(args: argparse.Namespace) -> str:
+    path = Path.cwd() / ".beads" / "issues.jsonl"
+    path.parent.mkdir(exist_ok=True)
+    path.touch()
+    return f"✓ bd initialized in {path.parent}"
+
+
+def cmd_close(args: argparse.Namespace) -> str:
+    path = get_store_path()
+    beads = load_store(path)
+    closed = []
+    for bead_id in args.ids:
+        bead = _find(beads, bead_id)
+        bead["status"] = "closed"
+        bead["closed_at"] = bead["updated_at"] = _now()
+        if args.reason:
+            bead["close_reason"] = args.reason
+        closed.append(bead)
+    save_store(path, beads)
+    if args.json:
+        return json.dumps(closed)
+    return "\n".join(f"✓ Closed {bead['id']}" for bead in closed)
+
+
+def cmd_comments(args: argparse.Namespace) -> str:
+    # `bd comments <id>` lists, `bd comments add <id> <text>` adds
+    if args.words[0] == "add":
+        if len(args.words) != 3:
+            raise BdError("usage: bd comments add <id> <text>")
+        return _add_comment(args.words[1], args.words[2])
+    if len(args.words) != 1:
+        raise BdError("usage: bd comments <id>")
+
+    bead_id = args.words[0]
+    bead = _find(load_store(get_store_path()), bead_id)
+    comments = bead.get("comments", [])
+    if args.json:
+        return json.dumps(comments)
+    if not comments:
+        return f"No comments on {bead_id}"
+    return "\n".join(f"[{c.get('author', '')}] {c.get('text', '')}" for c in comments)
+
+
+def _add_comment(bead_id: str, text: str) -> str:
+    path = get_store_path()
+    beads = load_store(path)
+    bead = _find(beads, bead_id)
+    comments = bead.setdefault("comments", [])
+    comments.append(
+        {
+            "id": len(comments) + 1,
+            "author": os.environ.get("BD_ACTOR") or os.environ.get("USER", ""),
+            "text": text,
+            "created_at": _now(),
+        }
+    )
+    save_store(path, beads)
+    return f"✓ Comment added to {bead_id}"
+
+
+def cmd_create(args: argparse.Namespace) -> str:
+    path = get_store_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    bead = make_bead(
+        f"{ID_PREFIX}-{_count_beads(path) + 1}",
+        args.title,
+        labels=_split_labels(args.labels),
+        description=args.description or "",
+        parent=args.parent,
+        issue_type=args.type,
+    )
+    # Appending keeps create O(1) in the store size, like bd's own export
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(bead, separators=(",", ":")) + "\n")
+    if args.json:
+        return json.dumps(bead)
+    return f"✓ Created issue: {bead['id']}"
+
+
+def cmd_label(args: argparse.Namespace) -> str:
+    path = get_store_path()
+    beads = load_store(path)
+    bead = _find(beads, args.id)
+    labels = bead.setdefault("labels", [])
+    if args.label_command == "list":
+        if args.json:
+            return json.dumps(labels)
+        return "\n".join(labels)
+    if args.label_command == "add":
+        if args.label not in labels:
+            labels.append(args.label)
+        message = f"✓ Added label '{args.label}' to {args.id}"
+    else:
+        if args.label in labels:
+            labels.remove(args.label)
+        message = f"✓ Removed label '{args.label}' from {args.id}"
+    bead["updated_at"] = _now()
+    save_store(path, beads)
+    return message
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="bd", description="Fake bd for tests")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("version").set_defaults(func=cmd_version)
+    subparsers.add_parser("init").set_defaults(func=cmd_init)
+
+    list_parser = subparsers.add_parser("list")
+    list_parser.add_argument("-l", "--label", action="append")
+    list_parser.add_argument("-s", "--status")
+    list_parser.add_argument("--all", action="store_true")
+    list_parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT)
+    list_parser.add_argument("--json", action="store_true")
+    list_parser.set_defaults(func=cmd_list)
+
+    show_parser = subparsers.add_parser("show")
+    show_parser.add_argument("id")
+    show_parser.add_argument("--json", action="store_true")
+    show_parser.set_defaults(func=cmd_show)
+
+    close_parser = subparsers.add_parser("close")
+    close_parser.add_argument("ids", nargs="+")
+    close_parser.add_argument("--reason")
+    close_parser.add_argument("--json", action="store_true")
+    close_parser.set_defaults(func=cmd_close)
+
+    comments_parser = subparsers.add_parser("comments")
+    comments_parser.add_argument("words", nargs="+", metavar="[add] id [text]")
+    comments_parser.add_argument("--json", action="store_true")
+    comments_parser.set_defaults(func=cmd_comments)
+
+    create_parser = subparsers.add_parser("create")
+    create_parser.add_argument("--title", required=True)
+    create_parser.add_argument("--type", default="task")
+    create_parser.add_argument("--parent")
+    create_parser.add_argument("--labels", action="append")
+    create_parser.add_argument("--description")
+    create_parser.add_argument("--json", action="store_true")
+    create_parser.set_defaults(func=cmd_create)
+
+    label_parser = subparsers.add_parser("label")
+    label_subparsers = label_parser.add_subparsers(dest="label_command", required=True)
+    for action in ("add", "remove"):
+        action_parser = label_subparsers.add_parser(action)
+        action_parser.add_argument("id")
+        action_parser.add_argument("label")
+    label_list = label_subparsers.add_parser("list")
+    label_list.add_argument("id")
+    label_list.add_argument("--json", action="store_true")
+    label_parser.set_defaults(func=cmd_label)
+
+    return parser
+
+
+def _find_real_bd() -> str | None:
+    """The real bd for recording: $LAYTON_FAKE_BD_REAL or the next bd on PATH."""
+    explicit = os.environ.get(REAL_BD_ENV)
+    if explicit:
+        return explicit
+
+    own_dir = Path(sys.argv[0]).resolve().parent
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        if directory and Path(directory).resolve() != own_dir:
+            found = shutil.which("bd", path=directory)
+            if found:
+                return found
+    return None
+
+
+def _write_interaction(interaction: dict) -> int:
+    sys.stdout.write(interaction.get("stdout", ""))
+    sys.stderr.write(interaction.get("stderr", ""))
+    return interaction.get("exit_code", 0)
+
+
+def record(cassette: Path, argv: list[str]) -> int:
+    """Run the real bd and append the interaction to a cassette."""
+    real_bd = _find_real_bd()
+    if real_bd is None:
+        print("Error: no real bd found to record", file=sys.stderr)
+        return 1
+
+    result = subprocess.run(
+        [real_bd, *argv], capture_output=True, text=True, check=False
+    )
+    interaction = {
+        "argv": argv,
+        "stdout": result.stdout,
+        "stderr": result.stderr,
+        "exit_code": result.returncode,
+    }
+    with open(cassette, "a", encoding="utf-8") as f:
+        f.write(json.dumps(interaction) + "\n")
+    return _write_interaction(interaction)
+
+
+def replay(cassette: Path, argv: list[str]) -> int:
+    """Answer from a cassette (last recording of the same argv wins)."""
+    found = None
+    try:
+        with open(cassette, encoding="utf-8") as f:
+            for line in f:
+                interaction = json.loads(line)
+                if interaction.get("argv") == argv:
+                    found = interaction
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Error: cannot read cassette {cassette}: {e}", file=sys.stderr)
+        return 1
+
+    if found is None:
+        print(f"Error: no recorded response for bd {' '.join(argv)}", file=sys.stderr)
+        return 1
+    return _write_interaction(found)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run a fake bd command; returns the exit code."""
+    argv = sys.argv[1:] if argv is None else argv
+    if cassette := os.environ.get(REPLAY_ENV):
+        return replay(Path(cassette), argv)
+    if cassette := os.environ.get(RECORD_ENV):
+        return record(Path(cassette), argv)
+
+    args = _get_parser().parse_args(argv)
+    try:
+        if args.command in WRITE_COMMANDS:
+            with _store_lock(get_store_path()):
+                output = args.func(args)
+        else:
+            output = args.func(args)
+    except BdError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(output)
+    return 0
+
+
+def install(bin_dir: Path) -> Path:
+    """Write a `bd` executable running this module into bin_dir.
+
+    Returns:
+        Path to the executable (put bin_dir first on PATH to use it)
+    """
+    scripts_dir = Path(__file__).resolve().parent.parent.parent
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    path = bin_dir / "bd"
+    path.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        f"sys.path.insert(0, {str(scripts_dir)!r})\n"
+        "from laytonlib.testing.fakebd import main\n"
+        "sys.exit(main())\n"
+    )
+    path.chmod(0o755)
+    return path
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""Lightweight wall-time spans for `--timings`.
+
+    with span("scan", dir=str(path)):
+        ...
+
+    @timed()
+    def compile_errand(...): ...
+
+    with span("bd", argv=cmd) as attrs:
+        result = subprocess.run(cmd, ...)
+        attrs["exit_code"] = result.returncode
+
+Spans are only recorded after start() (cli.main calls it for --timings);
+otherwise span() costs one global lookup. Recorded spans appear under
+debug.timings with --verbose --timings.
+"""
+
+import contextlib
+import functools
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+# Recorded spans, or None when not collecting
+_spans: list[dict[str, Any]] | None = None
+_started = 0.0
+
+
+def start() -> None:
+    """Start collecting spans (discarding any from a previous invocation)."""
+    global _spans, _started
+    _spans = []
+    _started = time.perf_counter()
+
+
+def stop() -> None:
+    """Stop collecting spans."""
+    global _spans
+    _spans = None
+
+
+def enabled() -> bool:
+    return _spans is not None
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
+
+
+@contextlib.contextmanager
+def span(name: str, **attrs: Any) -> Iterator[dict[str, Any]]:
+    """Record the wall time of a block.
+
+    Args:
+        name: Span name (e.g. "bd", "scan", "vault")
+        **attrs: Extra fields stored with the span
+
+    Yields:
+        The attrs dict, to add fields known only at the end (e.g. exit_code)
+    """
+    spans = _spans
+    if spans is None:
+        yield attrs
+        return
+
+    begin = time.perf_counter()
+    try:
+        yield attrs
+    finally:
+        end = time.perf_counter()
+        # list.append is atomic, so spans from bd worker threads are safe
+        spans.append(
+            {
+                "name": name,
+                "start_ms": _ms(begin - _started),
+                "ms": _ms(end - begin),
+                **attrs,
+            }
+        )
+
+
+def timed(name: str | None = None) -> Callable[[Callable], Callable]:
+    """Decorator form of span() (span name defaults to the function name)."""
+
+    def decorator(func: Callable) -> Callable:
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(label):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def report() -> dict[str, Any] | None:
+    """Collected spans plus total wall time, or None when not collecting."""
+    if _spans is None:
+        return None
+    return {
+        "total_ms": _ms(time.perf_counter() - _started),
+        "spans": sorted(_spans, key=lambda s: s["start_ms"]),
+    }
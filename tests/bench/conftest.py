@@ -0,0 +1,171 @@
+"""Benchmark fixtures: synthetic vaults, synthetic bead stores and a fake bd.
+
+The benchmarks are skipped unless LAYTON_BENCH=1 (and need pytest-benchmark):
+
+    LAYTON_BENCH=1 pytest tests/bench
+
+Vaults are generated with 1k, 10k and 50k rolodex cards, protocols and
+errands each; bead stores with 10k and 100k beads, served by
+laytonlib.testing.fakebd. Select sizes with -k (e.g. -k "1000 and not 50000").
+
+To benchmark against recorded real bd output instead of the synthetic
+store, record a cassette once (LAYTON_FAKE_BD_RECORD, see
+laytonlib.testing.fakebd) and run with LAYTON_FAKE_BD_REPLAY=<cassette>.
+
+Baselines are stored in tests/bench/.benchmarks (pytest-benchmark storage,
+one directory per platform/interpreter). A baseline for the full suite is
+committed as Linux-CPython-3.11-64bit/0001_baseline.json; compare against it
+with:
+
+    LAYTON_BENCH=1 pytest tests/bench --benchmark-compare=0001 \\
+        --benchmark-compare-fail=min:20%
+
+Absolute timings depend on the machine, so record a baseline of your own
+(before a change) when comparing elsewhere, and run the same selection as
+the baseline: later benchmarks reuse the frontmatter index warmed by earlier
+ones. min is steadier than mean on a busy machine.
+
+    LAYTON_BENCH=1 pytest tests/bench --benchmark-save=baseline
+"""
+
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add laytonlib to path for testing
+sys.path.insert(
+    0,
+    str(Path(__file__).parent.parent.parent / "skills" / "layton" / "scripts"),
+)
+
+from laytonlib.testing import fakebd
+
+BENCH_ENV = "LAYTON_BENCH"
+
+VAULT_SIZES = (1_000, 10_000, 50_000)
+BEAD_COUNTS = (10_000, 100_000)
+
+EPIC_ID = "bd-1"
+
+BENCH_DIR = Path(__file__).parent
+
+
+def pytest_configure(config):
+    # Keep baselines next to the benchmarks unless --benchmark-storage is given
+    storage = getattr(config.option, "benchmark_storage", None)
+    if storage == "file://./.benchmarks":
+        config.option.benchmark_storage = f"file://{BENCH_DIR / '.benchmarks'}"
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.environ.get(BENCH_ENV) == "1":
+        return
+    skip = pytest.mark.skip(reason=f"benchmarks run with {BENCH_ENV}=1")
+    for item in items:
+        if BENCH_DIR in Path(item.fspath).parents:
+            item.add_marker(skip)
+
+
+def _write(path: Path, frontmatter: str, body: str) -> None:
+    path.write_text(f"---\n{frontmatter}---\n\n{body}\n")
+
+
+def generate_vault(root: Path, size: int) -> Path:
+    """Create a vault with `size` rolodex cards, protocols and errands."""
+    layton_dir = root / ".layton"
+    for name in ("rolodex", "protocols", "errands"):
+        (layton_dir / name).mkdir(parents=True)
+    (root / ".beads").mkdir()
+    (layton_dir / "config.json").write_text(
+        json.dumps({"timezone": "UTC", "errands": {"epic": EPIC_ID}})
+    )
+
+    body = "## Steps\n\n" + "\n".join(f"{i}. Do step {i}" for i in range(1, 20))
+    for i in range(size):
+        _write(
+            layton_dir / "rolodex" / f"card-{i:05}.md",
+            f"name: card-{i:05}\ndescription: Synthetic card {i}\nsource: bench\n",
+            body,
+        )
+        _write(
+            layton_dir / "protocols" / f"protocol-{i:05}.md",
+            f"name: protocol-{i:05}\ndescription: Synthetic protocol {i}\n"
+            f"triggers:\n  - run protocol {i}\n",
+            body,
+        )
+        _write(
+            layton_dir / "errands" / f"errand-{i:05}.md",
+            f"name: errand-{i:05}\ndescription: Synthetic errand {i}\n"
+            "variables:\n  target: What to look at\n",
+            "## Task\n\nLook at ${target}.\n\n" + body,
+        )
+    return root
+
+
+def generate_beads(path: Path, count: int) -> Path:
+    """Write a bead store: the epic plus `count` beads across all queues."""
+    states = [
+        ("open", ["layton", "scheduled"]),
+        ("in_progress", ["layton", "in-progress"]),
+        ("open", ["layton", "needs-review"]),
+        ("closed", ["layton"]),
+        ("open", ["other"]),
+    ]
+    beads = [fakebd.make_bead(EPIC_ID, "Layton errands", issue_type="epic")]
+    for i in range(2, count + 1):
+        status, labels = states[i % len(states)]
+        beads.append(
+            fakebd.make_bead(
+                f"bd-{i}",
+                f"[errand-{i % 100:05}] Synthetic bead {i}",
+                labels=[*labels, f"type:errand-{i % 100:05}"],
+                status=status,
+                description="Look at things.\n" * 20,
+                parent=EPIC_ID,
+            )
+        )
+    fakebd.save_store(path, beads)
+    return path
+
+
+@pytest.fixture(scope="session")
+def vault_factory(tmp_path_factory):
+    """Build (once per session) a synthetic vault of a given size."""
+    cache: dict[tuple[int, int], Path] = {}
+
+    def build(size: int, beads: int = 0) -> Path:
+        if (size, beads) not in cache:
+            root = tmp_path_factory.mktemp(f"vault-{size}-{beads}")
+            generate_vault(root, size)
+            generate_beads(root / ".beads" / "issues.jsonl", beads)
+            cache[size, beads] = root
+        return cache[size, beads]
+
+    return build
+
+
+@pytest.fixture(params=VAULT_SIZES, ids=str)
+def vault(request, vault_factory, monkeypatch):
+    """A synthetic vault (no beads) as the working directory."""
+    root = vault_factory(request.param)
+    monkeypatch.chdir(root)
+    return root
+
+
+@pytest.fixture(params=BEAD_COUNTS, ids=str)
+def bead_vault(request, vault_factory, fake_bd, tmp_path, monkeypatch):
+    """A 1k-file vault with a synthetic bead store served by the fake bd.
+
+    The fake bd works on a per-test copy of the store, so benchmarks that
+    create or relabel beads do not leak into each other.
+    """
+    root = vault_factory(VAULT_SIZES[0], request.param)
+    store = tmp_path / "issues.jsonl"
+    shutil.copyfile(root / ".beads" / "issues.jsonl", store)
+    monkeypatch.setenv(fakebd.STORE_ENV, str(store))
+    monkeypatch.chdir(root)
+    return root
@@ -0,0 +1,49 @@
+"""Benchmarks for vault scanning, orientation and errand hot paths."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add laytonlib to path for testing
+sys.path.insert(
+    0,
+    str(Path(__file__).parent.parent.parent / "skills" / "layton" / "scripts"),
+)
+
+pytest.importorskip("pytest_benchmark")
+
+from laytonlib.errands import build_prompt, schedule_errand
+from laytonlib.formatters import OutputFormatter
+from laytonlib.orientation import run_orientation
+from laytonlib.protocols import _build_protocol, _scan_markdown_dir, get_protocols_dir
+from laytonlib.rolodex import list_cards
+
+
+def test_list_cards(benchmark, vault):
+    cards = benchmark(list_cards)
+    assert len(cards) == len(list((vault / ".layton" / "rolodex").glob("*.md")))
+
+
+def test_scan_markdown_dir(benchmark, vault):
+    protocols = benchmark(_scan_markdown_dir, get_protocols_dir(), _build_protocol)
+    assert protocols
+
+
+def test_run_orientation(benchmark, bead_vault):
+    responses = []
+    formatter = OutputFormatter(sink=responses.append)
+
+    assert benchmark(run_orientation, formatter) == 0
+    assert responses[-1]["data"]["errands"]["queue"]["scheduled"]
+
+
+def test_build_prompt(benchmark, bead_vault):
+    # bd-2 is a scheduled bead (see generate_beads)
+    prompt = benchmark(build_prompt, "bd-2")
+    assert prompt.startswith("# Errand: bd-2")
+
+
+def test_schedule_errand(benchmark, bead_vault):
+    result, _ = benchmark(schedule_errand, "errand-00001", {"target": "inbox"})
+    assert result["id"]
@@ -1,10 +1,17 @@
 """Shared pytest fixtures for Layton tests."""
 
+import os
 import shutil
-from pathlib import Path  # noqa: F401 - used in type hints
+import sys
+from pathlib import Path
 
 import pytest
 
+# Add laytonlib to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent / "skills" / "layton" / "scripts"))
+
+from laytonlib.testing import fakebd
+
 
 @pytest.fixture
 def isolated_env(tmp_path, monkeypatch):
@@ -45,8 +52,23 @@ def mock_beads_unavailable(monkeypatch):
 
 
 @pytest.fixture
-def real_beads_isolated(isolated_env):
-    """Real bd CLI in isolated temp directory (integration tests)."""
+def fake_bd(tmp_path, monkeypatch):
+    """Put laytonlib.testing.fakebd first on PATH as `bd`."""
+    bin_dir = tmp_path / "bin"
+    fakebd.install(bin_dir)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.delenv(fakebd.STORE_ENV, raising=False)
+    return bin_dir / "bd"
+
+
+@pytest.fixture
+def real_beads_isolated(isolated_env, request):
+    """Real bd CLI in isolated temp directory (integration tests).
+
+    With LAYTON_FAKE_BD=1 the fake bd (laytonlib.testing.fakebd) stands in.
+    """
+    if os.environ.get(fakebd.FAKE_BD_ENV) == "1":
+        request.getfixturevalue("fake_bd")
     # bd will auto-init in isolated_env/.beads/ on first write
     return isolated_env / ".beads"
 
@@ -0,0 +1,117 @@
+"""Unit tests for batched command mode."""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add laytonlib to path for testing
+sys.path.insert(
+    0,
+    str(Path(__file__).parent.parent.parent / "skills" / "layton" / "scripts"),
+)
+
+from laytonlib.batch import parse_request, run_batch
+from laytonlib.cli import main
+from laytonlib.formatters import OutputFormatter
+
+
+def _run(lines: list[str]) -> tuple[int, list[dict]]:
+    out = io.StringIO()
+    code = run_batch(OutputFormatter(), lines=lines, out=out)
+    return code, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+class TestParseRequest:
+    """Tests for request line parsing."""
+
+    def test_argv_array(self):
+        assert parse_request('["config", "show"]', 3) == (3, ["config", "show"])
+
+    def test_object_with_id(self):
+        line = '{"id": "q1", "argv": ["context"]}'
+        assert parse_request(line, 0) == ("q1", ["context"])
+
+    @pytest.mark.parametrize("line", ["nope", '{"id": 1}', '["config", 2]'])
+    def test_invalid(self, line):
+        with pytest.raises(ValueError):
+            parse_request(line, 0)
+
+
+class TestRunBatch:
+    """Tests for running a batch of requests."""
+
+    def test_results_in_order_with_ids(self, temp_config):
+        """One result per request, tagged with id and exit code."""
+        temp_config.write_text(json.dumps({"a": 1, "b": {"c": 2}}))
+
+        code, results = _run(
+            [
+                '["config", "get", "a"]',
+                "\n",
+                '{"id": "second", "argv": ["config", "get", "b.c"]}',
+            ]
+        )
+
+        assert code == 0
+        assert [r["id"] for r in results] == [0, "second"]
+        assert [r["data"]["value"] for r in results] == [1, 2]
+        assert all(r["exit_code"] == 0 and r["success"] for r in results)
+
+    def test_errors_do_not_stop_the_batch(self, temp_config):
+        """Bad requests get an error line; later requests still run."""
+        temp_config.write_text("{}")
+
+        code, results = _run(
+            [
+                "not json",
+                '["no-such-command"]',
+                '["serve"]',
+                '["config", "get", "missing"]',
+                '["config", "show"]',
+            ]
+        )
+
+        assert code == 2
+        assert [r["error"]["code"] for r in results[:4]] == [
+            "INVALID_REQUEST",
+            "INVALID_ARGS",
+            "UNSUPPORTED_COMMAND",
+            "KEY_NOT_FOUND",
+        ]
+        assert results[3]["exit_code"] == 1
+        assert results[4]["success"] is True
+
+    def test_streamed_records_are_all_returned(self, temp_config):
+        """orientation --stream keeps every section record, not just the summary."""
+        temp_config.write_text("{}")
+
+        code, results = _run(['["--stream", "--only", "rolodex,errands"]'])
+
+        assert code == 0
+        assert len(results) == 1
+        assert results[0]["success"] is True
+        assert [r["section"] for r in results[0]["records"]] == [
+            "rolodex",
+            "errands",
+            "summary",
+        ]
+
+    def test_config_writes_are_shared_and_written_once(
+        self, temp_config, monkeypatch, capsys
+    ):
+        """Requests see earlier staged config writes; the file is written at the end."""
+        temp_config.write_text("{}")
+        monkeypatch.setattr(
+            sys,
+            "stdin",
+            io.StringIO('["config", "set", "x", "1"]\n["config", "get", "x"]\n'),
+        )
+
+        assert main(["batch"]) == 0
+
+        results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert results[1]["data"]["value"] == 1
+        assert json.loads(temp_config.read_text()) == {"x": 1}
@@ -1,7 +1,11 @@
 """Unit tests for errands module."""
 
+import json
 import sys
 from pathlib import Path
+from typing import ClassVar
+
+import pytest
 
 # Add laytonlib to path for testing
 sys.path.insert(
@@ -12,16 +16,28 @@ sys.path.insert(
 from laytonlib.errands import (
     ERRAND_TEMPLATE,
     ErrandInfo,
+    QueueBudget,
+    QueueSnapshot,
     _transition_to_in_progress,
     add_errand,
+    apply_budget,
     build_prompt,
+    check_variables,
+    compile_errand,
+    expand_matrix,
     get_bead,
+    get_beads_by_label,
     get_beads_in_progress,
+    get_queue_snapshot,
+    lint_errands,
     list_errands,
+    load_errand,
     parse_frontmatter,
+    partition_queue,
     schedule_errand,
 )
-from laytonlib.cli import _parse_json_vars
+from laytonlib.cli import _parse_json_vars, main, run_schedule_many
+from laytonlib.formatters import OutputFormatter
 
 
 class TestParseFrontmatter:
@@ -259,7 +275,7 @@ Check ${missing_var} as well.
             shutil, "which", lambda cmd: "/usr/bin/bd" if cmd == "bd" else None
         )
 
-        result = schedule_errand("review", {"file_path": "src/auth.py"})
+        result, warnings = schedule_errand("review", {"file_path": "src/auth.py"})
 
         # Result should come from mocked bd
         assert result["id"] == "bead-123"
@@ -269,6 +285,9 @@ Check ${missing_var} as well.
         rendered_body = captured_cmd[description_idx]
         assert "src/auth.py" in rendered_body  # Variable was substituted
         assert "${missing_var}" in rendered_body  # Unsubstituted var remains as-is
+        assert warnings == [
+            "Missing variable 'missing_var' (${missing_var} stays unfilled)"
+        ]
 
 
 class TestErrandTemplate:
@@ -592,6 +611,20 @@ class TestBuildPrompt:
         assert "bead-88" in result
         assert "bd close bead-88" in result
 
+    def test_no_transition_for_unknown_bead(self, monkeypatch):
+        """The label write only happens after the bead lookup succeeds."""
+        from laytonlib import errands as errands_module
+
+        transition_calls = []
+        monkeypatch.setattr(errands_module, "get_bead", lambda bid: None)
+        monkeypatch.setattr(errands_module, "get_bead_comments", lambda bid: "")
+        monkeypatch.setattr(
+            errands_module, "_transition_to_in_progress", transition_calls.append
+        )
+
+        assert build_prompt("missing") is None
+        assert transition_calls == []
+
 
 class TestParseJsonVars:
     """Tests for _parse_json_vars helper."""
@@ -634,3 +667,646 @@ class TestParseJsonVars:
         """Returns None for valid JSON number."""
         result = _parse_json_vars("42")
         assert result is None
+
+
+class TestQueueSnapshot:
+    """Tests for the single-call queue snapshot."""
+
+    def test_single_bd_call(self, monkeypatch):
+        """Fetches all Layton beads (including closed) in one bd list."""
+        import json
+        import shutil
+        import subprocess
+
+        monkeypatch.setattr(
+            shutil, "which", lambda cmd: "/usr/bin/bd" if cmd == "bd" else None
+        )
+
+        beads = [
+            {"id": "b-1", "status": "open", "labels": ["layton", "scheduled"]},
+            {"id": "b-2", "status": "open", "labels": ["layton", "in-progress"]},
+            {"id": "b-3", "status": "closed", "labels": ["layton", "needs-review"]},
+            {"id": "b-4", "status": "closed", "labels": ["layton", "scheduled"]},
+            {"id": "b-5", "status": "open", "labels": ["layton", "needs-review"]},
+        ]
+        captured_cmds = []
+
+        def mock_run(cmd, *args, **kwargs):
+            captured_cmds.append(list(cmd))
+
+            class Result:
+                stdout = "Warning: noise\n" + json.dumps(beads)
+                returncode = 0
+
+            return Result()
+
+        monkeypatch.setattr(subprocess, "run", mock_run)
+
+        snapshot = get_queue_snapshot()
+
+        assert len(captured_cmds) == 1
+        assert captured_cmds[0][:5] == ["bd", "list", "-l", "layton", "--all"]
+        assert [b["id"] for b in snapshot.scheduled] == ["b-1"]
+        assert [b["id"] for b in snapshot.in_progress] == ["b-2"]
+        assert [b["id"] for b in snapshot.pending_review] == ["b-3"]
+
+    def test_empty_when_bd_unavailable(self, monkeypatch):
+        """Returns empty queues when bd CLI is not installed."""
+        import shutil
+
+        monkeypatch.setattr(shutil, "which", lambda cmd: None)
+
+        snapshot = get_queue_snapshot()
+        assert snapshot.to_dict() == {
+            "scheduled": [],
+            "in_progress": [],
+            "pending_review": [],
+        }
+        assert snapshot.failed
+
+    def test_failed_when_bd_prints_bad_json(self, monkeypatch):
+        """A broken bd list is reported, not mistaken for an empty queue."""
+        import shutil
+        import subprocess
+
+        monkeypatch.setattr(shutil, "which", lambda cmd: "/usr/bin/bd")
+
+        def mock_run(cmd, *args, **kwargs):
+            class Result:
+                stdout = "[{not json"
+                stderr = ""
+                returncode = 0
+
+            return Result()
+
+        monkeypatch.setattr(subprocess, "run", mock_run)
+
+        assert get_queue_snapshot().failed
+
+    def test_partition_ignores_non_layton_beads(self):
+        """Beads without the layton label never reach a queue."""
+        snapshot = partition_queue(
+            [{"id": "x", "status": "open", "labels": ["scheduled"]}]
+        )
+        assert snapshot.scheduled == []
+
+
+class TestQueueBudget:
+    """Tests for field projection and size budgets of queue output."""
+
+    BEADS: ClassVar[list[dict]] = [
+        {"id": f"b-{i}", "title": f"Errand {i}", "description": "x" * 500}
+        for i in range(10)
+    ]
+
+    def test_no_budget_is_verbatim(self):
+        snapshot = QueueSnapshot(scheduled=self.BEADS)
+        assert snapshot.to_dict(QueueBudget()) == snapshot.to_dict()
+        assert "truncated" not in snapshot.to_dict(QueueBudget())
+
+    def test_fields_projection(self):
+        kept, dropped = apply_budget(self.BEADS[:2], QueueBudget(fields=["id"]))
+        assert kept == [{"id": "b-0"}, {"id": "b-1"}]
+        assert dropped == 0
+
+    def test_max_items(self):
+        kept, dropped = apply_budget(self.BEADS, QueueBudget(max_items=3))
+        assert [b["id"] for b in kept] == ["b-0", "b-1", "b-2"]
+        assert dropped == 7
+
+    def test_max_bytes_bounds_serialized_size(self):
+        import json
+
+        budget = QueueBudget(max_bytes=1200)
+        kept, dropped = apply_budget(self.BEADS, budget)
+
+        assert len(json.dumps(kept, separators=(",", ":"))) <= 1200
+        assert len(kept) == 2
+        assert dropped == 8
+
+    def test_truncation_counts_per_queue(self):
+        snapshot = QueueSnapshot(
+            scheduled=self.BEADS, in_progress=self.BEADS[:1], pending_review=[]
+        )
+
+        result = snapshot.to_dict(QueueBudget(fields=["id", "title"], max_items=4))
+
+        assert result["scheduled"][0] == {"id": "b-0", "title": "Errand 0"}
+        assert result["truncated"] == {
+            "scheduled": 6,
+            "in_progress": 0,
+            "pending_review": 0,
+        }
+
+
+class TestBeadsJsonlReader:
+    """Tests for the read-only .beads/ JSONL fast path."""
+
+    BEADS: ClassVar[list[dict]] = [
+        {
+            "id": "b-1",
+            "title": "One",
+            "status": "open",
+            "labels": ["layton", "scheduled"],
+        },
+        {
+            "id": "b-2",
+            "title": "Two",
+            "status": "closed",
+            "labels": ["layton", "needs-review"],
+        },
+        {"id": "b-3", "title": "Three", "status": "open", "labels": ["other"]},
+        {
+            "id": "b-4",
+            "title": "Gone",
+            "status": "tombstone",
+            "labels": ["layton", "scheduled"],
+        },
+    ]
+
+    def _write_store(self, beads_dir, beads=None, metadata=None):
+        import json
+
+        if metadata is not None:
+            (beads_dir / "metadata.json").write_text(json.dumps(metadata))
+        lines = [json.dumps(b) for b in (beads if beads is not None else self.BEADS)]
+        (beads_dir / "issues.jsonl").write_text("\n".join(lines) + "\n")
+
+    def _forbid_bd(self, monkeypatch):
+        import subprocess
+
+        def mock_run(cmd, *args, **kwargs):
+            raise AssertionError(f"bd should not be spawned: {cmd}")
+
+        monkeypatch.setattr(subprocess, "run", mock_run)
+
+    def test_label_query_reads_store(self, isolated_env, monkeypatch):
+        """get_beads_by_label filters labels and status without spawning bd."""
+        self._write_store(isolated_env / ".beads")
+        monkeypatch.setenv("LAYTON_BEADS_JSONL", "1")
+        self._forbid_bd(monkeypatch)
+
+        result = get_beads_by_label("layton,scheduled", status="open")
+        assert [b["id"] for b in result] == ["b-1"]
+
+    def test_default_excludes_closed(self, isolated_env, monkeypatch):
+        """Without a status, closed beads are excluded like `bd list`."""
+        self._write_store(isolated_env / ".beads")
+        monkeypatch.setenv("LAYTON_BEADS_JSONL", "1")
+        self._forbid_bd(monkeypatch)
+
+        assert [b["id"] for b in get_beads_by_label("layton")] == ["b-1"]
+
+    def test_queue_snapshot_reads_store(self, isolated_env, monkeypatch):
+        """Queue snapshot includes closed needs-review beads."""
+        self._write_store(isolated_env / ".beads")
+        monkeypatch.setenv("LAYTON_BEADS_JSONL", "1")
+        self._forbid_bd(monkeypatch)
+
+        snapshot = get_queue_snapshot()
+        assert [b["id"] for b in snapshot.scheduled] == ["b-1"]
+        assert [b["id"] for b in snapshot.pending_review] == ["b-2"]
+
+    def test_get_bead_reads_store(self, isolated_env, monkeypatch):
+        """get_bead finds closed beads and returns None for unknown IDs."""
+        self._write_store(isolated_env / ".beads")
+        monkeypatch.setenv("LAYTON_BEADS_JSONL", "1")
+        self._forbid_bd(monkeypatch)
+
+        assert get_bead("b-2")["title"] == "Two"
+        assert get_bead("b-99") is None
+
+    def test_disabled_by_default(self, isolated_env, monkeypatch):
+        """Without the env var, bd is used."""
+        self._write_store(isolated_env / ".beads")
+        monkeypatch.delenv("LAYTON_BEADS_JSONL", raising=False)
+        monkeypatch.setattr("shutil.which", lambda cmd: None)
+
+        assert get_beads_by_label("layton") == []
+
+    def test_unknown_backend_falls_back(self, isolated_env, monkeypatch):
+        """An unrecognized backend falls back to the bd CLI."""
+        self._write_store(isolated_env / ".beads", metadata={"backend": "dolt"})
+        monkeypatch.setenv("LAYTON_BEADS_JSONL", "1")
+        monkeypatch.setattr("shutil.which", lambda cmd: None)
+
+        assert get_beads_by_label("layton") == []
+
+    def test_unknown_record_format_falls_back(self, isolated_env, monkeypatch):
+        """Records missing required keys fall back to the bd CLI."""
+        self._write_store(isolated_env / ".beads", beads=[{"key": "value"}])
+        monkeypatch.setenv("LAYTON_BEADS_JSONL", "1")
+        monkeypatch.setattr("shutil.which", lambda cmd: None)
+
+        assert get_bead("b-1") is None
+        assert get_beads_by_label("layton") == []
+
+    def test_stale_export_falls_back(self, isolated_env, monkeypatch):
+        """A database newer than the export falls back to the bd CLI."""
+        import os
+
+        beads_dir = isolated_env / ".beads"
+        self._write_store(beads_dir)
+        db_path = beads_dir / "beads.db"
+        db_path.write_text("")
+        jsonl_stat = (beads_dir / "issues.jsonl").stat()
+        os.utime(db_path, ns=(jsonl_stat.st_atime_ns, jsonl_stat.st_mtime_ns + 10**9))
+        monkeypatch.setenv("LAYTON_BEADS_JSONL", "1")
+        monkeypatch.setattr("shutil.which", lambda cmd: None)
+
+        assert get_beads_by_label("layton") == []
+
+    def test_pending_wal_falls_back(self, isolated_env, monkeypatch):
+        """Writes still in beads.db-wal make the export stale too."""
+        import os
+
+        beads_dir = isolated_env / ".beads"
+        self._write_store(beads_dir)
+        wal_path = beads_dir / "beads.db-wal"
+        wal_path.write_text("")
+        jsonl_stat = (beads_dir / "issues.jsonl").stat()
+        os.utime(wal_path, ns=(jsonl_stat.st_atime_ns, jsonl_stat.st_mtime_ns + 10**9))
+        monkeypatch.setenv("LAYTON_BEADS_JSONL", "1")
+        monkeypatch.setattr("shutil.which", lambda cmd: None)
+
+        assert get_beads_by_label("layton") == []
+
+    def test_corrupt_line_falls_back(self, isolated_env, monkeypatch):
+        """A line that is not JSON could hide a bead, so bd is used."""
+        beads_dir = isolated_env / ".beads"
+        self._write_store(beads_dir)
+        with open(beads_dir / "issues.jsonl", "a") as f:
+            f.write('{"id": "b-5", "labels": ["layton", "sched\n')
+        monkeypatch.setenv("LAYTON_BEADS_JSONL", "1")
+        monkeypatch.setattr("shutil.which", lambda cmd: None)
+
+        assert get_beads_by_label("layton") == []
+        assert get_bead("b-5") is None
+
+    def test_non_ascii_label(self, isolated_env, monkeypatch):
+        """Labels written as raw UTF-8 still match."""
+        import json
+
+        bead = {"id": "b-9", "title": "Café", "status": "open", "labels": ["café"]}
+        (isolated_env / ".beads" / "issues.jsonl").write_text(
+            json.dumps(bead, ensure_ascii=False) + "\n", encoding="utf-8"
+        )
+        monkeypatch.setenv("LAYTON_BEADS_JSONL", "1")
+        self._forbid_bd(monkeypatch)
+
+        assert [b["id"] for b in get_beads_by_label("café")] == ["b-9"]
+
+
+class TestScheduleMany:
+    """Tests for errands schedule-many (runs against the fake bd)."""
+
+    @pytest.fixture
+    def vault(self, temp_errands_dir, temp_config, fake_bd):
+        temp_config.write_text(json.dumps({"errands": {"epic": "bd-epic"}}))
+        (temp_errands_dir / "review.md").write_text(
+            "---\nname: review\ndescription: Review a file\n---\n\nReview ${file}.\n"
+        )
+        return temp_errands_dir.parent.parent
+
+    def _run(self, capsys, *records) -> tuple[int, list[dict]]:
+        lines = [r if isinstance(r, str) else json.dumps(r) for r in records]
+        exit_code = run_schedule_many(OutputFormatter(), lines)
+        output = capsys.readouterr().out
+        return exit_code, [json.loads(line) for line in output.splitlines()]
+
+    def test_schedules_each_record(self, vault, capsys, monkeypatch):
+        from laytonlib import errands as errands_module
+
+        loads = []
+        original = errands_module._parse_errand
+        monkeypatch.setattr(
+            errands_module,
+            "_parse_errand",
+            lambda name, *args: loads.append(name) or original(name, *args),
+        )
+
+        records = [
+            {"id": f"r{i}", "name": "review", "variables": {"file": f"f{i}.py"}}
+            for i in range(3)
+        ]
+        exit_code, results = self._run(capsys, *records)
+
+        assert exit_code == 0
+        assert loads == ["review"]
+        summary = results.pop()
+        assert summary["summary"] == {"scheduled": 3, "failed": 0}
+        assert sorted(r["id"] for r in results) == ["r0", "r1", "r2"]
+        bead_ids = {r["data"]["bead_id"] for r in results}
+        assert len(bead_ids) == 3
+
+        descriptions = sorted(
+            get_bead(bead_id)["description"].strip() for bead_id in bead_ids
+        )
+        assert descriptions == ["Review f0.py.", "Review f1.py.", "Review f2.py."]
+
+    def test_reports_errors_per_record(self, vault, capsys):
+        exit_code, results = self._run(
+            capsys, {"name": "review"}, {"name": "missing"}, "not json"
+        )
+
+        assert exit_code == 1
+        errors = {r["id"]: r["error"]["code"] for r in results if "error" in r}
+        assert errors == {1: "ERRAND_NOT_FOUND", 2: "INVALID_REQUEST"}
+        assert results[-1]["summary"] == {"scheduled": 1, "failed": 2}
+
+    def test_no_requests(self, vault, capsys):
+        exit_code = run_schedule_many(OutputFormatter(), ["", "\n"])
+
+        assert exit_code == 1
+        assert json.loads(capsys.readouterr().out)["error"]["code"] == "NO_REQUESTS"
+
+    def test_no_epic(self, vault, temp_config, capsys):
+        temp_config.write_text("{}")
+        exit_code = run_schedule_many(OutputFormatter(), ['{"name": "review"}'])
+
+        assert exit_code == 1
+        assert json.loads(capsys.readouterr().out)["error"]["code"] == "NO_EPIC"
+
+
+class TestMatrix:
+    """Tests for errands schedule --matrix."""
+
+    def test_cartesian_product(self):
+        combos = expand_matrix({"file": ["a.py", "b.py"], "sev": ["high", "low"]})
+        assert combos == [
+            {"file": "a.py", "sev": "high"},
+            {"file": "a.py", "sev": "low"},
+            {"file": "b.py", "sev": "high"},
+            {"file": "b.py", "sev": "low"},
+        ]
+
+    def test_base_variables_and_scalars(self):
+        combos = expand_matrix({"file": ["a.py", "b.py"], "sev": "high"}, {"x": "1"})
+        assert combos == [
+            {"x": "1", "file": "a.py", "sev": "high"},
+            {"x": "1", "file": "b.py", "sev": "high"},
+        ]
+
+    @pytest.mark.parametrize("matrix", [{}, [], {"file": []}])
+    def test_invalid(self, matrix):
+        with pytest.raises(ValueError, match="INVALID_MATRIX"):
+            expand_matrix(matrix)
+
+    def test_too_many_combinations(self):
+        with pytest.raises(ValueError, match="combinations"):
+            expand_matrix({"a": list(range(100)), "b": list(range(100))})
+
+    def test_schedules_each_combination(
+        self, temp_errands_dir, temp_config, fake_bd, capsys
+    ):
+        temp_config.write_text(json.dumps({"errands": {"epic": "bd-epic"}}))
+        (temp_errands_dir / "review.md").write_text(
+            "---\nname: review\n---\n\nReview ${file} for ${sev}.\n"
+        )
+
+        matrix = json.dumps({"file": ["a.py", "b.py"], "sev": ["high", "low"]})
+        assert main(["errands", "schedule", "review", "{}", "--matrix", matrix]) == 0
+        data = json.loads(capsys.readouterr().out)["data"]
+
+        assert data["matrix"] == {"combinations": 4, "scheduled": 4, "failed": 0}
+        assert [s["variables"]["file"] for s in data["scheduled"]] == [
+            "a.py",
+            "a.py",
+            "b.py",
+            "b.py",
+        ]
+        bead = get_bead(data["scheduled"][-1]["bead_id"])
+        assert bead["description"].strip() == "Review b.py for low."
+
+    def test_unknown_errand(self, temp_errands_dir, temp_config, capsys):
+        matrix = json.dumps({"file": ["a.py"]})
+        assert main(["errands", "schedule", "nope", "{}", "--matrix", matrix]) == 1
+        error = json.loads(capsys.readouterr().out)["error"]
+        assert error["code"] == "ERRAND_NOT_FOUND"
+
+
+class TestCompiledErrandCache:
+    """Tests for the compiled errand cache (memory and .layton/cache/errands/)."""
+
+    @pytest.fixture
+    def errand(self, temp_errands_dir, monkeypatch):
+        from laytonlib import errands as errands_module
+
+        monkeypatch.setattr(errands_module, "_compiled", {})
+        path = temp_errands_dir / "review.md"
+        path.write_text(
+            "---\nname: review\ndescription: Review\n---\n\nReview ${file} (${sev}).\n"
+        )
+        return path
+
+    def _count_loads(self, monkeypatch) -> list[str]:
+        from laytonlib import errands as errands_module
+
+        loads = []
+        original = errands_module._parse_errand
+        monkeypatch.setattr(
+            errands_module,
+            "_parse_errand",
+            lambda name, *args: loads.append(name) or original(name, *args),
+        )
+        return loads
+
+    def test_parses_once(self, errand, monkeypatch):
+        loads = self._count_loads(monkeypatch)
+
+        first = compile_errand("review")
+        assert compile_errand("review") is first
+        assert loads == ["review"]
+        assert first.placeholders == {"file", "sev"}
+
+    def test_content_change_recompiles(self, errand, monkeypatch):
+        loads = self._count_loads(monkeypatch)
+        compile_errand("review")
+        errand.write_text("---\nname: review\n---\n\nOnly ${file}.\n")
+
+        assert compile_errand("review").placeholders == {"file"}
+        assert loads == ["review", "review"]
+
+    def test_disk_cache(self, errand, isolated_env, monkeypatch):
+        from laytonlib import errands as errands_module
+
+        compile_errand("review")
+        assert (isolated_env / ".layton" / "cache" / "errands" / "review.json").exists()
+
+        # A new process: empty memory cache, nothing parsed
+        monkeypatch.setattr(errands_module, "_compiled", {})
+        loads = self._count_loads(monkeypatch)
+        compiled = compile_errand("review")
+
+        assert loads == []
+        assert compiled.title == "[review] Review"
+        assert compiled.render({"file": "a.py", "sev": "high"}).strip() == (
+            "Review a.py (high)."
+        )
+
+    @pytest.mark.parametrize(
+        "damage",
+        [
+            lambda entry: entry.pop("info"),
+            lambda entry: entry["info"].pop("variables"),
+            lambda entry: entry.update(info="review"),
+            lambda entry: entry.update(placeholders=None),
+            lambda entry: entry.pop("body"),
+        ],
+    )
+    def test_damaged_disk_cache_is_a_miss(
+        self, errand, isolated_env, monkeypatch, damage
+    ):
+        from laytonlib import errands as errands_module
+
+        compile_errand("review")
+        cache_path = isolated_env / ".layton" / "cache" / "errands" / "review.json"
+        entry = json.loads(cache_path.read_text())
+        damage(entry)
+        cache_path.write_text(json.dumps(entry))
+
+        monkeypatch.setattr(errands_module, "_compiled", {})
+        loads = self._count_loads(monkeypatch)
+
+        assert compile_errand("review").placeholders == {"file", "sev"}
+        assert loads == ["review"]
+
+    def test_parses_the_hashed_content(self, errand, monkeypatch):
+        """An edit right after hashing never pairs a new body with the old hash."""
+        import hashlib
+
+        from laytonlib import errands as errands_module
+
+        original = errands_module._parse_errand
+
+        def parse_after_edit(name, path, content):
+            errand.write_text("---\nname: review\n---\n\nEdited ${other}.\n")
+            return original(name, path, content)
+
+        monkeypatch.setattr(errands_module, "_parse_errand", parse_after_edit)
+        compiled = compile_errand("review")
+
+        assert compiled.placeholders == {"file", "sev"}
+        digest, cached = errands_module._compiled[errand]
+        assert cached is compiled
+        old = (
+            b"---\nname: review\ndescription: Review\n---\n\nReview ${file} (${sev}).\n"
+        )
+        assert digest == hashlib.sha256(old).hexdigest()
+
+    def test_crlf_errand(self, errand):
+        """An errand saved with Windows line endings renders without CR."""
+        errand.write_bytes(errand.read_bytes().replace(b"\n", b"\r\n"))
+
+        compiled = compile_errand("review")
+
+        assert compiled.info.description == "Review"
+        assert compiled.render({"file": "a.py", "sev": "low"}) == "Review a.py (low).\n"
+
+    def test_missing_errand(self, temp_errands_dir):
+        assert compile_errand("missing") is None
+
+
+class TestVariableValidation:
+    """Tests for errand variable checks, --strict and errands lint."""
+
+    @pytest.fixture
+    def vault(self, temp_errands_dir, temp_config, fake_bd, monkeypatch):
+        from laytonlib import errands as errands_module
+
+        monkeypatch.setattr(errands_module, "_compiled", {})
+        temp_config.write_text(json.dumps({"errands": {"epic": "bd-epic"}}))
+        (temp_errands_dir / "review.md").write_text(
+            "---\nname: review\nvariables:\n  file: File to review\n---\n\n"
+            "Review ${file}.\n"
+        )
+        return temp_errands_dir
+
+    def test_placeholders_on_info(self, vault):
+        info, _ = load_errand("review")
+        assert info.placeholders == {"file"}
+
+    def test_check_variables(self, vault):
+        errand = compile_errand("review")
+        assert check_variables(errand, {"file": "a.py"}) == []
+        assert check_variables(errand, {"fiel": "a.py"}) == [
+            "Missing variable 'file' (${file} stays unfilled)",
+            "Unused variable 'fiel' (no ${fiel} in the errand)",
+        ]
+
+    def test_warns_by_default(self, vault, capsys, monkeypatch):
+        from laytonlib import errands as errands_module
+
+        compiles = []
+        original = errands_module.compile_errand
+        monkeypatch.setattr(
+            errands_module,
+            "compile_errand",
+            lambda name: compiles.append(name) or original(name),
+        )
+
+        assert main(["errands", "schedule", "review", '{"fiel": "a.py"}']) == 0
+        data = json.loads(capsys.readouterr().out)["data"]
+        assert len(data["warnings"]) == 2
+        assert compiles == ["review"]
+
+    def test_other_value_errors_are_not_invalid_variables(self, vault, monkeypatch):
+        from laytonlib import errands as errands_module
+
+        def fail(*args, **kwargs):
+            raise ValueError("something else")
+
+        monkeypatch.setattr(errands_module, "schedule_errand", fail)
+        with pytest.raises(ValueError, match="something else"):
+            main(["errands", "schedule", "review", "{}"])
+
+    def test_strict_rejects_before_create(self, vault, capsys, monkeypatch):
+        from laytonlib import errands as errands_module
+
+        monkeypatch.setattr(
+            errands_module, "bd_create", lambda **kw: pytest.fail("bd create called")
+        )
+        args = ["errands", "schedule", "review", '{"fiel": "a.py"}', "--strict"]
+        assert main(args) == 1
+        error = json.loads(capsys.readouterr().out)["error"]
+        assert error["code"] == "INVALID_VARIABLES"
+
+    def test_schedule_many_strict(self, vault, capsys):
+        lines = [
+            json.dumps({"id": "ok", "name": "review", "variables": {"file": "a"}}),
+            json.dumps({"id": "bad", "name": "review", "variables": {}}),
+        ]
+        assert run_schedule_many(OutputFormatter(), lines, strict=True) == 1
+        results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        by_id = {r["id"]: r for r in results if "id" in r}
+        assert by_id["ok"]["success"]
+        assert by_id["bad"]["error"]["code"] == "INVALID_VARIABLES"
+        assert results[-1]["summary"] == {"scheduled": 1, "failed": 1}
+
+    def test_schedule_many_warnings(self, vault, capsys):
+        lines = [json.dumps({"name": "review", "variables": {}})]
+        assert run_schedule_many(OutputFormatter(), lines) == 0
+        record = json.loads(capsys.readouterr().out.splitlines()[0])
+        assert record["data"]["warnings"] == [
+            "Missing variable 'file' (${file} stays unfilled)"
+        ]
+
+    def test_lint(self, vault, capsys):
+        (vault / "sweep.md").write_text(
+            "---\nname: sweep\nvariables:\n  old: Unused\n---\n\nSweep ${dir} for $5.\n"
+        )
+        (vault / "bare.md").write_text("No frontmatter\n")
+
+        issues = {r["name"]: r["issues"] for r in lint_errands()}
+        assert issues["review"] == []
+        assert issues["bare"] == ["Missing YAML frontmatter"]
+        assert issues["sweep"] == [
+            "Malformed placeholder (use ${name}; write $$ for a $)",
+            "Variable 'dir' is used but not declared",
+            "Variable 'old' is declared but never used",
+        ]
+
+        assert main(["errands", "lint"]) == 1
+        data = json.loads(capsys.readouterr().out)["data"]
+        assert data["checked"] == 3
+        assert [e["name"] for e in data["errands"]] == ["bare", "sweep"]
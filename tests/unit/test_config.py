@@ -1,5 +1,6 @@
 """Unit tests for config module."""
 
+import json
 import sys
 from pathlib import Path
 
@@ -11,11 +12,13 @@ sys.path.insert(
     str(Path(__file__).parent.parent.parent / "skills" / "layton" / "scripts"),
 )
 
+from laytonlib import config as config_module
 from laytonlib.config import (
     collect_keys,
     detect_skill_directory,
     find_vault_root,
     get_default_config,
+    get_layton_dir,
     get_nested,
     load_config,
     parse_value,
@@ -201,6 +204,76 @@ class TestFindVaultRoot:
         assert find_vault_root() == inner
 
 
+class TestVaultContext:
+    """Tests for the resolved-once vault context."""
+
+    def test_resolves_derived_paths(self, tmp_path, monkeypatch):
+        """Vault carries the .layton, .beads and skills paths."""
+        (tmp_path / ".layton").mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        vault = config_module.get_vault()
+
+        assert vault.root == tmp_path
+        assert vault.layton_dir == tmp_path / ".layton"
+        assert vault.beads_dir == tmp_path / ".beads"
+        assert vault.skills_dir == tmp_path / "skills"
+
+    def test_walks_once(self, tmp_path, monkeypatch):
+        """Repeated lookups from the same cwd reuse the resolved vault."""
+        (tmp_path / ".layton").mkdir()
+        child = tmp_path / "sub"
+        child.mkdir()
+        monkeypatch.chdir(child)
+
+        calls = []
+        walk = config_module._walk_to_vault
+        monkeypatch.setattr(
+            config_module,
+            "_walk_to_vault",
+            lambda start: calls.append(start) or walk(start),
+        )
+
+        for _ in range(3):
+            assert get_layton_dir() == tmp_path / ".layton"
+        assert len(calls) <= 1
+
+    def test_removed_vault_is_not_served_from_cache(self, tmp_path, monkeypatch):
+        """A cached vault whose .layton/ is gone is resolved again."""
+        (tmp_path / ".layton").mkdir()
+        monkeypatch.chdir(tmp_path)
+        assert find_vault_root() == tmp_path
+
+        (tmp_path / ".layton").rmdir()
+
+        assert find_vault_root() is None
+
+    def test_env_override_skips_walk(self, tmp_path, monkeypatch):
+        """LAYTON_VAULT names the vault root without walking from cwd."""
+        vault_dir = tmp_path / "vault"
+        (vault_dir / ".layton").mkdir(parents=True)
+        elsewhere = tmp_path / "elsewhere"
+        elsewhere.mkdir()
+        monkeypatch.chdir(elsewhere)
+        monkeypatch.setenv("LAYTON_VAULT", str(vault_dir))
+        monkeypatch.setattr(
+            config_module,
+            "_walk_to_vault",
+            lambda start: pytest.fail("walked despite LAYTON_VAULT"),
+        )
+
+        assert find_vault_root() == vault_dir
+        assert get_layton_dir() == vault_dir / ".layton"
+
+    def test_env_override_without_layton_dir(self, tmp_path, monkeypatch):
+        """LAYTON_VAULT without .layton/ is not a vault, but is the init target."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("LAYTON_VAULT", str(tmp_path / "new"))
+
+        assert find_vault_root() is None
+        assert get_layton_dir() == tmp_path / "new" / ".layton"
+
+
 class TestDetectSkillDirectory:
     """Tests for detecting when running from the Layton skill directory."""
 
@@ -254,3 +327,64 @@ class TestLoadSaveConfig:
 
         loaded = load_config()
         assert loaded == config
+
+    def test_load_parses_once(self, temp_config, monkeypatch):
+        """Repeated loads of an unchanged file don't re-read it."""
+        temp_config.write_text('{"a": 1}')
+        old = config_module.time.time_ns() - 10 * config_module.RACY_WINDOW_NS
+        config_module.os.utime(temp_config, ns=(old, old))
+
+        reads = []
+        real_load = config_module.json.load
+        monkeypatch.setattr(
+            config_module.json,
+            "load",
+            lambda f: reads.append(f.name) or real_load(f),
+        )
+
+        for _ in range(3):
+            assert load_config() == {"a": 1}
+        assert len(reads) == 1
+
+    def test_external_change_is_reloaded(self, temp_config):
+        """A change to the file on disk invalidates the cached copy."""
+        temp_config.write_text('{"a": 1}')
+        assert load_config() == {"a": 1}
+
+        temp_config.write_text('{"a": 22}')
+        assert load_config() == {"a": 22}
+
+    def test_load_returns_copy(self, temp_config):
+        """Mutating a loaded config does not affect the cache."""
+        temp_config.write_text('{"a": 1}')
+        load_config()["a"] = 2
+
+        assert load_config() == {"a": 1}
+
+    def test_batch_writes_through(self, temp_config):
+        """Saves inside a batch reach the file immediately."""
+        temp_config.write_text("{}")
+
+        with config_module.config_batch():
+            assert save_config({"a": 1}) is True
+            assert json.loads(temp_config.read_text()) == {"a": 1}
+            assert load_config() == {"a": 1}
+
+    def test_failed_write_is_reported_by_the_command(
+        self, temp_config, capsys, monkeypatch
+    ):
+        """config set reports WRITE_FAILED itself, with no success document."""
+        from laytonlib.cli import main
+
+        temp_config.write_text('{"foo": "bar"}')
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(config_module.os, "replace", fail)
+        assert main(["config", "set", "foo", "qux"]) == 1
+
+        output = capsys.readouterr().out
+        response = json.loads(output)
+        assert response["error"]["code"] == "WRITE_FAILED"
+        assert json.loads(temp_config.read_text()) == {"foo": "bar"}
@@ -0,0 +1,315 @@
+"""Unit tests for the serve daemon and its thin client."""
+
+import io
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add laytonlib to path for testing
+sys.path.insert(
+    0,
+    str(Path(__file__).parent.parent.parent / "skills" / "layton" / "scripts"),
+)
+
+from laytonlib import __version__
+from laytonlib.client import (
+    VALUE_OPTIONS,
+    _peer_uid,
+    forward,
+    get_socket_path,
+    is_local_command,
+)
+from laytonlib.daemon import LaytonServer, _environment, execute
+
+
+class _Stdout(io.StringIO):
+    """StringIO with a bytes .buffer, like sys.stdout."""
+
+    def __init__(self):
+        super().__init__()
+        self.buffer = io.BytesIO()
+
+
+@pytest.fixture
+def socket_path(monkeypatch):
+    """Short socket path (AF_UNIX paths are length-limited)."""
+    sock_dir = Path(tempfile.mkdtemp(prefix="lt-"))
+    path = sock_dir / "d.sock"
+    monkeypatch.setenv("LAYTON_SOCKET", str(path))
+    monkeypatch.delenv("LAYTON_NO_DAEMON", raising=False)
+    yield path
+    if path.exists():
+        path.unlink()
+    sock_dir.rmdir()
+
+
+@pytest.fixture
+def running_server(socket_path):
+    """Daemon serving on socket_path in a background thread."""
+    server = LaytonServer(str(socket_path))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestLaytonServer:
+    """Tests for the daemon socket."""
+
+    def test_socket_is_private_from_bind(self, socket_path, monkeypatch):
+        """The socket is bound under umask 077 and the umask is restored."""
+        modes = []
+        real_bind = socket.socket.bind
+
+        def bind(sock, address):
+            real_bind(sock, address)
+            modes.append(os.stat(address).st_mode & 0o777)
+
+        monkeypatch.setattr(socket.socket, "bind", bind)
+        old_umask = os.umask(0o022)
+        try:
+            server = LaytonServer(str(socket_path))
+            server.server_close()
+            assert os.umask(0o022) == 0o022
+        finally:
+            os.umask(old_umask)
+
+        assert len(modes) == 1
+        assert modes[0] & 0o077 == 0
+
+
+class TestGetSocketPath:
+    """Tests for socket path resolution."""
+
+    def test_env_override(self, monkeypatch):
+        """LAYTON_SOCKET wins over the default."""
+        monkeypatch.setenv("LAYTON_SOCKET", "/tmp/custom.sock")
+        assert get_socket_path() == "/tmp/custom.sock"
+
+    def test_default_is_per_user(self, monkeypatch):
+        """Default path includes the uid."""
+        monkeypatch.delenv("LAYTON_SOCKET", raising=False)
+        assert f"layton-{os.getuid()}.sock" in get_socket_path()
+
+
+class TestIsLocalCommand:
+    """Tests for deciding which invocations are never forwarded."""
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["serve"],
+            ["batch"],
+            ["--format", "compact", "batch"],
+            ["--since=abc", "serve", "--socket", "x"],
+            ["--max-i", "3", "batch"],
+            ["errands", "schedule-many"],
+            ["--verbose", "errands", "schedule-many"],
+        ],
+    )
+    def test_local(self, argv):
+        assert is_local_command(argv)
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            [],
+            ["context"],
+            ["errands", "schedule", "serve"],
+            ["errands", "run", "batch"],
+            ["--since", "serve"],
+            ["--only", "batch", "context"],
+            ["rolodex", "add", "schedule-many"],
+        ],
+    )
+    def test_forwarded(self, argv):
+        assert not is_local_command(argv)
+
+    def test_value_options_match_the_parser(self):
+        """Every top-level option that takes a value is in VALUE_OPTIONS."""
+        from laytonlib.cli import create_parser
+
+        takes_value = {
+            option
+            for action in create_parser()._actions
+            if action.option_strings and action.nargs != 0
+            for option in action.option_strings
+        }
+        assert takes_value == set(VALUE_OPTIONS)
+
+
+class TestExecute:
+    """Tests for running a forwarded invocation in-process."""
+
+    def test_runs_in_request_cwd(self, isolated_env, tmp_path_factory):
+        """Command runs against the client's cwd, not the daemon's."""
+        other = tmp_path_factory.mktemp("elsewhere")
+        os.chdir(other)
+        code, out, _ = execute(
+            {"argv": ["config", "init"], "cwd": str(isolated_env), "stdin": None}
+        )
+
+        assert code == 0
+        assert (isolated_env / ".layton" / "config.json").exists()
+        assert json.loads(out)["success"] is True
+        assert Path.cwd() == other
+
+    def test_forwards_stdin(self, temp_errands_dir, mock_beads_unavailable):
+        """Piped stdin reaches _parse_json_vars."""
+        code, out, _ = execute(
+            {
+                "argv": ["errands", "schedule", "x"],
+                "cwd": str(temp_errands_dir.parent.parent),
+                "stdin": "not json",
+            }
+        )
+
+        assert code == 1
+        assert json.loads(out)["error"]["code"] == "INVALID_JSON"
+
+    def test_argparse_exit_is_captured(self, isolated_env):
+        """argparse SystemExit becomes an exit code, not a daemon crash."""
+        code, _, err = execute(
+            {"argv": ["--no-such-flag"], "cwd": str(isolated_env), "stdin": None}
+        )
+
+        assert code == 2
+        assert b"unrecognized arguments" in err
+
+
+class TestForward:
+    """Tests for the client side of the socket protocol."""
+
+    def test_returns_none_without_daemon(self, socket_path):
+        """No socket means in-process fallback."""
+        assert forward(["context"]) is None
+
+    def test_socket_path_must_be_a_socket(self, socket_path):
+        """A regular file at the socket path is not connected to."""
+        socket_path.write_text("")
+        assert forward(["context"]) is None
+
+    def test_socket_of_another_user_is_ignored(self, running_server, monkeypatch):
+        """A socket we do not own is never sent the request."""
+        other_uid = os.getuid() + 1
+        monkeypatch.setattr("laytonlib.client.os.getuid", lambda: other_uid)
+        assert forward(["context"]) is None
+        assert running_server.requests_served == 0
+
+    def test_peer_of_another_user_is_ignored(self, running_server, monkeypatch):
+        """The listening process must run as us (where the OS reports it)."""
+        monkeypatch.setattr("laytonlib.client._peer_uid", lambda sock: os.getuid() + 1)
+        monkeypatch.setattr("sys.stdin", io.StringIO(""))
+        monkeypatch.setattr("sys.stdin.isatty", lambda: True)
+
+        assert forward(["context"]) is None
+        assert running_server.requests_served == 0
+
+    @pytest.mark.skipif(
+        not hasattr(socket, "SO_PEERCRED"), reason="SO_PEERCRED not available"
+    )
+    def test_peer_uid(self, running_server, socket_path):
+        """SO_PEERCRED reports the daemon's uid."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+            assert _peer_uid(sock) == os.getuid()
+
+    def test_serve_is_never_forwarded(self, running_server):
+        """'serve' always runs locally."""
+        assert forward(["serve"]) is None
+
+    def test_stdin_streaming_commands_are_never_forwarded(self, running_server):
+        """schedule-many reads stdin as it arrives, so it runs locally."""
+        assert forward(["errands", "schedule-many"]) is None
+
+    def test_opt_out(self, running_server, monkeypatch):
+        """LAYTON_NO_DAEMON disables forwarding."""
+        monkeypatch.setenv("LAYTON_NO_DAEMON", "1")
+        assert forward(["context"]) is None
+
+    def test_round_trip(self, running_server, isolated_env, monkeypatch):
+        """Output and exit code come back from the daemon."""
+        stdout = _Stdout()
+        monkeypatch.setattr("sys.stdout", stdout)
+        monkeypatch.setattr("sys.stderr", _Stdout())
+        monkeypatch.setattr("sys.stdin", io.StringIO(""))
+        monkeypatch.setattr("sys.stdin.isatty", lambda: True)
+
+        code = forward(["config", "init"])
+
+        assert code == 0
+        data = json.loads(stdout.buffer.getvalue())
+        assert data["data"]["created"] == str(isolated_env / ".layton" / "config.json")
+        assert running_server.requests_served == 1
+
+    def test_version_mismatch_falls_back(self, running_server, monkeypatch):
+        """A daemon from another release is ignored."""
+        monkeypatch.setattr("laytonlib.client.__version__", __version__ + "-other")
+        monkeypatch.setattr("sys.stdin", io.StringIO(""))
+        monkeypatch.setattr("sys.stdin.isatty", lambda: True)
+
+        assert forward(["context"]) is None
+
+    def test_version_mismatch_keeps_stdin(self, running_server, monkeypatch):
+        """Piped stdin is still there for the in-process fallback."""
+        monkeypatch.setattr("laytonlib.client.__version__", __version__ + "-other")
+        with tempfile.TemporaryFile("w+") as stdin:
+            stdin.write('{"file": "a.py"}')
+            stdin.seek(0)
+            monkeypatch.setattr("sys.stdin", stdin)
+
+            assert forward(["errands", "schedule", "review"]) is None
+            assert sys.stdin.read() == '{"file": "a.py"}'
+
+    def test_failure_after_send_is_reported(self, socket_path, monkeypatch):
+        """Once the request is sent, a broken reply is an error, not a re-run."""
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(socket_path))
+        listener.listen(1)
+
+        def accept_then_hang_up():
+            conn, _ = listener.accept()
+            with conn, conn.makefile("rb") as rfile:
+                rfile.readline()
+                conn.sendall(b'{"ready": true}\n')
+                rfile.read()
+
+        thread = threading.Thread(target=accept_then_hang_up, daemon=True)
+        thread.start()
+        stdout = _Stdout()
+        monkeypatch.setattr("sys.stdout", stdout)
+        monkeypatch.setattr("sys.stdin", io.StringIO(""))
+        monkeypatch.setattr("sys.stdin.isatty", lambda: True)
+
+        try:
+            assert forward(["errands", "schedule", "review"]) == 2
+        finally:
+            thread.join(timeout=5)
+            listener.close()
+        assert json.loads(stdout.getvalue())["error"]["code"] == "DAEMON_ERROR"
+
+
+class TestEnvironment:
+    """Tests for applying the client's environment in the daemon."""
+
+    def test_bd_environment_is_swapped(self, monkeypatch):
+        """PATH and BEADS_* come from the client and are restored after."""
+        monkeypatch.setenv("PATH", "/daemon/bin")
+        monkeypatch.setenv("BEADS_DIR", "/daemon/.beads")
+        monkeypatch.setenv("UNRELATED", "kept")
+
+        with _environment({"PATH": "/client/bin", "SECRET": "x"}):
+            assert os.environ["PATH"] == "/client/bin"
+            assert "BEADS_DIR" not in os.environ
+            assert "SECRET" not in os.environ
+            assert os.environ["UNRELATED"] == "kept"
+
+        assert os.environ["PATH"] == "/daemon/bin"
+        assert os.environ["BEADS_DIR"] == "/daemon/.beads"
@@ -1,15 +1,20 @@
 """Unit tests for doctor checks."""
 
 import json
+import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add laytonlib to path for testing
 sys.path.insert(
     0,
     str(Path(__file__).parent.parent.parent / "skills" / "layton" / "scripts"),
 )
 
+from laytonlib.bd import get_trace_path, run_bd
+from laytonlib.cli import main
 from laytonlib.doctor import (
     CheckResult,
     check_beads_available,
@@ -17,6 +22,8 @@ from laytonlib.doctor import (
     check_config_valid,
     fix_config,
     get_default_config,
+    load_trace,
+    summarize_trace,
 )
 
 
@@ -128,3 +135,91 @@ class TestCheckResult:
         assert d["name"] == "test"
         assert d["status"] == "pass"
         assert d["message"] == "Test message"
+
+
+@pytest.fixture
+def bd_ok(monkeypatch):
+    """subprocess.run stub for bd that prints a small JSON list."""
+
+    def mock_run(cmd, *args, **kwargs):
+        class Result:
+            stdout = "[]"
+            stderr = ""
+            returncode = 0
+
+        return Result()
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+
+
+class TestBdTrace:
+    """Tests for the LAYTON_TRACE=1 bd call log."""
+
+    def test_no_trace_by_default(self, isolated_env, bd_ok, monkeypatch):
+        monkeypatch.delenv("LAYTON_TRACE", raising=False)
+        run_bd(["list", "--json"])
+        assert not get_trace_path().exists()
+
+    def test_trace_record(self, isolated_env, bd_ok, monkeypatch):
+        monkeypatch.setenv("LAYTON_TRACE", "1")
+        run_bd(["list", "--json"])
+
+        (record,) = load_trace()
+        assert record["argv"] == ["bd", "list", "--json"]
+        assert record["exit_code"] == 0
+        assert record["bytes_out"] == 2
+        assert record["ms"] >= 0
+
+    def test_trace_failed_call(self, isolated_env, monkeypatch):
+        def mock_run(cmd, *args, **kwargs):
+            raise subprocess.CalledProcessError(3, cmd, output="oops")
+
+        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setenv("LAYTON_TRACE", "1")
+        with pytest.raises(subprocess.CalledProcessError):
+            run_bd(["show", "bd-1"])
+
+        (record,) = load_trace()
+        assert record["exit_code"] == 3
+        assert record["bytes_out"] == 4
+
+
+class TestPerf:
+    """Tests for doctor --perf."""
+
+    def test_percentiles_per_subcommand(self):
+        records = [
+            {"argv": ["bd", "list", "--json"], "ms": float(ms), "exit_code": 0}
+            for ms in range(1, 101)
+        ]
+        records.append({"argv": ["bd", "show", "x"], "ms": 5.0, "exit_code": 1})
+
+        summary = summarize_trace(records)
+        assert summary["list"]["calls"] == 100
+        assert summary["list"]["p50_ms"] == 50.0
+        assert summary["list"]["p95_ms"] == 95.0
+        assert summary["list"]["p99_ms"] == 99.0
+        assert summary["list"]["max_ms"] == 100.0
+        assert summary["show"]["errors"] == 1
+
+    def test_report(self, isolated_env, bd_ok, monkeypatch, capsys):
+        monkeypatch.setenv("LAYTON_TRACE", "1")
+        run_bd(["list", "--json"])
+        with get_trace_path().open("a") as f:
+            f.write("not json\n")
+
+        assert main(["doctor", "--perf"]) == 0
+        data = json.loads(capsys.readouterr().out)["data"]
+        assert data["calls"] == 1
+        assert data["subcommands"]["list"]["calls"] == 1
+
+    def test_report_without_trace(self, isolated_env, capsys):
+        assert main(["doctor", "--perf"]) == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output["data"]["calls"] == 0
+        assert any("LAYTON_TRACE" in step for step in output["next_steps"])
+
+    def test_days_requires_perf(self, isolated_env, capsys):
+        assert main(["doctor", "--days", "7"]) == 2
+        output = json.loads(capsys.readouterr().out)
+        assert output["error"]["code"] == "INVALID_OPTIONS"
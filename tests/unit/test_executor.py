@@ -0,0 +1,78 @@
+"""Unit tests for the concurrent bd executor."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add laytonlib to path for testing
+sys.path.insert(
+    0,
+    str(Path(__file__).parent.parent.parent / "skills" / "layton" / "scripts"),
+)
+
+from laytonlib.executor import DEFAULT_MAX_WORKERS, get_max_workers, run_concurrently
+
+
+class TestGetMaxWorkers:
+    """Tests for the concurrency cap."""
+
+    def test_default(self, monkeypatch):
+        """Defaults when LAYTON_BD_CONCURRENCY is unset."""
+        monkeypatch.delenv("LAYTON_BD_CONCURRENCY", raising=False)
+        assert get_max_workers() == DEFAULT_MAX_WORKERS
+
+    def test_env_override(self, monkeypatch):
+        """Reads LAYTON_BD_CONCURRENCY."""
+        monkeypatch.setenv("LAYTON_BD_CONCURRENCY", "8")
+        assert get_max_workers() == 8
+
+    def test_invalid_value_falls_back(self, monkeypatch):
+        """Non-numeric values fall back to the default."""
+        monkeypatch.setenv("LAYTON_BD_CONCURRENCY", "lots")
+        assert get_max_workers() == DEFAULT_MAX_WORKERS
+
+
+class TestRunConcurrently:
+    """Tests for run_concurrently."""
+
+    def test_results_keyed_in_task_order(self):
+        """Returns results under their task keys, in task order."""
+        results = run_concurrently({"b": lambda: 2, "a": lambda: 1})
+        assert list(results.items()) == [("b", 2), ("a", 1)]
+
+    def test_tasks_overlap(self):
+        """All tasks are in flight at the same time."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def task():
+            # Only passes if all three tasks are in flight at once
+            barrier.wait()
+            return True
+
+        results = run_concurrently({"x": task, "y": task, "z": task}, max_workers=3)
+        assert all(results.values())
+
+    def test_cap_of_one_runs_serially(self, monkeypatch):
+        """LAYTON_BD_CONCURRENCY=1 runs tasks inline on the calling thread."""
+        monkeypatch.setenv("LAYTON_BD_CONCURRENCY", "1")
+        main_thread = threading.get_ident()
+        results = run_concurrently({"a": threading.get_ident, "b": threading.get_ident})
+        assert set(results.values()) == {main_thread}
+
+    def test_exception_propagates(self):
+        """A failing task raises after the others have finished."""
+        finished = []
+
+        def slow():
+            time.sleep(0.05)
+            finished.append("slow")
+
+        def boom():
+            raise RuntimeError("BD_ERROR: boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            run_concurrently({"boom": boom, "slow": slow})
+        assert finished == ["slow"]
@@ -0,0 +1,109 @@
+"""Unit tests for the fake bd used by benchmarks."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add laytonlib to path for testing
+sys.path.insert(
+    0,
+    str(Path(__file__).parent.parent.parent / "skills" / "layton" / "scripts"),
+)
+
+from laytonlib.testing import fakebd
+
+
+@pytest.fixture
+def bd(isolated_env, capsys):
+    """Run fake bd commands in the isolated vault, returning stdout."""
+
+    def run(*argv):
+        assert fakebd.main(list(argv)) == 0
+        return capsys.readouterr().out
+
+    return run
+
+
+class TestFakeBd:
+    """Tests for the fake bd subcommands."""
+
+    def test_create_and_show(self, bd):
+        created = json.loads(
+            bd("create", "--title", "Hello", "--labels", "layton,scheduled", "--json")
+        )
+        assert created["id"] == "bd-1"
+
+        (shown,) = json.loads(bd("show", "bd-1", "--json"))
+        assert shown["title"] == "Hello"
+        assert shown["labels"] == ["layton", "scheduled"]
+
+    def test_list_filters(self, bd):
+        bd("create", "--title", "A", "--labels", "layton,scheduled")
+        bd("create", "--title", "B", "--labels", "layton")
+
+        listed = json.loads(bd("list", "-l", "scheduled", "--json", "--limit", "0"))
+        assert [b["title"] for b in listed] == ["A"]
+
+    def test_label_add_remove(self, bd):
+        bd("create", "--title", "A", "--labels", "scheduled")
+        bd("label", "remove", "bd-1", "scheduled")
+        bd("label", "add", "bd-1", "in-progress")
+
+        (shown,) = json.loads(bd("show", "bd-1", "--json"))
+        assert shown["labels"] == ["in-progress"]
+
+    def test_no_comments(self, bd):
+        bd("create", "--title", "A")
+        assert bd("comments", "bd-1").strip() == "No comments on bd-1"
+
+    def test_unknown_bead(self, isolated_env, capsys):
+        assert fakebd.main(["show", "bd-404", "--json"]) == 1
+        assert "not found" in capsys.readouterr().err
+
+    def test_close_hides_from_list(self, bd):
+        bd("create", "--title", "A")
+        bd("close", "bd-1", "--reason", "done")
+
+        assert json.loads(bd("list", "--json")) == []
+        (closed,) = json.loads(bd("list", "--all", "--json"))
+        assert closed["status"] == "closed"
+
+    def test_comments_add(self, bd):
+        bd("create", "--title", "A")
+        bd("comments", "add", "bd-1", "found it")
+        assert "found it" in bd("comments", "bd-1")
+
+    def test_label_list(self, bd):
+        bd("create", "--title", "A", "--labels", "layton")
+        assert json.loads(bd("label", "list", "bd-1", "--json")) == ["layton"]
+
+
+class TestRecordReplay:
+    """Tests for bd cassettes."""
+
+    def test_record_then_replay(self, isolated_env, monkeypatch, capsys):
+        real_bd = isolated_env / "real-bd"
+        real_bd.write_text('#!/bin/sh\necho "real $*"\nexit 3\n')
+        real_bd.chmod(0o755)
+        cassette = isolated_env / "bd.cassette.jsonl"
+
+        monkeypatch.setenv("LAYTON_FAKE_BD_REAL", str(real_bd))
+        monkeypatch.setenv("LAYTON_FAKE_BD_RECORD", str(cassette))
+        assert fakebd.main(["list", "--json"]) == 3
+        assert capsys.readouterr().out == "real list --json\n"
+
+        monkeypatch.delenv("LAYTON_FAKE_BD_RECORD")
+        monkeypatch.setenv("LAYTON_FAKE_BD_REPLAY", str(cassette))
+        real_bd.unlink()
+        assert fakebd.main(["list", "--json"]) == 3
+        assert capsys.readouterr().out == "real list --json\n"
+
+    def test_replay_unrecorded(self, isolated_env, monkeypatch, capsys):
+        cassette = isolated_env / "empty.jsonl"
+        cassette.write_text("")
+        monkeypatch.setenv("LAYTON_FAKE_BD_REPLAY", str(cassette))
+
+        assert fakebd.main(["show", "bd-1"]) == 1
+        assert "no recorded response" in capsys.readouterr().err
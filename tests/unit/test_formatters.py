@@ -0,0 +1,104 @@
+"""Unit tests for output formatting."""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add laytonlib to path for testing
+sys.path.insert(
+    0,
+    str(Path(__file__).parent.parent.parent / "skills" / "layton" / "scripts"),
+)
+
+from laytonlib import formatters
+from laytonlib.cli import main
+from laytonlib.formatters import OutputFormatter, append_field, encode_response
+
+RESPONSE = {"success": True, "data": {"name": "café", "n": [1, 2]}, "next_steps": []}
+
+
+class CountingStdout(io.StringIO):
+    """StringIO that counts write calls."""
+
+    writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+
+class TestEncodeResponse:
+    """Tests for the output encodings."""
+
+    def test_json_is_indented(self):
+        assert encode_response(RESPONSE) == json.dumps(RESPONSE, indent=2) + "\n"
+
+    def test_compact_is_one_line(self):
+        encoded = encode_response(RESPONSE, "compact")
+        assert encoded.endswith("\n")
+        assert "\n" not in encoded[:-1]
+        assert " " not in encoded.replace("café", "")
+        assert json.loads(encoded) == RESPONSE
+
+    def test_compact_without_orjson(self, monkeypatch):
+        """The stdlib fallback produces the same bytes as orjson."""
+        with_orjson = encode_response(RESPONSE, "compact")
+        monkeypatch.setattr(formatters, "orjson", None)
+        assert encode_response(RESPONSE, "compact") == with_orjson
+
+    @pytest.mark.parametrize("fmt", ["json", "compact", "msgpack"])
+    def test_append_field(self, fmt):
+        """Appending a field matches encoding the extended response."""
+        if fmt == "msgpack":
+            pytest.importorskip("msgpack")
+        debug = {"timings": {"total_ms": 1.5, "spans": []}}
+        appended = append_field(encode_response(RESPONSE, fmt), "debug", debug, fmt)
+        assert appended == encode_response({**RESPONSE, "debug": debug}, fmt)
+
+    def test_msgpack_roundtrip(self):
+        msgpack = pytest.importorskip("msgpack")
+        encoded = encode_response(RESPONSE, "msgpack")
+        assert msgpack.unpackb(encoded) == RESPONSE
+
+
+class TestOutputFormatter:
+    """Tests for writing responses."""
+
+    @pytest.mark.parametrize("human", [False, True])
+    def test_single_write(self, monkeypatch, human):
+        """A whole response goes out in one write call."""
+        out = CountingStdout()
+        monkeypatch.setattr(sys, "stdout", out)
+
+        OutputFormatter(human=human).success(
+            {"a": 1, "items": ["x", "y"]}, next_steps=["do it"]
+        )
+
+        assert out.writes == 1
+
+    def test_compact_format(self, capsys):
+        OutputFormatter(format="compact").error("CODE", "message")
+        out = capsys.readouterr().out
+        assert (
+            out
+            == '{"success":false,"error":{"code":"CODE","message":"message"},"next_steps":[]}\n'
+        )
+
+    def test_msgpack_unavailable(self, temp_config, monkeypatch, capsys):
+        """--format msgpack without msgpack installed is a JSON error."""
+        monkeypatch.setattr("laytonlib.cli.msgpack_available", lambda: False)
+
+        assert main(["--format", "msgpack", "context"]) == 1
+
+        result = json.loads(capsys.readouterr().out)
+        assert result["error"]["code"] == "MSGPACK_UNAVAILABLE"
+
+    def test_ndjson_is_an_alias(self):
+        """--format ndjson selects the compact encoding."""
+        from laytonlib.cli import _get_parser
+
+        args = _get_parser().parse_args(["--format", "ndjson", "context"])
+        assert args.format == "compact"
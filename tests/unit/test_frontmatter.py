@@ -0,0 +1,127 @@
+"""Unit tests for the shared frontmatter reader."""
+
+import sys
+from pathlib import Path
+
+# Add laytonlib to path for testing
+sys.path.insert(
+    0,
+    str(Path(__file__).parent.parent.parent / "skills" / "layton" / "scripts"),
+)
+
+from laytonlib.frontmatter import (
+    parse_frontmatter,
+    read_frontmatter,
+    split_frontmatter,
+)
+
+ERRAND = """---
+name: review
+description: Review code
+triggers:
+  - review this
+  - check code
+variables:
+  # comment inside a block
+  file_path: The file to review
+  focus: What to look at
+---
+
+
+## Task
+
+Review ${file_path}.
+"""
+
+
+class TestParseFrontmatter:
+    """Tests for the unified parser."""
+
+    def test_all_forms(self):
+        """Strings, lists and nested mappings in one header."""
+        result = parse_frontmatter(ERRAND)
+        assert result == {
+            "name": "review",
+            "description": "Review code",
+            "triggers": ["review this", "check code"],
+            "variables": {
+                "file_path": "The file to review",
+                "focus": "What to look at",
+            },
+        }
+
+    def test_empty_block_is_omitted(self):
+        """A key with no value and no children is left out."""
+        result = parse_frontmatter("---\nname: x\nvariables:\n---\n")
+        assert result == {"name": "x"}
+
+    def test_unclosed(self):
+        """Missing closing fence means no frontmatter."""
+        assert parse_frontmatter("---\nname: x\n") is None
+
+
+class TestSplitFrontmatter:
+    """Tests for splitting content that is already in memory."""
+
+    def test_same_as_streaming_reader(self, tmp_path):
+        path = tmp_path / "review.md"
+        path.write_text(ERRAND)
+        header = read_frontmatter(path)
+
+        assert split_frontmatter(ERRAND) == (header.data, header.read_body())
+
+    def test_empty_frontmatter(self):
+        assert split_frontmatter("---\n---\n\nBody\n") is None
+
+    def test_crlf(self):
+        content = ERRAND.replace("\n", "\r\n")
+        data, body = split_frontmatter(content)
+
+        assert data == parse_frontmatter(ERRAND)
+        assert body == "## Task\n\nReview ${file_path}.\n"
+
+
+class TestReadFrontmatter:
+    """Tests for the streaming reader."""
+
+    def test_reads_header_and_lazy_body(self, tmp_path):
+        """Body is read from the recorded offset, minus leading blank lines."""
+        path = tmp_path / "review.md"
+        path.write_text(ERRAND)
+
+        header = read_frontmatter(path)
+
+        assert header.data == parse_frontmatter(ERRAND)
+        assert header.read_body() == "## Task\n\nReview ${file_path}.\n"
+
+    def test_crlf_body(self, tmp_path):
+        """Windows line endings are normalized, as read_text() did."""
+        path = tmp_path / "review.md"
+        path.write_bytes(ERRAND.replace("\n", "\r\n").encode())
+
+        header = read_frontmatter(path)
+
+        assert header.data == parse_frontmatter(ERRAND)
+        assert header.read_body() == "## Task\n\nReview ${file_path}.\n"
+
+    def test_stops_at_closing_fence(self, tmp_path):
+        """Bytes after the header are never decoded."""
+        path = tmp_path / "big.md"
+        path.write_bytes(b"---\nname: big\n---\n" + b"\xff\xfe" * 1000)
+
+        header = read_frontmatter(path)
+
+        assert header.data == {"name": "big"}
+        assert header.body_offset == len(b"---\nname: big\n---\n")
+
+    def test_no_frontmatter(self, tmp_path):
+        """Files without an opening fence return None."""
+        path = tmp_path / "plain.md"
+        path.write_text("# Title\n\n---\nname: nope\n---\n")
+        assert read_frontmatter(path) is None
+
+    def test_empty_frontmatter(self, tmp_path):
+        """Empty headers return None."""
+        path = tmp_path / "empty.md"
+        path.write_text("---\n---\n\nBody\n")
+        assert read_frontmatter(path) is None
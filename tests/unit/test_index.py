@@ -0,0 +1,163 @@
+"""Unit tests for the persistent frontmatter index."""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add laytonlib to path for testing
+sys.path.insert(
+    0,
+    str(Path(__file__).parent.parent.parent / "skills" / "layton" / "scripts"),
+)
+
+from laytonlib import index as index_module
+from laytonlib.frontmatter import read_frontmatter
+from laytonlib.index import scan_frontmatter
+
+
+def _backdate(path: Path, seconds: int = 60) -> None:
+    """Move a file's mtime out of the racy window."""
+    old = time.time() - seconds
+    os.utime(path, (old, old))
+
+
+@pytest.fixture(autouse=True)
+def fresh_index(monkeypatch):
+    """Each test starts without an in-memory index."""
+    monkeypatch.setattr(index_module, "_loaded", {})
+
+
+@pytest.fixture
+def counting_reader(monkeypatch):
+    """Count frontmatter reads done by the index."""
+    calls = []
+
+    def read(path):
+        calls.append(path)
+        return read_frontmatter(path)
+
+    monkeypatch.setattr(index_module, "read_frontmatter", read)
+    return calls
+
+
+def _write(directory: Path, name: str, description: str) -> Path:
+    path = directory / f"{name}.md"
+    path.write_text(f"---\nname: {name}\ndescription: {description}\n---\n\nBody\n")
+    _backdate(path)
+    return path
+
+
+class TestScanFrontmatter:
+    """Tests for scan_frontmatter."""
+
+    def test_missing_dir(self, isolated_env):
+        """Missing directory yields nothing."""
+        assert scan_frontmatter(isolated_env / "nope") == []
+
+    def test_unchanged_files_are_not_reparsed(
+        self, temp_protocols_dir, counting_reader
+    ):
+        """Second scan serves frontmatter from the index."""
+        _write(temp_protocols_dir, "alpha", "First")
+
+        first = scan_frontmatter(temp_protocols_dir)
+        index_module._loaded.clear()  # force a reload from disk
+        second = scan_frontmatter(temp_protocols_dir)
+
+        assert len(counting_reader) == 1
+        assert first == second
+        assert second[0][1]["description"] == "First"
+
+    def test_index_written_under_cache_dir(self, temp_protocols_dir):
+        """Index lives in .layton/cache/ next to a catch-all .gitignore."""
+        _write(temp_protocols_dir, "alpha", "First")
+        scan_frontmatter(temp_protocols_dir)
+
+        cache_dir = temp_protocols_dir.parent / "cache"
+        data = json.loads((cache_dir / "index.json").read_text())
+        assert data["format"] == index_module.INDEX_FORMAT
+        assert (cache_dir / ".gitignore").read_text() == "*\n"
+
+    def test_changed_file_is_reparsed(self, temp_protocols_dir, counting_reader):
+        """A size/mtime change invalidates the entry."""
+        path = _write(temp_protocols_dir, "alpha", "First")
+        scan_frontmatter(temp_protocols_dir)
+
+        path.write_text("---\nname: alpha\ndescription: Rewritten\n---\n")
+        _backdate(path, seconds=30)
+        result = scan_frontmatter(temp_protocols_dir)
+
+        assert len(counting_reader) == 2
+        assert result[0][1]["description"] == "Rewritten"
+
+    def test_deleted_file_is_pruned(self, temp_protocols_dir):
+        """Entries for removed files are dropped."""
+        _write(temp_protocols_dir, "alpha", "First")
+        beta = _write(temp_protocols_dir, "beta", "Second")
+        scan_frontmatter(temp_protocols_dir)
+
+        beta.unlink()
+        result = scan_frontmatter(temp_protocols_dir)
+
+        assert [p.name for p, _ in result] == ["alpha.md"]
+        (entries,) = index_module._loaded[
+            temp_protocols_dir.parent / "cache" / "index.json"
+        ]["dirs"].values()
+        assert list(entries) == ["alpha.md"]
+
+    def test_recently_modified_files_are_not_cached(
+        self, temp_protocols_dir, counting_reader
+    ):
+        """Files inside the racy window are parsed every time."""
+        (temp_protocols_dir / "fresh.md").write_text("---\nname: fresh\n---\n")
+
+        scan_frontmatter(temp_protocols_dir)
+        scan_frontmatter(temp_protocols_dir)
+
+        assert len(counting_reader) == 2
+
+    def test_no_vault_writes_nothing(self, tmp_path, monkeypatch):
+        """Without a .layton/ directory nothing is persisted."""
+        monkeypatch.chdir(tmp_path)
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        _write(docs, "alpha", "First")
+
+        result = scan_frontmatter(docs)
+
+        assert len(result) == 1
+        assert not (tmp_path / ".layton").exists()
+
+
+class TestBadEntries:
+    """One bad file or index entry must not break a listing."""
+
+    def test_undecodable_file_is_skipped(self, temp_rolodex_dir):
+        """A header that is not UTF-8 only drops that file."""
+        from laytonlib.rolodex import list_cards
+
+        _write(temp_rolodex_dir, "good", "Fine")
+        (temp_rolodex_dir / "bad.md").write_bytes(b"---\nname: \xff\xfe\n---\n")
+
+        assert [c.name for c in list_cards()] == ["good"]
+
+    def test_corrupt_index_entry_is_skipped(self, temp_errands_dir):
+        """A cached entry that is not a mapping only drops that errand."""
+        from laytonlib.errands import list_errands
+
+        _write(temp_errands_dir, "good", "Fine")
+        _write(temp_errands_dir, "bad", "Broken")
+        list_errands()
+
+        index_path = temp_errands_dir.parent / "cache" / "index.json"
+        data = json.loads(index_path.read_text())
+        (entries,) = data["dirs"].values()
+        entries["bad.md"][2] = ["name"]
+        index_path.write_text(json.dumps(data))
+        index_module._loaded.clear()
+
+        assert [e.name for e in list_errands()] == ["good"]
@@ -0,0 +1,90 @@
+"""Unit tests for the shipped internal-references manifest."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add laytonlib to path for testing
+sys.path.insert(
+    0,
+    str(Path(__file__).parent.parent.parent / "skills" / "layton" / "scripts"),
+)
+
+from laytonlib import manifest as manifest_module
+from laytonlib.manifest import build_manifest, load_manifest
+from laytonlib.protocols import (
+    _build_protocol,
+    _build_reference,
+    _get_skill_dir,
+    _scan_markdown_dir,
+    list_internal_examples,
+    list_internal_protocols,
+    list_internal_references,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_manifest_cache():
+    """load_manifest() is cached per process."""
+    load_manifest.cache_clear()
+    yield
+    load_manifest.cache_clear()
+
+
+class TestShippedManifest:
+    """The committed manifest must match references/."""
+
+    def test_manifest_is_current(self):
+        """Regenerate with `python -m laytonlib.manifest` if this fails."""
+        assert manifest_module.main(["--check"]) == 0
+
+    def test_manifest_loads(self):
+        """Shipped manifest is accepted at runtime."""
+        assert load_manifest() is not None
+
+    @pytest.mark.parametrize(
+        ("lister", "rel", "builder"),
+        [
+            (list_internal_protocols, "references/protocols", _build_protocol),
+            (list_internal_references, "references", _build_reference),
+            (list_internal_examples, "references/examples", _build_reference),
+        ],
+    )
+    def test_matches_live_scan(self, lister, rel, builder, isolated_env):
+        """Manifest-backed listing equals a directory scan."""
+        live = _scan_markdown_dir(_get_skill_dir() / rel, builder)
+        assert [i.to_dict() for i in lister()] == [i.to_dict() for i in live]
+
+
+class TestStaleManifest:
+    """Stale or missing manifests fall back to scanning."""
+
+    def _write(self, tmp_path, monkeypatch, **overrides):
+        data = build_manifest()
+        data.update(overrides)
+        path = tmp_path / "internal_manifest.json"
+        path.write_text(json.dumps(data))
+        monkeypatch.setattr(manifest_module, "MANIFEST_PATH", path)
+
+    def test_missing(self, tmp_path, monkeypatch):
+        """Missing manifest returns None."""
+        monkeypatch.setattr(manifest_module, "MANIFEST_PATH", tmp_path / "none.json")
+        assert load_manifest() is None
+
+    def test_version_mismatch(self, tmp_path, monkeypatch):
+        """Manifest from another release returns None."""
+        self._write(tmp_path, monkeypatch, version="0.0.0")
+        assert load_manifest() is None
+
+    def test_fingerprint_mismatch(self, tmp_path, monkeypatch):
+        """Manifest for a different file set returns None."""
+        self._write(tmp_path, monkeypatch, fingerprint="stale")
+        assert load_manifest() is None
+
+    def test_listing_falls_back_to_scan(self, tmp_path, monkeypatch, isolated_env):
+        """Listers still work without a manifest."""
+        monkeypatch.setattr(manifest_module, "MANIFEST_PATH", tmp_path / "none.json")
+        names = [p.name for p in list_internal_protocols()]
+        assert "setup" in names
@@ -0,0 +1,396 @@
+"""Unit tests for orientation sections."""
+
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add laytonlib to path for testing
+sys.path.insert(
+    0,
+    str(Path(__file__).parent.parent.parent / "skills" / "layton" / "scripts"),
+)
+
+from laytonlib.cli import main
+from laytonlib.orientation import SECTIONS, select_sections
+
+
+@pytest.fixture
+def bd_calls(monkeypatch):
+    """Record bd invocations (bd version succeeds, bd list returns [])."""
+    calls = []
+    monkeypatch.setattr(
+        shutil, "which", lambda cmd: "/usr/bin/bd" if cmd == "bd" else None
+    )
+
+    def mock_run(cmd, *args, **kwargs):
+        calls.append(list(cmd))
+
+        class Result:
+            stdout = "bd version 1.0.0" if cmd[1] == "version" else "[]"
+            stderr = ""
+            returncode = 0
+
+        return Result()
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+    return calls
+
+
+def _orient(capsys, *argv) -> dict:
+    assert main(list(argv)) == 0
+    return json.loads(capsys.readouterr().out)["data"]
+
+
+class TestSelectSections:
+    """Tests for --only / --skip resolution."""
+
+    def test_default_is_all(self):
+        assert select_sections() == list(SECTIONS)
+
+    def test_only_keeps_canonical_order(self):
+        assert select_sections(only=["queue", "checks"]) == ["checks", "queue"]
+
+    def test_skip(self):
+        assert "references" not in select_sections(skip=["references"])
+
+    def test_unknown_section(self):
+        with pytest.raises(ValueError, match="INVALID_SECTION"):
+            select_sections(only=["bogus"])
+
+
+class TestOrientationSections:
+    """Tests for lazily built orientation sections."""
+
+    def test_full_orientation(self, temp_config, bd_calls, capsys):
+        temp_config.write_text("{}")
+
+        data = _orient(capsys)
+
+        assert list(data) == [
+            "needs_setup",
+            "checks",
+            "rolodex",
+            "protocols",
+            "errands",
+            "references",
+            "examples",
+            "snapshot",
+            "next_steps",
+        ]
+        assert list(data["errands"]) == ["templates", "queue"]
+        assert sorted(c[1] for c in bd_calls) == ["list", "version"]
+
+    def test_only_queue_runs_only_bd_list(self, temp_config, bd_calls, capsys):
+        temp_config.write_text("{}")
+
+        data = _orient(capsys, "--only", "queue")
+
+        assert list(data) == ["errands", "snapshot"]
+        assert list(data["errands"]) == ["queue"]
+        assert [c[1] for c in bd_calls] == ["list"]
+
+    def test_skipped_sections_do_no_io(
+        self, temp_config, bd_calls, capsys, monkeypatch
+    ):
+        """Local sections alone spawn no bd process and read no other files."""
+        temp_config.write_text("{}")
+        import laytonlib.protocols as protocols_module
+
+        monkeypatch.setattr(
+            protocols_module,
+            "list_internal_references",
+            lambda: pytest.fail("references built despite --skip"),
+        )
+
+        data = _orient(
+            capsys,
+            "--skip",
+            "checks,queue,references,examples",
+            "--only",
+            "rolodex,references",
+        )
+
+        assert list(data) == ["rolodex", "snapshot", "next_steps"]
+        assert bd_calls == []
+
+    def test_invalid_section(self, temp_config, capsys):
+        temp_config.write_text("{}")
+
+        assert main(["--only", "nope"]) == 2
+        error = json.loads(capsys.readouterr().out)["error"]
+        assert error["code"] == "INVALID_SECTION"
+
+
+class TestStreamOrientation:
+    """Tests for --stream NDJSON orientation."""
+
+    @staticmethod
+    def _records(capsys) -> list[dict]:
+        return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    def test_local_sections_first_then_summary(self, temp_config, bd_calls, capsys):
+        temp_config.write_text("{}")
+
+        assert main(["--stream"]) == 0
+
+        records = self._records(capsys)
+        names = [r["section"] for r in records]
+        assert names[:5] == [
+            "rolodex",
+            "protocols",
+            "errands",
+            "references",
+            "examples",
+        ]
+        assert sorted(names[5:7]) == ["checks", "queue"]
+        assert names[7] == "summary"
+
+        summary = records[-1]
+        assert summary["success"] is True
+        assert set(summary["data"]["timings_ms"]) == set(SECTIONS)
+        assert (
+            "Run 'layton rolodex --discover' to find available cards"
+            in (summary["next_steps"])
+        )
+
+    def test_bd_unavailable_is_a_section_error(self, temp_config, monkeypatch, capsys):
+        """Without bd the checks record is an error; the rest still streams."""
+        temp_config.write_text("{}")
+        monkeypatch.setattr(shutil, "which", lambda cmd: None)
+
+        assert main(["--stream", "--only", "checks,rolodex,queue"]) == 2
+
+        records = {r["section"]: r for r in self._records(capsys)}
+        assert records["rolodex"]["success"] is True
+        assert records["checks"]["error"]["code"] == "BEADS_UNAVAILABLE"
+        assert records["queue"]["data"]["errands"]["queue"]["scheduled"] == []
+        assert records["summary"]["success"] is False
+
+
+class TestBudgetMs:
+    """Tests for deadline-bounded orientation with snapshot fallback."""
+
+    @pytest.fixture
+    def slow_bd_list(self, monkeypatch):
+        """bd list hangs (well past any budget) once `hang` is set."""
+        import threading
+
+        release = threading.Event()
+        state = {"hang": False, "beads": []}
+        monkeypatch.setattr(
+            shutil, "which", lambda cmd: "/usr/bin/bd" if cmd == "bd" else None
+        )
+
+        def mock_run(cmd, *args, **kwargs):
+            if cmd[1] == "list" and state["hang"]:
+                release.wait(5)
+
+            class Result:
+                stdout = (
+                    "bd version 1.0.0"
+                    if cmd[1] == "version"
+                    else json.dumps(state["beads"])
+                )
+                stderr = ""
+                returncode = 0
+
+            return Result()
+
+        monkeypatch.setattr(subprocess, "run", mock_run)
+        yield state
+        release.set()
+
+    def test_fresh_results_are_snapshotted(self, temp_config, slow_bd_list, capsys):
+        temp_config.write_text("{}")
+        slow_bd_list["beads"] = [
+            {"id": "b-1", "status": "open", "labels": ["layton", "scheduled"]}
+        ]
+
+        data = _orient(capsys, "--only", "queue", "--budget-ms", "5000")
+
+        assert "stale_sections" not in data
+        snapshot = temp_config.parent / "cache" / "orientation" / "queue.json"
+        assert json.loads(snapshot.read_text())["value"]["scheduled"][0]["id"] == "b-1"
+
+    def test_slow_bd_serves_stale_snapshot(self, temp_config, slow_bd_list, capsys):
+        import time
+
+        temp_config.write_text("{}")
+        slow_bd_list["beads"] = [
+            {"id": "b-1", "status": "open", "labels": ["layton", "scheduled"]}
+        ]
+        _orient(capsys, "--only", "queue")
+        slow_bd_list["hang"] = True
+
+        start = time.monotonic()
+        data = _orient(capsys, "--only", "queue", "--budget-ms", "50")
+
+        assert time.monotonic() - start < 2
+        assert data["errands"]["queue"]["scheduled"][0]["id"] == "b-1"
+        assert data["stale_sections"]["queue"]["stale"] is True
+        assert data["stale_sections"]["queue"]["age_s"] >= 0
+        assert "--budget-ms" in data["next_steps"][-1]
+
+    def test_failed_bd_list_keeps_snapshot(self, temp_config, slow_bd_list, capsys):
+        temp_config.write_text("{}")
+        slow_bd_list["beads"] = [
+            {"id": "b-1", "status": "open", "labels": ["layton", "scheduled"]}
+        ]
+        _orient(capsys, "--only", "queue")
+        slow_bd_list["beads"] = "not a bead list"
+
+        _orient(capsys, "--only", "queue")
+        slow_bd_list["hang"] = True
+        data = _orient(capsys, "--only", "queue", "--budget-ms", "50")
+
+        assert data["errands"]["queue"]["scheduled"][0]["id"] == "b-1"
+
+    def test_slow_bd_without_snapshot(self, temp_config, slow_bd_list, capsys):
+        temp_config.write_text("{}")
+        slow_bd_list["hang"] = True
+
+        data = _orient(capsys, "--only", "queue", "--budget-ms", "50")
+
+        assert data["errands"]["queue"]["scheduled"] == []
+        assert data["stale_sections"] == {"queue": {"stale": True, "age_s": None}}
+
+    def test_stream_marks_stale_record(self, temp_config, slow_bd_list, capsys):
+        temp_config.write_text("{}")
+        slow_bd_list["hang"] = True
+
+        assert main(["--stream", "--only", "rolodex,queue", "--budget-ms", "50"]) == 0
+
+        records = {
+            r["section"]: r
+            for r in map(json.loads, capsys.readouterr().out.splitlines())
+        }
+        assert "stale" not in records["rolodex"]
+        assert records["queue"]["stale"] is True
+
+
+class TestSince:
+    """Tests for incremental orientation with snapshot tokens."""
+
+    def test_unchanged_orientation_has_no_changes(self, temp_config, bd_calls, capsys):
+        temp_config.write_text("{}")
+        first = _orient(capsys)
+
+        data = _orient(capsys, "--since", first["snapshot"])
+
+        assert data["changes"] == {}
+        assert data["since"] == first["snapshot"]
+        assert data["snapshot"] == first["snapshot"]
+        assert "rolodex" not in data
+        assert "protocols" not in data
+        assert "checks" in data
+
+    def test_added_changed_and_removed_items(self, temp_config, bd_calls, capsys):
+        temp_config.write_text("{}")
+        rolodex_dir = temp_config.parent / "rolodex"
+        rolodex_dir.mkdir()
+        (rolodex_dir / "gmail.md").write_text(
+            "---\nname: gmail\ndescription: Mail\n---\n"
+        )
+        (rolodex_dir / "jira.md").write_text(
+            "---\nname: jira\ndescription: Issues\n---\n"
+        )
+        token = _orient(capsys, "--only", "rolodex")["snapshot"]
+
+        (rolodex_dir / "gmail.md").write_text(
+            "---\nname: gmail\ndescription: Email and more\n---\n"
+        )
+        (rolodex_dir / "jira.md").unlink()
+        (rolodex_dir / "slack.md").write_text(
+            "---\nname: slack\ndescription: Chat\n---\n"
+        )
+
+        data = _orient(capsys, "--only", "rolodex", "--since", token)
+
+        assert data["changes"] == {
+            "rolodex": {
+                "added": [{"name": "slack", "description": "Chat"}],
+                "removed": ["jira"],
+                "changed": [{"name": "gmail", "description": "Email and more"}],
+            }
+        }
+        assert data["snapshot"] != token
+
+    def test_unknown_token_returns_full_orientation(
+        self, temp_config, bd_calls, capsys
+    ):
+        temp_config.write_text("{}")
+
+        data = _orient(capsys, "--only", "rolodex", "--since", "../../etc/passwd")
+
+        assert "rolodex" in data
+        assert "changes" not in data
+        assert "not found" in data["next_steps"][-1]
+
+
+class TestSinceWithBudget:
+    """Snapshots and --since diffs cover the full queue, not the budgeted one."""
+
+    @pytest.fixture
+    def queue(self, monkeypatch):
+        """bd list returns the scheduled beads in the returned list."""
+        beads = [
+            {
+                "id": f"bd-{i}",
+                "title": f"Task {i}",
+                "status": "open",
+                "labels": ["layton", "scheduled"],
+            }
+            for i in range(5)
+        ]
+        monkeypatch.setattr(
+            shutil, "which", lambda cmd: "/usr/bin/bd" if cmd == "bd" else None
+        )
+
+        def mock_run(cmd, *args, **kwargs):
+            class Result:
+                stdout = json.dumps(beads)
+                stderr = ""
+                returncode = 0
+
+            return Result()
+
+        monkeypatch.setattr(subprocess, "run", mock_run)
+        return beads
+
+    def test_max_items_does_not_remove_beads(self, temp_config, queue, capsys):
+        temp_config.write_text("{}")
+        token = _orient(capsys, "--only", "queue", "--max-items", "2")["snapshot"]
+        assert token == _orient(capsys, "--only", "queue")["snapshot"]
+
+        queue[4] = {**queue[4], "title": "Renamed"}
+        queue.append({**queue[0], "id": "bd-5"})
+        data = _orient(capsys, "--only", "queue", "--since", token, "--max-items", "1")
+
+        scheduled = data["changes"]["errands.queue.scheduled"]
+        assert scheduled["removed"] == []
+        assert [b["id"] for b in scheduled["added"]] == ["bd-5"]
+        assert [b["id"] for b in scheduled["changed"]] == ["bd-4"]
+        assert scheduled["truncated"] == {"added": 0, "changed": 0}
+
+    def test_fields_does_not_change_beads(self, temp_config, queue, capsys):
+        temp_config.write_text("{}")
+        token = _orient(capsys, "--only", "queue")["snapshot"]
+
+        data = _orient(capsys, "--only", "queue", "--since", token, "--fields", "id")
+        assert data["changes"] == {}
+
+        queue.append({**queue[0], "id": "bd-5"})
+        data = _orient(capsys, "--only", "queue", "--since", token, "--fields", "id")
+        assert data["changes"]["errands.queue.scheduled"]["added"] == [{"id": "bd-5"}]
+
+    def test_budget_still_applies_without_since(self, temp_config, queue, capsys):
+        temp_config.write_text("{}")
+
+        data = _orient(capsys, "--only", "queue", "--max-items", "2")
+
+        assert len(data["errands"]["queue"]["scheduled"]) == 2
+        assert data["errands"]["queue"]["truncated"]["scheduled"] == 3
@@ -0,0 +1,78 @@
+"""Unit tests for LAYTON_PROFILE profiling hooks."""
+
+import pstats
+import sys
+from pathlib import Path
+
+# Add laytonlib to path for testing
+sys.path.insert(
+    0,
+    str(Path(__file__).parent.parent.parent / "skills" / "layton" / "scripts"),
+)
+
+from laytonlib.profiling import profile_label, run_profiled
+
+
+def _fake_main(argv):
+    _ = [str(i) for i in range(1000)]
+    return 3
+
+
+class TestProfileLabel:
+    """Tests for profile file naming."""
+
+    def test_command_and_subcommand(self):
+        assert profile_label(["errands", "prompt", "bd-12"]) == "errands-prompt"
+
+    def test_no_command_is_orientation(self):
+        assert profile_label(["--human"]) == "orientation"
+
+    def test_invalid_args(self):
+        assert profile_label(["--max-items", "many"]) == "layton"
+
+
+class TestRunProfiled:
+    """Tests for run_profiled()."""
+
+    def test_cpu_writes_pstats(self, isolated_env, monkeypatch):
+        monkeypatch.setenv("LAYTON_PROFILE", "cpu")
+        assert run_profiled(_fake_main, ["doctor"]) == 3
+
+        profiles = isolated_env / ".layton" / "profiles"
+        (path,) = profiles.glob("doctor-*.pstats")
+        assert pstats.Stats(str(path)).total_calls > 0
+        assert (profiles / ".gitignore").read_text() == "*\n"
+
+    def test_mem_writes_report(self, isolated_env, monkeypatch):
+        monkeypatch.setenv("LAYTON_PROFILE", "mem")
+        assert run_profiled(_fake_main, ["rolodex", "add", "x"]) == 3
+
+        (path,) = (isolated_env / ".layton" / "profiles").glob("rolodex-add-*.txt")
+        assert "Peak traced memory" in path.read_text()
+
+    def test_unknown_mode_runs_unprofiled(self, isolated_env, monkeypatch, capsys):
+        monkeypatch.setenv("LAYTON_PROFILE", "gpu")
+        assert run_profiled(_fake_main, []) == 3
+        assert "ignoring" in capsys.readouterr().err
+        assert not (isolated_env / ".layton" / "profiles").exists()
+
+    def test_unwritable_profiles_dir(self, isolated_env, monkeypatch, capsys):
+        """A profile that can't be written only warns; the exit code stands."""
+        monkeypatch.setenv("LAYTON_PROFILE", "cpu")
+        # A file where the directory should be makes mkdir() fail
+        (isolated_env / ".layton" / "profiles").write_text("")
+
+        assert run_profiled(_fake_main, ["doctor"]) == 3
+        assert "could not write cpu profile" in capsys.readouterr().err
+
+    def test_same_second_runs_do_not_collide(self, isolated_env, monkeypatch):
+        monkeypatch.setenv("LAYTON_PROFILE", "mem")
+        monkeypatch.setattr("time.strftime", lambda fmt: "20260101-000000")
+        pids = iter([100, 101])
+        monkeypatch.setattr("os.getpid", lambda: next(pids))
+
+        run_profiled(_fake_main, ["doctor"])
+        run_profiled(_fake_main, ["doctor"])
+
+        profiles = isolated_env / ".layton" / "profiles"
+        assert len(list(profiles.glob("doctor-*.txt"))) == 2
@@ -0,0 +1,136 @@
+"""Unit tests for span timings (--timings)."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add laytonlib to path for testing
+sys.path.insert(
+    0,
+    str(Path(__file__).parent.parent.parent / "skills" / "layton" / "scripts"),
+)
+
+from laytonlib import timing
+from laytonlib.bd import run_bd
+from laytonlib.cli import main
+
+
+@pytest.fixture(autouse=True)
+def _reset_timing():
+    yield
+    timing.stop()
+
+
+class TestSpans:
+    """Tests for span() and timed()."""
+
+    def test_noop_when_disabled(self):
+        with timing.span("scan") as attrs:
+            attrs["x"] = 1
+        assert timing.report() is None
+
+    def test_records_when_enabled(self):
+        timing.start()
+        with timing.span("scan", dir="/tmp") as attrs:
+            attrs["files"] = 3
+
+        spans = timing.report()["spans"]
+        assert len(spans) == 1
+        assert spans[0]["name"] == "scan"
+        assert spans[0]["dir"] == "/tmp"
+        assert spans[0]["files"] == 3
+        assert spans[0]["ms"] >= 0
+
+    def test_timed_decorator(self):
+        @timing.timed()
+        def work():
+            return 42
+
+        timing.start()
+        assert work() == 42
+        assert [s["name"] for s in timing.report()["spans"]] == ["work"]
+
+    def test_start_discards_previous_spans(self):
+        timing.start()
+        with timing.span("old"):
+            pass
+        timing.start()
+        assert timing.report()["spans"] == []
+
+
+class TestRunBd:
+    """Tests for the bd subprocess wrapper."""
+
+    def test_records_argv_and_exit_code(self, monkeypatch):
+        def mock_run(cmd, *args, **kwargs):
+            raise subprocess.CalledProcessError(1, cmd)
+
+        monkeypatch.setattr(subprocess, "run", mock_run)
+        timing.start()
+        with pytest.raises(subprocess.CalledProcessError):
+            run_bd(["list", "--json"])
+
+        (span,) = timing.report()["spans"]
+        assert span["name"] == "bd"
+        assert span["argv"] == ["bd", "list", "--json"]
+        assert span["exit_code"] == 1
+
+
+class TestCompileErrand:
+    """Tests for the compile_errand span."""
+
+    def test_records_span(self, temp_errands_dir, monkeypatch):
+        from laytonlib import errands as errands_module
+
+        monkeypatch.setattr(errands_module, "_compiled", {})
+        (temp_errands_dir / "review.md").write_text("---\nname: review\n---\n\nHi\n")
+        timing.start()
+
+        errands_module.compile_errand("review")
+
+        names = [s["name"] for s in timing.report()["spans"]]
+        assert names[0] == "compile_errand"
+
+
+class TestTimingsFlag:
+    """Tests for --verbose --timings output."""
+
+    def test_debug_timings(self, temp_config, capsys):
+        assert main(["--verbose", "--timings", "config", "init"]) == 0
+        output = json.loads(capsys.readouterr().out)
+
+        timings = output["debug"]["timings"]
+        names = [s["name"] for s in timings["spans"]]
+        assert "vault" in names
+        assert "serialize" in names
+        assert timings["total_ms"] >= 0
+
+    def test_response_is_encoded_once(self, temp_config, capsys, monkeypatch):
+        """The serialize span times the real encode, not a second one."""
+        from laytonlib import formatters
+
+        calls = []
+        real_encode = formatters.encode_response
+        monkeypatch.setattr(
+            formatters,
+            "encode_response",
+            lambda response, fmt="json": (
+                calls.append(fmt) or real_encode(response, fmt)
+            ),
+        )
+
+        assert main(["--verbose", "--timings", "config", "init"]) == 0
+        output = json.loads(capsys.readouterr().out)
+
+        assert calls == ["json"]
+        assert output["success"] is True
+        assert output["debug"]["timings"]["spans"][-1]["name"] == "serialize"
+
+    def test_no_timings_without_flag(self, temp_config, capsys):
+        assert main(["--verbose", "config", "init"]) == 0
+        output = json.loads(capsys.readouterr().out)
+        assert "timings" not in output.get("debug", {})
+        assert not timing.enabled()